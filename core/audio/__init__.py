@@ -1,3 +1,31 @@
 #File:  src/core/audio/__init__.py © 2025 projectemergence. All rights reserved.
 #File:  src/core/__init__.py © 2024 projectemergence. All rights reserved.
 # This file can be left empty, or you can use it to perform package-level initialization if needed.
+
+SERVER = None    # process-wide pyo Server, see shared_server()
+_SERVER_USERS = 0   # shared_server() calls not yet matched by release_server()
+
+def shared_server(sample_rate=44_100, buffersize=1024):
+    """
+    Return the process-wide pyo Server, booted and started on the first
+    call. Every caller holds a reference and must hand it back to
+    release_server(); the server is shut down when the last one does.
+    """
+    global SERVER, _SERVER_USERS
+    if SERVER is None:
+        from pyo import Server
+        SERVER = Server(sr=sample_rate, buffersize=buffersize, nchnls=2).boot().start()
+    _SERVER_USERS += 1
+    return SERVER
+
+def release_server(server):
+    """Drop one reference to the shared `server`; stop and shut it down with the last one."""
+    global SERVER, _SERVER_USERS
+    if server is not SERVER:
+        return
+    _SERVER_USERS -= 1
+    if _SERVER_USERS > 0:
+        return
+    server.stop()
+    server.shutdown()
+    SERVER, _SERVER_USERS = None, 0
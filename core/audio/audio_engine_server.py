@@ -6,11 +6,12 @@ import time
 import tempfile
 import logging
 from typing import Any, Dict,Literal
+from core.audio import shared_server, release_server
 from core.audio.audio_presets_registry import registry
-from core.audio.presets.base_preset               import BasePreset
+from core.audio.presets.base_preset               import BasePreset, Chain
 
 import pyttsx3
-from pyo import Server, SfPlayer
+from pyo import SfPlayer
 import pyo.lib._core as _pc
 
 logger = logging.getLogger(__name__)
@@ -75,7 +76,7 @@ class AudioEngine:
         logger.info("pyttsx3 TTS ready")
 
         # ─── Pyo server ───────────────────────────────────────────────────────
-        self.server = Server(sr=sample_rate, buffersize=buffersize, nchnls=2).boot().start()
+        self.server = shared_server(sample_rate, buffersize)
         logger.info(f"pyo server up (sr={sample_rate}, bs={buffersize})")
 
         # ─── Central PresetRegistry ───────────────────────────────────────────
@@ -125,8 +126,8 @@ class AudioEngine:
                         logger.debug("'%s' still playing. Keeping.", name)
                     break
             else:
-                # 3) dictionary of components
-                if isinstance(inst, dict):
+                # 3) dictionary / Chain of components
+                if isinstance(inst, (dict, Chain)):
                     playing = False
                     for obj in inst.values():
                         for method in ("isPlaying", "getIsPlaying"):
@@ -194,8 +195,7 @@ class AudioEngine:
             except Exception as e:
                 logger.error("Error during cleanup shutdown: %s", e)
 
-        self.server.stop()
-        self.server.shutdown()
+        release_server(self.server)
         logger.info("server shut down")
 
     async def _handle(self, cmd: Dict[str, Any]) -> None:
@@ -0,0 +1,75 @@
+# File: src/core/audio/presets/_dsp.py © 2025 projectemergence. All rights reserved.
+# Shared DSP helpers for the presets (underscore-prefixed so the registry skips it).
+
+from functools import lru_cache
+from math import cos, pi, sin
+
+import numpy as np
+
+# pyo Biquad filter types
+LOWPASS, HIGHPASS, BANDPASS, BANDSTOP, ALLPASS = range(5)
+
+
+def server_sr() -> int:
+    """Sampling rate of the running pyo server (pyo default if none is booted)."""
+    from pyo import secToSamps
+    try:
+        return int(secToSamps(1.0))
+    except Exception:
+        return 44100
+
+
+@lru_cache(maxsize=256)
+def biquad_coeffs(ftype: int, f: float, q: float, sr: int) -> tuple:
+    """
+    Normalized (b0, b1, b2, a1, a2) for a pyo Biquad of the given type,
+    using the same RBJ cookbook formulas as pyo's C implementation.
+    """
+    w0 = 2 * pi * min(max(f, 1.0), sr * 0.5 - 1) / sr
+    c = cos(w0)
+    alpha = sin(w0) / (2 * max(q, 0.1))
+    if ftype == LOWPASS:
+        b0, b1, b2 = (1 - c) / 2, 1 - c, (1 - c) / 2
+    elif ftype == HIGHPASS:
+        b0, b1, b2 = (1 + c) / 2, -(1 + c), (1 + c) / 2
+    elif ftype == BANDPASS:
+        b0, b1, b2 = alpha, 0.0, -alpha
+    elif ftype == BANDSTOP:
+        b0, b1, b2 = 1.0, -2 * c, 1.0
+    elif ftype == ALLPASS:
+        b0, b1, b2 = 1 - alpha, -2 * c, 1 + alpha
+    else:
+        raise ValueError(f"unknown biquad type {ftype!r}")
+    a0 = 1 + alpha
+    return b0 / a0, b1 / a0, b2 / a0, (-2 * c) / a0, (1 - alpha) / a0
+
+
+def table_from_array(buf):
+    """DataTable holding a copy of a 1-D float array (written in place, no list round-trip)."""
+    from pyo import DataTable
+    table = DataTable(size=len(buf))
+    np.asarray(table.getBuffer())[:] = buf
+    return table
+
+
+def envelope(fadein: float, fadeout: float, n: int, sr: int) -> np.ndarray:
+    """Unit-height attack/hold/release shape matching pyo's Fader, n samples long."""
+    ni = min(int(fadein * sr), n)
+    no = min(int(fadeout * sr), n - ni)
+    buf = np.ones(n, dtype=np.float32)
+    buf[:ni] = np.linspace(0.0, 1.0, ni, endpoint=False)
+    buf[n - no:] = np.linspace(1.0, 0.0, no)
+    return buf
+
+
+@lru_cache(maxsize=128)
+def envelope_table(fadein: float, fadeout: float, dur: float, sr: int):
+    """envelope() rendered once per (fadein, fadeout, dur) and shared by every preset."""
+    return table_from_array(envelope(fadein, fadeout, max(int(dur * sr), 2), sr))
+
+
+def biquad(sig, coeffs, mul=1):
+    """Biquada fed precomputed coefficients from biquad_coeffs()."""
+    from pyo import Biquada
+    b0, b1, b2, a1, a2 = coeffs
+    return Biquada(sig, b0=b0, b1=b1, b2=b2, a0=1.0, a1=a1, a2=a2, mul=mul)
@@ -3,15 +3,72 @@
 
 from abc import ABC, abstractmethod
 import time
-from pyo import (Fader, Pan, SigTo, Freeverb, Chorus, ButLP, Sine)
 import inspect
+import functools
+import weakref
+from collections import OrderedDict, deque
+from dataclasses import fields
 from typing import ClassVar, Dict, Type, Any
+from core.audio.presets._dsp import envelope_table, server_sr
+
+class Chain:
+    """
+    Base for the per-preset ``@dataclass(slots=True)`` node holders.
+    ``values()`` mirrors ``dict.values()`` so callers that walked the old
+    ``self.chain`` dicts keep working.
+    """
+    __slots__ = ("__weakref__",    # shared_graph caches chains weakly
+                 "_busy_until")    # time.monotonic() a shared chain finishes sounding
+
+    def values(self):
+        return [getattr(self, f.name) for f in fields(self)]
+
+def _freeze(value):
+    return tuple(value) if isinstance(value, list) else value
+
+def _param_key(preset, exclude=()):
+    """Hashable snapshot of a preset's public parameters (TypeError if not hashable)."""
+    key = tuple(sorted(
+        (k, _freeze(v)) for k, v in vars(preset).items()
+        if not k.startswith('_') and k != 'chain' and k not in exclude
+    ))
+    hash(key)
+    return key
+
+def shared_graph(build):
+    """
+    Class-level memo for deterministic ``_build()``s that return a Chain:
+    plays with identical public parameters reuse the live graph instead of
+    allocating a new one. While the shared graph is still sounding an
+    overlapping play builds its own, so it does not cut the earlier note
+    off. Entries vanish once nothing else holds the chain.
+    Do not use on presets with random elements.
+    """
+    @functools.wraps(build)
+    def wrapper(self):
+        try:
+            key = _param_key(self)
+        except TypeError:
+            return build(self)
+        cache = type(self)._shared_graphs
+        now = time.monotonic()
+        chain = cache.get(key)
+        if chain is None:
+            chain = cache[key] = build(self)
+        elif getattr(chain, "_busy_until", 0) > now:
+            return build(self)
+        chain._busy_until = now + (self.duration or float("inf"))
+        self.chain = chain
+        return chain
+    return wrapper
 
 class PresetMeta(type):
     _registry: ClassVar[Dict[str, Type['BasePreset']]] = {}
 
     def __init__(cls, name: str, bases: tuple, namespace: dict[str, Any]):
         super().__init__(name, bases, namespace)
+        cls._shared_graphs = weakref.WeakValueDictionary()
+        cls._voice_pools = OrderedDict()   # param key -> deque of chains
         # skip the abstract BasePreset itself
         if bases and BasePreset in bases:
             mod_name = cls.__module__.split('.')[-1]
@@ -20,6 +77,17 @@ class PresetMeta(type):
 class BasePreset(metaclass=PresetMeta):
 
     supports_melody: bool = True
+
+    VOICE_POOL_SIZE = 8      # voices per parameter set, see _pooled_chain()
+    VOICE_POOL_KEYS = 16     # parameter sets kept per preset class
+
+    # application-wide reverb send/return, built on first use
+    _reverb_bus    = None   # Mixer every send feeds into
+    _reverb_return = None   # the one wet-only Freeverb on that bus
+    _reverb_sends: ClassVar[OrderedDict] = OrderedDict()   # send key -> pending CallAfter removal or None, oldest first
+    REVERB_SENDS_MAX = 32   # live sends on the bus; the oldest is dropped past this
+    _noise         = None   # one free-running white noise for every noise voice
+
     def __init__(
         self,
         intensity: float | list[float]       = 0.7,
@@ -66,21 +134,108 @@ class BasePreset(metaclass=PresetMeta):
         self.tempo         = tempo # Store tempo
         # ───────────────────────────────────────────────────────────────
 
-    def _env(self, fade=.005) -> Fader:
-        dur = self.duration or 0
-        return Fader(fadein=fade, fadeout=fade*4, dur=dur, mul=self.intensity)
+    def _env(self, fade=.005):
+        return self._table_env(fadein=fade, fadeout=fade*4,
+                               dur=self.duration or 0, mul=self.intensity)
+
+    def _table_env(self, fadein, fadeout, dur, mul=1):
+        """
+        Stand-in for Fader(...): reads a cached envelope table instead of
+        ramping per sample. Like a Fader it is created stopped and sounds
+        from the start on each play(). Unbounded envelopes (dur 0/None)
+        still need a real Fader to hold until stop().
+        """
+        if not dur:
+            from pyo import Fader
+            return Fader(fadein=fadein, fadeout=fadeout, dur=0, mul=mul)
+        from pyo import TableRead
+        table = envelope_table(fadein, fadeout, dur, server_sr())
+        return TableRead(table, freq=table.getRate(), loop=0, mul=mul).stop()
 
-    def _fx_chain(self, sig):
+    def _reverb_send(self, sig, level, hold=None):
+        """
+        Feed `sig` into the shared reverb return at `level` instead of
+        building a Freeverb per preset. The send is dropped `hold` seconds
+        later; unbounded ones (hold 0/None, e.g. endless drones) stay until
+        REVERB_SENDS_MAX newer sends push them off the bus.
+        """
+        from pyo import CallAfter, Freeverb, Mixer
+        cls = BasePreset
+        if cls._reverb_bus is None:
+            cls._reverb_bus = Mixer(outs=1, chnls=2)
+            cls._reverb_return = Freeverb(cls._reverb_bus[0], size=.8, bal=1.).out()
+        key = id(sig)
+        cls._reverb_bus.addInput(key, sig)
+        cls._reverb_bus.setAmp(key, 0, level)
+        pending = cls._reverb_sends.pop(key, None)
+        if pending is not None:
+            pending.stop()
+        cls._reverb_sends[key] = CallAfter(cls._drop_reverb_send, hold, key) if hold else None
+        while len(cls._reverb_sends) > cls.REVERB_SENDS_MAX:
+            oldest, pending = cls._reverb_sends.popitem(last=False)
+            if pending is not None:
+                pending.stop()
+            cls._reverb_bus.delInput(oldest)
+
+    @staticmethod
+    def _drop_reverb_send(key):
+        if BasePreset._reverb_sends.pop(key, False) is not False:
+            BasePreset._reverb_bus.delInput(key)
+
+    @staticmethod
+    def _shared_noise():
+        """
+        The application-wide Noise source. Voices scale it on their own
+        filter's mul instead of each running a Noise generator.
+        """
+        if BasePreset._noise is None:
+            from pyo import Noise
+            BasePreset._noise = Noise()
+        return BasePreset._noise
+
+    def _fx_chain(self, sig, hold=None):
+        from pyo import Pan, Chorus, ButLP
         if self.enable_filter:
             sig = ButLP(sig, freq=self.filt_freq)
         if self.enable_chorus and self.stereo_w:
             sig = Chorus(sig, depth=.8*self.stereo_w, feedback=.25, bal=.5)
         if self.enable_reverb:
-            sig = Freeverb(sig, size=.8, bal=.35)
+            self._reverb_send(sig, .35, self.duration if hold is None else hold)
+            sig = sig * .65
         if self._pan_pos or self.stereo_w:
             sig = Pan(sig, outs=2, pan=self._pan_pos)
         return sig
 
+    def _pooled_chain(self, exclude=()):
+        """
+        Class-level voice pool for fast-retriggered one-shots: the first
+        VOICE_POOL_SIZE plays with the same public parameters build a chain,
+        later plays steal the oldest one round-robin, so steady state
+        allocates nothing. Changed parameters select another pool on the
+        next play(). Parameters in `exclude` do not split the pool; play()
+        must re-apply them.
+        """
+        pools = type(self)._voice_pools
+        try:
+            key = _param_key(self, exclude)
+        except TypeError:
+            self._build()
+            return self.chain
+        pool = pools.get(key)
+        if pool is None:
+            pool = pools[key] = deque()
+            if len(pools) > self.VOICE_POOL_KEYS:
+                pools.popitem(last=False)
+        else:
+            pools.move_to_end(key)
+        if len(pool) < self.VOICE_POOL_SIZE:
+            self._build()
+            pool.append(self.chain)
+        else:
+            pool.rotate(-1)
+            self.chain = pool[-1]
+        return self.chain
+
     def _keep(self, *objs):
         self._keep_alive.extend(objs)
         return objs[0] if objs else None
@@ -94,6 +249,7 @@ class BasePreset(metaclass=PresetMeta):
         """
 
     def play(self):
+        from pyo import Fader, Sine
         # ─── if a melody was passed in, override build() ────────────
         if self.notes and self.durations:
             seq = []
@@ -113,7 +269,7 @@ class BasePreset(metaclass=PresetMeta):
                 env = Fader(fadein=0.005, fadeout=0.02, dur=duration_in_seconds, mul=i)
                 osc = Sine(freq=f, mul=env)
                 env.play(delay=offset)
-                out = self._fx_chain(osc)
+                out = self._fx_chain(osc, hold=offset + duration_in_seconds)
                 self._keep(out).out(delay=offset)
                 seq.append((env, osc))
                 offset += duration_in_seconds
@@ -1,8 +1,14 @@
 # File: src/core/audio/presets/bass.py © 2025 projectemergence. All rights reserved.
 # Defines the Bass preset, with optional distortion. _build() added for architecture support.
 
-from pyo import Sine, Fader, Disto
-from core.audio.presets.base_preset import BasePreset
+from dataclasses import dataclass
+from core.audio.presets.base_preset import BasePreset, Chain, shared_graph
+
+@dataclass(slots=True)
+class BassChain(Chain):
+    fader: object
+    tone: object
+    distorted: object
 
 class Bass(BasePreset):
     def __init__(
@@ -36,9 +42,11 @@ class Bass(BasePreset):
         self.dist_slope = dist_slope
         self.dist_mul_factor = dist_mul_factor
 
+    @shared_graph
     def _build(self):
+        from pyo import Sine, Disto
         # use named attributes everywhere instead of literals
-        fader = Fader(
+        fader = self._table_env(
             fadein=self.fade_in,
             fadeout=self.fade_out,
             dur=self.duration, # duration is now correctly passed from super
@@ -54,11 +62,11 @@ class Bass(BasePreset):
             slope=self.dist_slope,
             mul=self.intensity * self.dist_mul_factor
         )
-        self.chain = {"fader": fader, "tone": tone, "distorted": distorted}
+        self.chain = BassChain(fader=fader, tone=tone, distorted=distorted)
         return self.chain
 
     def play(self):
         chain = self._build()
-        chain["fader"].play()
-        chain["distorted"].out()
+        chain.fader.play()
+        chain.distorted.out()
         return chain
@@ -11,8 +11,8 @@ BigKick 2.0 – modern electronic kick
 • antialias filtering around waveshaper
 """
 
-from pyo import Sine, Noise, ButBP, ButHP, Fader, Clip, Biquad, Gate
 from core.audio.presets.base_preset import BasePreset
+from core.audio.presets._dsp import biquad, biquad_coeffs, server_sr
 
 class BigKick(BasePreset):
     def __init__(
@@ -46,48 +46,54 @@ class BigKick(BasePreset):
     ):
         kw.setdefault('stereo_w', 0.0)
         kw.setdefault('enable_reverb', False)
-        super().__init__(intensity=0.68,
-                         duration=0.6,
-                         freq1=160,
-                         freq2=45,
+        super().__init__(intensity=intensity,
+                         duration=duration,
+                         freq1=freq1,
+                         freq2=freq2,
                          **kw)
 
         # click parameters
-        self.click_len = 0.015
-        self.click_freq = 5000
+        self.click_len = click_len
+        self.click_freq = click_freq
 
         # behavior flags
-        self.add_sub = True
-        self.soft_clip = True
-        self.gate_thresh = 0.001
+        self.add_sub = add_sub
+        self.soft_clip = soft_clip
+        self.gate_thresh = gate_thresh
 
         # body envelope / sweep
-        self.body_env_fadein = 0.002
-        self.body_sweep_ratio = 0.89
+        self.body_env_fadein = body_env_fadein
+        self.body_sweep_ratio = body_sweep_ratio
 
         # click envelope
-        self.click_env_fadein = 0.0005
-        self.click_env_fadeout_ratio = 0.7
-        self.click_mul_factor = 0.35
-        self.click_bp_q = 10.0
+        self.click_env_fadein = click_env_fadein
+        self.click_env_fadeout_ratio = click_env_fadeout_ratio
+        self.click_mul_factor = click_mul_factor
+        self.click_bp_q = click_bp_q
 
         # sub oscillator
-        self.sub_freq_ratio = 0.5
-        self.sub_mul_factor = 0.5
+        self.sub_freq_ratio = sub_freq_ratio
+        self.sub_mul_factor = sub_mul_factor
 
         # soft-clip / antialias filter
-        self.lpf_freq = 20000.0
-        self.lpf_q = 0.707
-        self.lpf_type = 1
-        self.clip_min = -0.9
-        self.clip_max = 0.9
+        self.lpf_freq = lpf_freq
+        self.lpf_q = lpf_q
+        self.lpf_type = lpf_type
+        self.clip_min = clip_min
+        self.clip_max = clip_max
 
         # final high-pass filter
-        self.hpf_freq = 20.0
-        self.hpf_q = 0.707
-        self.hpf_type = 2
+        self.hpf_freq = hpf_freq
+        self.hpf_q = hpf_q
+        self.hpf_type = hpf_type
+
+        # filter coefficients are fixed per instance; cached across instances
+        sr = server_sr()
+        self._lpf_coef = biquad_coeffs(self.lpf_type, self.lpf_freq, self.lpf_q, sr)
+        self._hpf_coef = biquad_coeffs(self.hpf_type, self.hpf_freq, self.hpf_q, sr)
 
     def _make_body(self, env):
+        from pyo import Sine
         # exponential sweep for psycho-acoustic punch
         glide = self._sweep(
             self.freq1,
@@ -98,7 +104,8 @@ class BigKick(BasePreset):
         return Sine(freq=glide, mul=env)
 
     def _make_click(self):
-        env = Fader(
+        from pyo import Noise, ButBP
+        env = self._table_env(
             fadein=self.click_env_fadein,
             fadeout=self.click_len * self.click_env_fadeout_ratio,
             dur=self.click_len,
@@ -108,10 +115,12 @@ class BigKick(BasePreset):
         return ButBP(noise, freq=self.click_freq, q=self.click_bp_q)
 
     def _make_sub(self, env):
+        from pyo import Sine
         sub_freq = max(self.freq2 * self.sub_freq_ratio, 20.0)
         return Sine(freq=sub_freq, mul=env * self.sub_mul_factor)
 
     def _build(self):
+        from pyo import Clip, Gate, Mix
         # body envelope
         body_env = self._env(self.body_env_fadein)
 
@@ -123,25 +132,15 @@ class BigKick(BasePreset):
         if self.add_sub:
             parts.append(self._make_sub(body_env))
 
-        mix = sum(parts)
+        mix = Mix(parts, voices=1)
 
         if self.soft_clip:
             # antialias LPF before clipping
-            mix = Biquad(
-                mix,
-                freq=self.lpf_freq,
-                q=self.lpf_q,
-                type=self.lpf_type
-            )
+            mix = biquad(mix, self._lpf_coef)
             mix = Clip(mix, min=self.clip_min, max=self.clip_max)
 
         # gate to remove residual noise
         gated = Gate(mix, thresh=self.gate_thresh)
 
         # high-pass to remove subsonic rumble
-        return Biquad(
-            gated,
-            freq=self.hpf_freq,
-            q=self.hpf_q,
-            type=self.hpf_type
-        )
+        return biquad(gated, self._hpf_coef)
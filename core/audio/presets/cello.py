@@ -1,8 +1,15 @@
 # File: src/core/audio/presets/cello.py © 2025 projectemergence. All rights reserved.
 # Defines a resonant cello tone. _build() added for architecture support.
 
-from pyo import Sine, Fader, Freeverb
-from core.audio.presets.base_preset import BasePreset
+from dataclasses import dataclass
+from core.audio.presets.base_preset import BasePreset, Chain, shared_graph
+
+@dataclass(slots=True)
+class CelloChain(Chain):
+    fader: object
+    tone: object
+    send: object
+    dry: object
 
 class Cello(BasePreset):
     def __init__(
@@ -25,22 +32,24 @@ class Cello(BasePreset):
         self.base_freq = 20.0 * freq_multiplier
 
         # fader settings
-        self.fade_in = 0.2
-        self.fade_out = 4.29
-        self.dur_multiplier = 2.08
-        self.fader_mul_factor = 0.95
+        self.fade_in = fade_in
+        self.fade_out = fade_out
+        self.dur_multiplier = dur_multiplier
+        self.fader_mul_factor = fader_mul_factor
 
         # tone settings
-        self.tone_mul_factor = 2.0
+        self.tone_mul_factor = tone_mul_factor
 
         # reverb settings
-        self.reverb_input_div = 2.0
-        self.reverb_size = 0.76
-        self.reverb_bal = 0.93
+        self.reverb_input_div = reverb_input_div
+        self.reverb_size = reverb_size
+        self.reverb_bal = reverb_bal
 
+    @shared_graph
     def _build(self):
+        from pyo import Sine
         # amplitude envelope
-        fader = Fader(
+        fader = self._table_env(
             fadein=self.fade_in,
             fadeout=self.fade_out,
             dur=self.duration * self.dur_multiplier,
@@ -51,17 +60,16 @@ class Cello(BasePreset):
             freq=self.base_freq,
             mul=fader * self.tone_mul_factor
         )
-        # reverb effect
-        reverb = Freeverb(
-            tone / self.reverb_input_div,
-            size=self.reverb_size,
-            bal=self.reverb_bal
-        )
-        self.chain = {"fader": fader, "tone": tone, "reverb": reverb}
+        # reverb effect: wet goes to the shared reverb bus, dry out directly
+        send = tone / self.reverb_input_div
+        dry = send * (1 - self.reverb_bal)
+        self.chain = CelloChain(fader=fader, tone=tone, send=send, dry=dry)
         return self.chain
 
     def play(self):
         chain = self._build()
-        chain["fader"].play()
-        chain["reverb"].out()
+        chain.fader.play()
+        chain.dry.out()
+        self._reverb_send(chain.send, self.reverb_bal,
+                          self.duration * self.dur_multiplier)
         return chain
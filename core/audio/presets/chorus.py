@@ -1,11 +1,11 @@
 # File: core/audio/presets/chorus.py © 2025 projectemergence. All rights reserved.
 #!/usr/bin/env python3
 
-from pyo import Noise, Chorus
 from core.audio.presets.base_preset import BasePreset
 
 class ChorusPreset(BasePreset):
     """A simple chorus/noise layer that can thicken the drone."""
+
     def __init__(
         self,
         *,
@@ -21,13 +21,10 @@ class ChorusPreset(BasePreset):
         self.bal=bal
 
     def play(self):
-        return Chorus(Noise(mul=self.noise_vol),
+        from pyo import Chorus
+        # Chorus is linear, so scaling its output equals scaling the noise
+        return Chorus(self._shared_noise(),
                       depth=self.depth,
                       feedback=self.feedback,
-                      bal=self.bal).out()
-    def _build(self):
-        # fade-in only once, then hold
-        env = Fader(fadein=0.01, fadeout=1.0, dur=0.8, mul=0.1).play()
-        # noise source into chorus
-        noise = Noise(mul=env)
-        return Chorus(self.noise, depth=self.depth, feedback=self.feedback, bal=self.bal)
+                      bal=self.bal,
+                      mul=self.noise_vol).out()
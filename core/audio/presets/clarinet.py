@@ -1,8 +1,16 @@
 # File: src/core/audio/presets/clarinet.py © 2025 projectemergence. All rights reserved.
 # Defines a clarinet sound with filter and distortion. _build() added for architecture support.
 
-from pyo import Sine, Fader, Disto, ButLP
-from core.audio.presets.base_preset import BasePreset
+from dataclasses import dataclass
+from core.audio.presets.base_preset import BasePreset, Chain, shared_graph
+from core.audio.presets._dsp import LOWPASS, biquad, biquad_coeffs, server_sr
+
+@dataclass(slots=True)
+class ClarinetChain(Chain):
+    fader: object
+    tone: object
+    distorted: object
+    filtered: object
 
 class Clarinet(BasePreset):
     def __init__(
@@ -20,20 +28,24 @@ class Clarinet(BasePreset):
     ):
         super().__init__(intensity, duration)
         # core
-        self.base_freq = 20.0
+        self.base_freq = base_freq
         # fader settings
-        self.fade_in = 0.05
-        self.fade_out = 0.5
-        self.fader_mul_factor = 0.26
+        self.fade_in = fade_in
+        self.fade_out = fade_out
+        self.fader_mul_factor = fader_mul_factor
         # distortion settings
-        self.dist_drive = 0.6
-        self.dist_slope = 0.3
-        self.dist_mul_factor = 1.0
+        self.dist_drive = dist_drive
+        self.dist_slope = dist_slope
+        self.dist_mul_factor = dist_mul_factor
         # filter settings
-        self.filter_freq = 800.0
+        self.filter_freq = filter_freq
+        # Butterworth 2-pole low-pass (q = 1/sqrt(2)), cached across instances
+        self._lpf_coef = biquad_coeffs(LOWPASS, self.filter_freq, 0.7071, server_sr())
 
+    @shared_graph
     def _build(self):
-        fader = Fader(
+        from pyo import Sine, Disto
+        fader = self._table_env(
             fadein=self.fade_in,
             fadeout=self.fade_out,
             dur=self.duration,
@@ -49,20 +61,17 @@ class Clarinet(BasePreset):
             slope=self.dist_slope,
             mul=self.dist_mul_factor
         )
-        filtered = ButLP(
-            distorted,
-            freq=self.filter_freq
+        filtered = biquad(distorted, self._lpf_coef)
+        self.chain = ClarinetChain(
+            fader=fader,
+            tone=tone,
+            distorted=distorted,
+            filtered=filtered
         )
-        self.chain = {
-            "fader": fader,
-            "tone": tone,
-            "distorted": distorted,
-            "filtered": filtered
-        }
         return self.chain
 
     def play(self):
         chain = self._build()
-        chain["fader"].play()
-        chain["filtered"].out()
+        chain.fader.play()
+        chain.filtered.out()
         return chain
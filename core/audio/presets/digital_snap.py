@@ -4,8 +4,35 @@
 DigitalSnap – hyper-tight click percussion with bit-crush and comb-style delay.
 """
 
-from pyo import Noise, Fader, Degrade, SmoothDelay, ButHP
-from core.audio.presets.base_preset import BasePreset
+from dataclasses import dataclass
+from functools import lru_cache
+import numpy as np
+from core.audio.presets.base_preset import BasePreset, Chain
+from core.audio.presets._dsp import server_sr, table_from_array
+
+# Degrade clamps srscale to [1/1024, 1]
+_MIN_SR_SCALE = 1.0 / 1024
+
+@lru_cache(maxsize=8)
+def _crushed_noise(bit_depth, hold, sr):
+    """
+    Two seconds of white noise, pre-crushed the way Degrade would:
+    sample-and-hold every `hold` samples, quantized to `bit_depth` bits.
+    Rendered once per setting and shared by every hit.
+    """
+    n = 2 * sr
+    rng = np.random.default_rng(0)
+    steps = rng.uniform(-1.0, 1.0, -(-n // hold))
+    levels = 2 ** bit_depth / 2
+    buf = np.repeat(np.round(steps * levels) / levels, hold)[:n]
+    return table_from_array(buf.astype(np.float32))
+
+@dataclass(slots=True)
+class DigitalSnapChain(Chain):
+    env: object
+    crushed: object
+    combed: object
+    cleaned: object
 
 class DigitalSnap(BasePreset):
     def __init__(
@@ -24,59 +51,60 @@ class DigitalSnap(BasePreset):
     ):
         kw.setdefault('stereo_w', 0.0)
         kw.setdefault('enable_reverb', False)
-        super().__init__(intensity=0.8, duration=1.01, **kw)
+        super().__init__(intensity=intensity, duration=duration, **kw)
 
         # bit-crusher params
-        self.bit_depth = 6
-        self.sr_scale = 0.0
+        self.bit_depth = bit_depth
+        self.sr_scale = sr_scale
 
         # comb-style delay params (delay + feedback)
-        self.comb_delay = 0.04
-        self.comb_feedback = 0.0
-        self.crossfade = 0.01
+        self.comb_delay = comb_delay
+        self.comb_feedback = comb_feedback
+        self.crossfade = crossfade
 
         # cleanup filter
-        self.hpf_freq = 138.93
+        self.hpf_freq = hpf_freq
 
         # envelope params
-        self.fade_in = 0.001
-        self.fade_out = 0.02
+        self.fade_in = fade_in
+        self.fade_out = fade_out
 
         # storage for the signal chain
-        self.chain = {}
+        self.chain = None
 
     def _build(self):
+        from pyo import TableRead, SmoothDelay, ButHP
         # 1) click envelope
-        env = Fader(
+        env = self._table_env(
             fadein=self.fade_in,
             fadeout=self.fade_out,
             dur=self.duration,
             mul=self.intensity
         ).play()
 
-        # 2) white-noise click
-        noise = Noise(mul=env)
-
-        # 3) bit-crusher
-        crushed = Degrade(noise,
-                          bitdepth=self.bit_depth,
-                          srscale=self.sr_scale)
+        # 2+3) pre-crushed white-noise click
+        hold = max(1, round(1.0 / max(self.sr_scale, _MIN_SR_SCALE)))
+        table = _crushed_noise(self.bit_depth, hold, server_sr())
+        crushed = TableRead(table,
+                            freq=table.getRate(),
+                            loop=True,
+                            mul=env).play()
 
         # 4) comb-style delay via SmoothDelay (delay + feedback) :contentReference[oaicite:1]{index=1}
         combed = SmoothDelay(crushed,
                              delay=self.comb_delay,
                              feedback=self.comb_feedback,
-                             crossfade=0.01)
+                             crossfade=self.crossfade)
 
         # 5) high-pass cleanup
         cleaned = ButHP(combed, freq=self.hpf_freq)
 
-        self.chain = {
-            "env": env,
-            "crushed": crushed,
-            "combed": combed,
-            "cleaned": cleaned
-        }
+        self.chain = DigitalSnapChain(
+            env=env,
+            crushed=crushed,
+            combed=combed,
+            cleaned=cleaned
+        )
         return cleaned
 
     def play(self):
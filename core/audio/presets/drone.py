@@ -1,17 +1,35 @@
 # File: core/audio/presets/drone.py © 2025 projectemergence. All rights reserved.
 #!/usr/bin/env python3
 
-try:
-    from pyo import Fader, Sine, Sum
-except Exception:  # pragma: no cover - fallback when pyo missing or outdated
-    from pyo import Fader, Sine  # type: ignore
-    def Sum(sig_list, mul=1.0):
-        """Basic fallback summing implementation."""
-        out = sig_list[0]
-        for s in sig_list[1:]:
-            out = out + s
-        return out * mul
+from functools import lru_cache
+import numpy as np
 from core.audio.presets.base_preset import BasePreset
+from core.audio.presets._dsp import envelope, server_sr, table_from_array
+
+RENDER_MAX_SECONDS = 30.0   # longer drones run as a live oscillator graph instead
+
+# at most 4 tables of RENDER_MAX_SECONDS float32 samples (~21 MB at 44.1 kHz)
+@lru_cache(maxsize=4)
+def _render_drone(base_freq, complexity, lfo_rate, lfo_depth,
+                  fade_in, fade_out, dur, sr):
+    """
+    Whole drone (LFO-modulated main sine, optional detuned partner, envelope)
+    rendered in one vectorised pass. Unit gain; intensity is applied on read.
+    """
+    n = max(int(dur * sr), 2)
+    t = np.arange(n) / sr
+    # integrate the instantaneous frequency so the LFO is true FM
+    inst_freq = base_freq + lfo_depth * np.sin(2 * np.pi * lfo_rate * t)
+    out = np.sin(2 * np.pi * np.cumsum(inst_freq) / sr)
+
+    # secondary oscillator (based on high complexity)
+    if complexity > 0.5:
+        detune_factor = 1.0 + (complexity - 0.5) * 0.02
+        secondary_amp_factor = (complexity - 0.5) * 0.5
+        out += secondary_amp_factor * np.sin(2 * np.pi * base_freq * detune_factor * t)
+
+    out *= envelope(fade_in, fade_out, n, sr)
+    return table_from_array(out.astype(np.float32))
 
 class Drone(BasePreset):  # Renamed class
     """Continuous drone with adjustable complexity."""
@@ -39,35 +57,32 @@ class Drone(BasePreset):  # Renamed class
         self.lfo_mod_rate_factor = lfo_mod_rate_factor
         # self.dur is inherited from BasePreset via super().__init__
 
+    def _build_live(self, lfo_rate, lfo_depth):
+        """Same drone from running oscillators, for durations too long to pre-render."""
+        from pyo import Fader, Sine
+        env = Fader(fadein=self.fade_in, fadeout=self.fade_out, dur=self.duration,
+                    mul=self.intensity).play()
+        out = Sine(freq=self.base_freq + Sine(freq=lfo_rate, mul=lfo_depth), mul=env)
+        if self.complexity > 0.5:
+            detune_factor = 1.0 + (self.complexity - 0.5) * 0.02
+            secondary_amp_factor = (self.complexity - 0.5) * 0.5
+            out = out + Sine(freq=self.base_freq * detune_factor, mul=env * secondary_amp_factor)
+        self.chain = out
+        return out
+
     def _build(self):
-        env = Fader(fadein=self.fade_in, fadeout=self.fade_out, dur=self.duration, mul=self.intensity).play()
-        
-        # Main LFO Modulation for primary sine
+        from pyo import TableRead
         # LFO rate and depth are scaled by complexity
         lfo_rate = max(0.001, self.complexity * self.lfo_mod_rate_factor)
         lfo_depth = self.complexity * self.lfo_mod_depth_factor
-        mod_lfo = Sine(freq=lfo_rate, mul=lfo_depth)
-        
-        main_sine_freq = self.base_freq + mod_lfo
-        main_sine = Sine(freq=main_sine_freq, mul=env)
-        
-        output_signal = main_sine
-        
-        # Secondary Oscillator (based on high complexity)
-        if self.complexity > 0.5:
-            detune_factor = 1.0 + (self.complexity - 0.5) * 0.02 
-            secondary_amp_factor = (self.complexity - 0.5) * 0.5 
-            
-            secondary_sine_freq = self.base_freq * detune_factor
-            # Ensure secondary sine also uses the main envelope
-            secondary_sine = Sine(freq=secondary_sine_freq, mul=env * secondary_amp_factor)
-            
-            # Summing the main modulated sine and the secondary sine
-            # Adjust overall gain if necessary, for now simple sum
-            output_signal = Sum([main_sine, secondary_sine], mul=1.0) # mul=1.0 as env already scales them
+        if not self.duration or self.duration > RENDER_MAX_SECONDS:
+            return self._build_live(lfo_rate, lfo_depth)
+
+        table = _render_drone(self.base_freq, self.complexity, lfo_rate, lfo_depth,
+                              self.fade_in, self.fade_out, self.duration, server_sr())
+        self.chain = TableRead(table, freq=table.getRate(), loop=0,
+                               mul=self.intensity).play() # Storing the final output PyoObject
 
-        self.chain = output_signal # Storing the final output PyoObject
-            
         return self.chain
 
     def play(self):
@@ -4,8 +4,15 @@
 FMBellCluster – FM-based bell cluster with feedback, chorus and reverb.
 """
 
-from pyo import FM, Chorus, Freeverb, Fader
-from core.audio.presets.base_preset import BasePreset
+from dataclasses import dataclass
+from core.audio.presets.base_preset import BasePreset, Chain, shared_graph
+
+@dataclass(slots=True)
+class FMBellChain(Chain):
+    env: object
+    bell: object
+    chorus: object
+    dry: object
 
 class FMBellCluster(BasePreset):
     def __init__(
@@ -46,9 +53,11 @@ class FMBellCluster(BasePreset):
         self.fade_in = fade_in
         self.fade_out = fade_out
 
+    @shared_graph
     def _build(self):
-        env = Fader(fadein=self.fade_in, fadeout=self.fade_out,
-                    dur=self.duration, mul=self.intensity).play()
+        from pyo import FM, Chorus
+        env = self._table_env(fadein=self.fade_in, fadeout=self.fade_out,
+                              dur=self.duration, mul=self.intensity)
         # FM carrier/modulator
         bell = FM(carrier=self.carrier_freq,
                   ratio=self.mod_ratio,
@@ -57,13 +66,14 @@ class FMBellCluster(BasePreset):
         # add richness
         ch = Chorus(bell, depth=self.chorus_depth,
                     feedback=self.chorus_feedback)
-        # space
-        rv = Freeverb(ch, size=self.reverb_size,
-                      bal=self.reverb_bal)
-        self.chain = {"env": env, "bell": bell, "chorus": ch, "reverb": rv}
-        return rv
+        # space: wet comes from the shared reverb bus (see play)
+        dry = ch * (1 - self.reverb_bal)
+        self.chain = FMBellChain(env=env, bell=bell, chorus=ch, dry=dry)
+        return self.chain
 
     def play(self):
-        out = self._build()
-        out.out()
-        return self.chain
+        chain = self._build()
+        chain.env.play()
+        chain.dry.out()
+        self._reverb_send(chain.chorus, self.reverb_bal, self.duration)
+        return chain
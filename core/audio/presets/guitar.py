@@ -1,8 +1,14 @@
 # File: src/core/audio/presets/guitar.py © 2025 projectemergence. All rights reserved.
 # Simulates a plucked sine loop guitar. _build() added for architecture support.
 
-from pyo import SineLoop, Fader, Chorus
-from core.audio.presets.base_preset import BasePreset
+from dataclasses import dataclass
+from core.audio.presets.base_preset import BasePreset, Chain
+
+@dataclass(slots=True)
+class GuitarChain(Chain):
+    fader: object
+    tone: object
+    chorus: object
 
 class Guitar(BasePreset):
     def __init__(
@@ -33,6 +39,7 @@ class Guitar(BasePreset):
         self.chorus_bal = 0.14
 
     def _build(self):
+        from pyo import SineLoop, Fader, Chorus
         fader = Fader(
             fadein=self.fade_in,
             fadeout=self.fade_out,
@@ -50,11 +57,11 @@ class Guitar(BasePreset):
             feedback=self.chorus_feedback,
             bal=self.chorus_bal
         )
-        self.chain = {"fader": fader, "tone": tone, "chorus": chorus}
+        self.chain = GuitarChain(fader=fader, tone=tone, chorus=chorus)
         return self.chain
 
     def play(self):
         chain = self._build()
-        chain["fader"].play()
-        chain["chorus"].out()
+        chain.fader.play()
+        chain.chorus.out()
         return chain
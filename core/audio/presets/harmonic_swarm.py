@@ -4,10 +4,15 @@
 HarmonicSwarm – multiple detuned partials with dynamic panning and delay feedback.
 """
 
-import random # Added for random.uniform, though 'from random import uniform' was already there
-from random import uniform 
-from pyo import Sine, Fader, Delay, Pan, Sine as LFO
-from core.audio.presets.base_preset import BasePreset
+from dataclasses import dataclass
+import numpy as np
+from core.audio.presets.base_preset import BasePreset, Chain
+
+@dataclass(slots=True)
+class HarmonicSwarmChain(Chain):
+    gate: object
+    voices: list
+    delayed: object
 
 class HarmonicSwarm(BasePreset):
     def __init__(
@@ -56,38 +61,41 @@ class HarmonicSwarm(BasePreset):
         self.fade_out = fade_out
 
     def _build(self):
+        from pyo import Sine, Delay, Pan, Mix, Sine as LFO
         # long fade for smooth crossfade
-        gate = Fader(fadein=self.fade_in, fadeout=self.fade_out,
-                     dur=self.duration, mul=self.intensity).play()
+        gate = self._table_env(fadein=self.fade_in, fadeout=self.fade_out,
+                               dur=self.duration, mul=self.intensity).play()
+
+        # per-voice parameters in one vectorised draw
+        rng = np.random.default_rng()
+        n = self.num_voices
+        ratios = self.freq_ratio + rng.uniform(-self.detune_range, self.detune_range, n)
+        freqs = self.base_freq * ratios ** np.arange(n)
+        # Ensure pan rates are positive
+        pan_rates = np.maximum(0.001, self.pan_rate + rng.uniform(-self.pan_randomness, self.pan_randomness, n))
 
         # create voices
+        voice_amp = gate / n
         voices = []
-        for i in range(self.num_voices):
-            # Apply detune randomness
-            current_freq_ratio = self.freq_ratio + random.uniform(-self.detune_range, self.detune_range)
-            actual_freq = self.base_freq * (current_freq_ratio**i) # Renamed 'detune' to 'actual_freq' for clarity
-            
-            osc = Sine(freq=actual_freq, mul=gate/self.num_voices)
-            
-            # Apply pan randomness
-            current_pan_rate = self.pan_rate + random.uniform(-self.pan_randomness, self.pan_randomness)
-            # Ensure pan rate is positive
-            effective_pan_rate = max(0.001, current_pan_rate) 
-            
-            pan_lfo = LFO(freq=effective_pan_rate,
-                          mul=self.pan_depth/2, add=0.5) # uniform(-0.01,0.01) removed as pan_randomness handles it
+        for freq, pan_rate in zip(freqs.tolist(), pan_rates.tolist()):
+            osc = Sine(freq=freq, mul=voice_amp)
+            pan_lfo = LFO(freq=pan_rate, mul=self.pan_depth/2, add=0.5)
             voices.append(Pan(osc, pan=pan_lfo))
 
-        mix = sum(voices)
-        # build one Delay per tap time and sum them
-        delays = []
-        for dt in self.delay_times:
-            delays.append(Delay(mix,
-                                delay=dt,
-                                feedback=self.delay_feedback,
-                                mul=self.delay_mul))
-        delayed = sum(delays)
-        self.chain = {"gate": gate, "voices": voices, "delayed": delayed}
+        # one N-way sum in C; voices=2 keeps the panned stereo image
+        mix = Mix(voices, voices=2)
+        # one Delay object over the summed voices: each tap time is repeated
+        # once per channel of `mix` so stream k reads channel k % nchnls, and
+        # mix(nchnls) folds the taps back down inside pyo. Every stream still
+        # keeps its own delay line, since each tap has its own feedback loop.
+        nchnls = len(mix)
+        taps = [dt for dt in self.delay_times for _ in range(nchnls)]
+        delayed = Delay(mix,
+                        delay=taps,
+                        feedback=self.delay_feedback,
+                        maxdelay=max(self.delay_times),
+                        mul=self.delay_mul).mix(nchnls)
+        self.chain = HarmonicSwarmChain(gate=gate, voices=voices, delayed=delayed)
         return delayed
 
     def play(self):
@@ -9,10 +9,18 @@ Simulates a hi-hat using filtered noise with a short burst envelope.
 Adoptez une vision tournée vers l’avenir!
 """
 
-from pyo import Noise, Fader, ButHP
-from core.audio.presets.base_preset import BasePreset
+from dataclasses import dataclass
+from core.audio.presets.base_preset import BasePreset, Chain
+
+@dataclass(slots=True)
+class HiHatChain(Chain):
+    fader: object
+    hi_hat: object
 
 class HiHat(BasePreset):
+    # envelope settings are re-applied to the pooled Fader on every play()
+    _ENV_PARAMS = ('intensity', 'duration', 'fade_in', 'fade_out', 'fader_mul_factor')
+
     def __init__(
         self,
         intensity=0.76,
@@ -25,31 +33,38 @@ class HiHat(BasePreset):
     ):
         kw.setdefault('stereo_w', 0.0)
         kw.setdefault('enable_reverb', False)
-        super().__init__(intensity=0.76, duration=1.85, **kw)
+        super().__init__(intensity=intensity, duration=duration, **kw)
         # filter cutoff
-        self.cutoff = 5654.76
+        self.cutoff = cutoff
         # envelope settings
-        self.fade_in = 0.005
-        self.fade_out = 0.21
-        self.fader_mul_factor = 0.0
+        self.fade_in = fade_in
+        self.fade_out = fade_out
+        self.fader_mul_factor = fader_mul_factor
+        self._fader_mul = self.intensity * self.fader_mul_factor
 
     def _build(self):
+        from pyo import Fader, ButHP
         # short burst envelope
         fader = Fader(
             fadein=self.fade_in,
             fadeout=self.fade_out,
             dur=self.duration,
-            mul=self.intensity * self.fader_mul_factor
+            mul=self._fader_mul
         )
-        noise = Noise(mul=fader)
-        hi_hat = ButHP(noise, freq=self.cutoff)
-        self.chain = {"fader": fader, "noise": noise, "hi_hat": hi_hat}
+        # shared noise; the filter is linear, so the envelope rides on its mul
+        hi_hat = ButHP(self._shared_noise(), freq=self.cutoff, mul=fader)
+        self.chain = HiHatChain(fader=fader, hi_hat=hi_hat)
         return self.chain
 
     def play(self):
-        chain = self._build()
-        chain["fader"].play()
-        chain["hi_hat"].out()
+        chain = self._pooled_chain(exclude=self._ENV_PARAMS)
+        fader = chain.fader
+        fader.setFadein(self.fade_in)
+        fader.setFadeout(self.fade_out)
+        fader.setDur(self.duration)
+        fader.setMul(self._fader_mul)
+        fader.play()
+        chain.hi_hat.out()
         return chain
 
 if __name__ == "__main__":
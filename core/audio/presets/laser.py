@@ -1,8 +1,14 @@
 # File: src/core/audio/presets/laser.py © 2025 projectemergence. All rights reserved.
 # Futuristic laser sound with FM. _build() added for architecture support.
 
-from pyo import Sine, Fader
-from core.audio.presets.base_preset import BasePreset
+from dataclasses import dataclass
+from core.audio.presets.base_preset import BasePreset, Chain
+
+@dataclass(slots=True)
+class LaserChain(Chain):
+    fader: object
+    mod: object
+    laser: object
 
 class Laser(BasePreset):
     def __init__(
@@ -29,25 +35,26 @@ class Laser(BasePreset):
         self.fade_in = fade_in
         self.fade_out = fade_out
         self.fader_mul_factor = fader_mul_factor # Still here, consider if it's redundant with self.intensity
+        self._fader_mul = self.intensity * self.fader_mul_factor
 
     def _build(self):
+        from pyo import Sine, Fader
         # amplitude envelope
         fader = Fader(
             fadein=self.fade_in,
             fadeout=self.fade_out,
             dur=self.duration,
-            mul=self.intensity * self.fader_mul_factor
+            mul=self._fader_mul
         )
         # modulator oscillator
-        mod = Sine(freq=self.mod_rate, mul=self.mod_depth)
+        mod = Sine(freq=self.mod_rate, mul=self.mod_depth, add=self.base_freq)
         # frequency-modulated carrier
-        modulated_freq = self.base_freq + mod
-        laser = Sine(freq=modulated_freq, mul=fader)
-        self.chain = {"fader": fader, "mod": mod, "laser": laser}
+        laser = Sine(freq=mod, mul=fader)
+        self.chain = LaserChain(fader=fader, mod=mod, laser=laser)
         return self.chain
 
     def play(self):
-        chain = self._build()
-        chain["fader"].play()
-        chain["laser"].out()
+        chain = self._pooled_chain()
+        chain.fader.play()
+        chain.laser.out()
         return chain
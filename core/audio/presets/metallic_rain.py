@@ -6,11 +6,29 @@ MetallicRain – spectral drizzle with stereo drift and tail.
 (Fixed kw duplication 2025-04-23.)
 """
 
-import random, time, threading
-from pyo import Noise, ButBP, Sine, Fader, Mix
-from core.audio.presets.base_preset import BasePreset
+import numpy as np
+from dataclasses import dataclass
+from core.audio.presets.base_preset import BasePreset, Chain
+
+@dataclass(slots=True)
+class MetallicRainChain(Chain):
+    fade: object
+    hiss: object
+    rain: object
+    grains: object
+    mix: object
 
 class MetallicRain(BasePreset):
+    GRAIN_POOL_SIZE = 16   # concurrent drops; the oldest is re-used when all are busy
+    _ramp = None           # shared 0 -> 1 LinTable every grain glide reads
+
+    @classmethod
+    def _ramp_table(cls):
+        if cls._ramp is None:
+            from pyo import LinTable
+            cls._ramp = LinTable([(0, 0.0), (8191, 1.0)], size=8192)
+        return cls._ramp
+
     def __init__(
         self,
         intensity=0.4,
@@ -48,6 +66,7 @@ class MetallicRain(BasePreset):
         self.fade_env = fade_env
         self.hiss_mul_factor = hiss_mul_factor
         self.hiss_freq_ratio = hiss_freq_ratio
+        self._hiss_freq = base_freq * hiss_freq_ratio
         self.hiss_q = hiss_q
 
         # sweep (body) parameters
@@ -70,47 +89,100 @@ class MetallicRain(BasePreset):
         # final mix
         self.mix_voices = mix_voices
 
+    def _grain_pool(self, fade):
+        """
+        Pre-allocate GRAIN_POOL_SIZE silent grain voices: a glide reading the
+        shared ramp table (one period per sweep, mapped by mul/add), a
+        per-grain envelope and a band-passed sine, all retuned per drop.
+        """
+        from pyo import ButBP, Fader, Osc, Sine
+        ramp = self._ramp_table()
+        pool = []
+        for _ in range(self.GRAIN_POOL_SIZE):
+            glide = Osc(table=ramp, freq=1.0 / self.sweep_dur, mul=0, add=self.base_freq)
+            env = Fader(fadein=0.005, fadeout=self.sweep_dur * 0.5, dur=self.sweep_dur)
+            grain = ButBP(
+                Sine(freq=glide),
+                freq=glide * self.grain_bp_ratio,
+                q=self.grain_bp_q,
+                mul=env * fade
+            )
+            pool.append((glide, env, grain))
+        return pool
+
     def _grain(self, freq, dur, amp):
-        """Create one grain: band-passed sine burst, auto-out."""
-        grain = ButBP(
-            Sine(freq=freq),
-            freq=freq * self.grain_bp_ratio,
-            q=self.grain_bp_q,
-            mul=amp
-        )
-        grain.out()
+        """Retune the next pooled grain: band-passed sine burst, out for `dur` seconds."""
+        glide, env, grain = self._grains[self._grain_cursor % self.GRAIN_POOL_SIZE]
+        self._grain_cursor += 1
+        start = freq * self.sweep_start_ratio
+        glide.setMul(freq * self.sweep_end_ratio - start)
+        glide.setAdd(start)
+        glide.reset()
+        env.setDur(dur)
+        env.setFadeout(dur * 0.5)
+        env.setMul(amp)
+        env.play()
+        grain.out(dur=dur)
         return grain
 
+    def _free_grains(self):
+        """Rain is over: stop every pooled grain voice and let go of the pool."""
+        for voice in self._grains:
+            for obj in voice:
+                obj.stop()
+        self._grains = []
+
+    def _draw_drops(self, n):
+        """Pre-draw `n` drops' (freq, dur, amp) in one vectorised RNG pass."""
+        rng = self._rng
+        drops = self.base_freq * rng.uniform(self.drop_rand_min, self.drop_rand_max, n)
+        durs = rng.uniform(self.sweep_dur * 0.25, self.sweep_dur * 0.875, n)
+        amps = rng.uniform(self.amp_rand_min, self.amp_rand_max, n)
+        self._drops = list(zip(drops.tolist(), durs.tolist(), amps.tolist()))
+        self._drop_idx = 0
+
+    def _spawn_grain(self):
+        """Pattern callback: one randomised falling drop."""
+        if self._drop_idx == len(self._drops):
+            # endless rain (duration 0/None): refill in chunks
+            self._draw_drops(1024)
+        drop, dur, amp = self._drops[self._drop_idx]
+        self._drop_idx += 1
+        self._grain(drop, dur, amp)
+
     def _build(self):
+        from pyo import ButBP, CallAfter, Mix, Pattern
         # create shared envelope for hiss and grains
-        fade = self._env(self.fade_env)
+        fade = self._env(self.fade_env).play()
 
         # hiss floor
         hiss = ButBP(
-            Noise(mul=fade * self.hiss_mul_factor),
-            freq=self.base_freq * self.hiss_freq_ratio,
-            q=self.hiss_q
+            self._shared_noise(),
+            freq=self._hiss_freq,
+            q=self.hiss_q,
+            mul=fade * self.hiss_mul_factor
         )
 
-        # spawn grains in background
-        def rain_loop():
-            end_t = time.time() + (self.duration or 1e9)
-            while time.time() < end_t:
-                drop = self.base_freq * random.uniform(self.drop_rand_min, self.drop_rand_max)
-                glide = self._sweep(
-                    drop * self.sweep_start_ratio,
-                    drop * self.sweep_end_ratio,
-                    self.sweep_dur
-                )
-                dur = random.uniform(self.sweep_dur * 0.25, self.sweep_dur * 0.875)
-                amp = fade * random.uniform(self.amp_rand_min, self.amp_rand_max)
-                self._keep(self._grain(glide, dur, amp))
-               
-        threading.Thread(target=rain_loop, daemon=True).start()
+        # spawn grains on the audio server's clock
+        self._grains = self._grain_pool(fade)
+        self._grain_cursor = 0
+        self._rng = np.random.default_rng()
+        self._draw_drops(int((self.duration or 0) * self.grain_rate) + 8)
+        rain = Pattern(function=self._spawn_grain, time=1.0 / self.grain_rate)
+        rain.play(dur=self.duration or 0)
+        if self.duration:
+            # the pool outlives the last drop by one sweep, then goes silent for good
+            self._release = CallAfter(self._free_grains, self.duration + self.sweep_dur)
 
         # mix to stereo
         mix = Mix([hiss], voices=self.mix_voices)
-        self.chain = {"fade": fade, "hiss": hiss, "mix": mix}
+        self.chain = MetallicRainChain(
+            fade=fade,
+            hiss=hiss,
+            rain=rain,
+            grains=self._grains,
+            mix=mix
+        )
         return mix
 
     def play(self):
@@ -1,7 +1,6 @@
 #File:  audio/presets/piano.py © 2025 projectemergence. All rights reserved.
 # File: src/core/audio/presets/piano.py © 2025 projectemergence
 
-from pyo import Sine, Fader
 from core.audio.presets.base_preset import BasePreset
 
 class Piano(BasePreset):
@@ -33,54 +32,64 @@ class Piano(BasePreset):
         self.fade_in = fade_in
         self.fade_out = fade_out
         self.fader_mul_factor = fader_mul_factor
+        self._fader_mul = self.intensity * self.fader_mul_factor
         self.tempo = tempo # Store tempo
 
-    def _build(self):
-        # This _build method is specific to Piano if it doesn't use BasePreset's melody player.
-        # If BasePreset.play() is used for Piano melodies (which it should be, given notes/durations are passed to super),
-        # then this _build method is only called if .play() is invoked on a Piano instance
-        # that *didn't* receive notes/durations in its __init__ (falling back to single-shot mode).
-        # The subtask implies Piano is used for melodies, so BasePreset.play() will handle it.
-        # If Piano is *only* for melodies passed to its constructor, this _build could raise NotImplementedError
-        # or return a default sound. For now, keep it as is, but be aware of its role.
-        
-        # If this Piano instance is meant to play a single sound (not a melody sequence from constructor):
-        if not self.notes or not self.durations: # Check if it's in single-shot mode
-             # Default behavior for a single piano note if notes/durations not provided
-             # (or if BasePreset's play() decided not to use its melody logic)
-            default_freq = self.freq1 if self.freq1 is not None else 440 # Use freq1 or a default
-            default_duration = self.duration if self.duration is not None else 1.0 # Use instance duration or default
-            
-            # The tempo conversion should happen here if this _build is for a single, duration-beat defined sound.
-            # However, self.duration in BasePreset is already in seconds.
-            # If 'dur' in this context was meant to be from a different source (e.g. specific Piano param in beats),
-            # then conversion self.tempo would be needed. Assuming self.duration is already in seconds.
-            fader_duration = default_duration
+    def play(self):
+        """
+        Melody: one preallocated Fader+Sine voice retuned at each note
+        boundary by a server-side Seq/TrigFunc, instead of a Fader+Sine
+        pair per note. Without a melody, falls back to the single-shot path.
+        """
+        if not (self.notes and self.durations):
+            return super().play()
+        from pyo import Fader, Seq, Sine, TrigFunc
+        effective_tempo = self.tempo if self.tempo and self.tempo > 0 else 120.0
+        self._note_secs = [d * (60.0 / effective_tempo) for d in self.durations]
+        # intensities: explicit -> per-note list -> fallback to base
+        ints = (
+            self._melody_ints
+            or self._per_note_intensities
+            or [self.intensity] * len(self.notes)
+        )
+        ints = list(ints) + [self.intensity] * (len(self.notes) - len(ints))
+        # plain per-note intensity, as BasePreset's melody path used; fader_mul_factor
+        # only scales the single-shot sound
+        self._note_muls = list(ints)
+        self._note_idx = 0
 
-            f = Fader(fadein=self.fade_in,
-                      fadeout=self.fade_out,
-                      dur=fader_duration, 
-                      mul=self.intensity * self.fader_mul_factor)
-            s = Sine(freq=default_freq, mul=f)
-            return s # Return single Pyo object as per BasePreset._build() expectation for single-shot
+        # Melody notes keep BasePreset's short per-note envelope; fade_in and
+        # fade_out shape the single-shot sound.
+        fader = Fader(fadein=0.005, fadeout=0.02,
+                      dur=self._note_secs[0], mul=self._note_muls[0])
+        voice = Sine(freq=self.notes[0], mul=fader)
+        self._voice = (fader, voice)
+        out = self._fx_chain(voice, hold=sum(self._note_secs))
+        seq = Seq(time=1.0, seq=self._note_secs, onlyonce=True).play()
+        self._keep(out.out(), seq, TrigFunc(seq, self._next_note))
+        return [fader]
 
-        # If Piano's _build is somehow used for sequences directly (less likely with BasePreset.play() changes):
-        # This part of _build would be invoked if BasePreset.play() called self._build() AND self.notes was populated.
-        # However, BasePreset.play() now has its own loop for notes/durations.
-        # This implies that if notes/durations are provided, BasePreset.play() handles them directly.
-        # If they are NOT provided, then this _build() is called.
-        # The original Piano _build created a sequence. If it's for single-shot, it should return a single Pyo object.
-        # For now, retaining original sequence logic if notes/durations are present,
-        # but this path is less likely to be hit for melodies given BasePreset.play() changes.
-        seq = []
-        for note, dur_beats in zip(self.notes, self.durations):
-            effective_tempo = self.tempo if self.tempo and self.tempo > 0 else 120.0
-            duration_in_seconds = dur_beats * (60.0 / effective_tempo)
+    def _next_note(self):
+        """TrigFunc callback: retune and retrigger the voice for the next note."""
+        i = self._note_idx
+        if i >= len(self._note_secs):
+            return
+        fader, voice = self._voice
+        voice.setFreq(self.notes[i])
+        fader.setDur(self._note_secs[i])
+        fader.setMul(self._note_muls[i])
+        fader.play()
+        self._note_idx = i + 1
+
+    def _build(self):
+        from pyo import Fader, Sine
+        # Single-shot mode: play() handles melodies itself.
+        default_freq = self.freq1 if self.freq1 is not None else 440 # Use freq1 or a default
+        default_duration = self.duration if self.duration is not None else 1.0 # Use instance duration or default
 
-            f = Fader(fadein=self.fade_in,
-                      fadeout=self.fade_out,
-                      dur=duration_in_seconds, # Use converted duration
-                      mul=self.intensity * self.fader_mul_factor)
-            s = Sine(freq=note, mul=f)
-            seq.append((f, s)) # BasePreset.play() expects list of (Fader, PyoObject)
-        return seq
+        f = Fader(fadein=self.fade_in,
+                  fadeout=self.fade_out,
+                  dur=default_duration,
+                  mul=self._fader_mul)
+        s = Sine(freq=default_freq, mul=f)
+        return s # Return single Pyo object as per BasePreset._build() expectation for single-shot
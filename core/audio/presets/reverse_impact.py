@@ -4,8 +4,27 @@
 ReverseImpact – swells that reverse-decay into impacts.
 """
 
-from pyo import Noise, Fader, NewTable, TableRec, TableRead, ButBP, Disto
-from core.audio.presets.base_preset import BasePreset
+from functools import lru_cache
+import numpy as np
+from dataclasses import dataclass
+from core.audio.presets.base_preset import BasePreset, Chain
+from core.audio.presets._dsp import server_sr, table_from_array
+
+@lru_cache(maxsize=8)
+def _reversed_swell(env_dur, sr):
+    """
+    White noise under a linear 0 -> 1 ramp of `env_dur` seconds, stored
+    reversed so a forward read gives the swell played backwards.
+    """
+    n = max(int(env_dur * sr), 2)
+    noise = np.random.default_rng(0).uniform(-1.0, 1.0, n)
+    return table_from_array((noise * np.linspace(0.0, 1.0, n))[::-1].astype(np.float32))
+
+@dataclass(slots=True)
+class ReverseImpactChain(Chain):
+    reader: object
+    filtered: object
+    distorted: object
 
 class ReverseImpact(BasePreset):
     def __init__(
@@ -21,36 +40,30 @@ class ReverseImpact(BasePreset):
         fade_out=0.41,
         **kw
     ):
-        super().__init__(intensity=0.43, duration=4.23, **kw)
+        super().__init__(intensity=intensity, duration=duration, **kw)
 
         # envelope recording length
-        self.env_dur = 2.2
-        self.fade_in = 0.07
-        self.fade_out = 0.41
+        self.env_dur = env_dur
+        self.fade_in = fade_in
+        self.fade_out = fade_out
 
         # bandpass
-        self.bp_freq = 800.0
-        self.bp_q = 5.0
+        self.bp_freq = bp_freq
+        self.bp_q = bp_q
 
         # distortion
-        self.dist_drive = 0.65
-        self.dist_slope = 0.39
+        self.dist_drive = dist_drive
+        self.dist_slope = dist_slope
 
     def _build(self):
-        # create reversed envelope table
-        tbl = NewTable(length=self.env_dur)
-        env = Fader(fadein=self.env_dur, fadeout=0,
-                    dur=self.env_dur, mul=self.intensity).play()
-        # record noise burst
-        rec = TableRec(Noise(mul=env), table=tbl).play()
-
-        # read it *backwards*
+        from pyo import TableRead, ButBP, Disto
+        # reversed noise swell, rendered once and shared by every trigger
+        tbl = _reversed_swell(self.env_dur, server_sr())
         reader = TableRead(
             table=tbl,
-            freq=-tbl.getRate(),  
-                         
-            mul=1.0
-        )
+            freq=tbl.getRate(),
+            mul=self.intensity
+        ).play()
 
         # then the rest of your chain
         filtered  = ButBP(reader, freq=self.bp_freq, q=self.bp_q)
@@ -59,13 +72,11 @@ class ReverseImpact(BasePreset):
                           slope=self.dist_slope,
                           mul=1.0)
 
-        self.chain = {
-            "env": env,
-            "rec": rec,
-            "reader": reader,
-            "filtered": filtered,
-            "distorted": distorted
-        }
+        self.chain = ReverseImpactChain(
+            reader=reader,
+            filtered=filtered,
+            distorted=distorted
+        )
         return distorted
 
 
@@ -9,10 +9,18 @@ Simulates a snare drum using a short burst of noise filtered with a narrow bandp
 Adoptez une vision tournée vers l’avenir!
 """
 
-from pyo import Noise, Fader, ButBP
-from core.audio.presets.base_preset import BasePreset
+from dataclasses import dataclass
+from core.audio.presets.base_preset import BasePreset, Chain
+
+@dataclass(slots=True)
+class SnareChain(Chain):
+    fader: object
+    snare: object
 
 class Snare(BasePreset):
+    # envelope settings are re-applied to the pooled Fader on every play()
+    _ENV_PARAMS = ('intensity', 'duration', 'fade_in', 'fade_out', 'fader_mul_factor')
+
     def __init__(
         self,
         intensity=0.64,
@@ -26,41 +34,46 @@ class Snare(BasePreset):
         # ensure stereo and reverb defaults
         kw.setdefault('stereo_w', 0.0)
         kw.setdefault('enable_reverb', False)
-        super().__init__(intensity=0.64, duration=0.54, **kw)
+        super().__init__(intensity=intensity, duration=duration, **kw)
 
         # filter center frequency
-        self.center_freq = 19.952623149688797
+        self.center_freq = center_freq
 
         # envelope settings
-        self.fade_in = 0.01
-        self.fade_out = 0.2
-        self.fader_mul_factor = 1.0
+        self.fade_in = fade_in
+        self.fade_out = fade_out
+        self.fader_mul_factor = fader_mul_factor
+        self._fader_mul = self.intensity * self.fader_mul_factor
 
         # storage for built objects
-        self.chain = {}
+        self.chain = None
 
     def _build(self):
+        from pyo import Fader, ButBP
         # create the burst envelope
         fader = Fader(
             fadein=self.fade_in,
             fadeout=self.fade_out,
             dur=self.duration,
-            mul=self.intensity * self.fader_mul_factor
+            mul=self._fader_mul
         )
-        # noise source
-        noise = Noise(mul=fader)
-        # band-pass filter for snare character
-        snare = ButBP(noise, freq=self.center_freq)
+        # band-pass the shared noise for snare character
+        snare = ButBP(self._shared_noise(), freq=self.center_freq, mul=fader)
 
-        self.chain = {"fader": fader, "noise": noise, "snare": snare}
+        self.chain = SnareChain(fader=fader, snare=snare)
         return snare
 
     def play(self):
-        snare = self._build()
-        # start envelope and output
-        self.chain["fader"].play()
-        snare.out()
-        return self.chain
+        chain = self._pooled_chain(exclude=self._ENV_PARAMS)
+        # re-time the pooled envelope, then start it and output
+        fader = chain.fader
+        fader.setFadein(self.fade_in)
+        fader.setFadeout(self.fade_out)
+        fader.setDur(self.duration)
+        fader.setMul(self._fader_mul)
+        fader.play()
+        chain.snare.out()
+        return chain
 
 if __name__ == "__main__":
     Snare().play()
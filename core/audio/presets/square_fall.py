@@ -1,29 +1,34 @@
 # File: core/audio/presets/square_fall.py © 2025 projectemergence. All rights reserved.
 #!/usr/bin/env python3
 
-from pyo import Fader, Sine, IRPulse
 from core.audio.presets.base_preset import BasePreset
 
 class SquareFallPreset(BasePreset):
     """Burst of harmonics into a comb filter (square-fall)."""
+    _tables: dict = {}   # harmonics -> shared HarmTable
+
     def __init__(self, *, intensity: float = 0.5, freq: float = 200, harmonics: int = 6):
         super().__init__()
         self.intensity = intensity
         self.freq      = freq
         self.harmonics = harmonics
 
+    @classmethod
+    def _harm_table(cls, harmonics):
+        table = cls._tables.get(harmonics)
+        if table is None:
+            from pyo import HarmTable
+            table = cls._tables[harmonics] = HarmTable([1.0 / (i + 1) for i in range(harmonics)])
+        return table
+
     def play(self):
-        env   = Fader(fadein=0.01, fadeout=0.25, dur=0.25, mul=self.intensity).play()
-        burst = sum(Sine(freq=self.freq * (i+1), mul=env / (i+1))
-                    for i in range(self.harmonics))
-        IRPulse(input=burst, order=2048).out()
-        return burst
+        out = self._build()
+        self._keep(out).out()
+        return out
+
     def _build(self):
-        # envelope & additive burst
+        from pyo import Fader, IRPulse, Osc
+        # envelope & additive burst: one wavetable oscillator instead of a Sine per harmonic
         env = Fader(fadein=0.01, fadeout=0.25, dur=0.25, mul=self.intensity).play()
-        burst = sum(
-            Sine(freq=self.freq * (i + 1), mul=env / (i + 1))
-            for i in range(self.harmonics)
-        )
-        IRPulse(input=burst, order=2048).out()
-        return burst
\ No newline at end of file
+        burst = Osc(table=self._harm_table(self.harmonics), freq=self.freq, mul=env)
+        return IRPulse(input=burst, order=2048)
@@ -9,8 +9,17 @@ Emulates a bright brass sound with a characteristically brassy vibrato and warm
 Adoptez une vision tournée vers l’avenir!
 """
 
-from pyo import Sine, Fader, Chorus, ButLP, SigTo
-from core.audio.presets.base_preset import BasePreset
+from dataclasses import dataclass
+from core.audio.presets.base_preset import BasePreset, Chain
+
+@dataclass(slots=True)
+class TrumpetChain(Chain):
+    fader: object
+    freq_mod: object
+    vibrato: object
+    tone: object
+    filtered: object
+    chorus: object
 
 class Trumpet(BasePreset):
     def __init__(
@@ -43,6 +52,7 @@ class Trumpet(BasePreset):
         self.fade_in = fade_in
         self.fade_out = fade_out
         self.fader_mul_factor = fader_mul_factor
+        self._fader_mul = self.intensity * self.fader_mul_factor
 
         # SigTo (smooth freq) timing
         self.sigto_time_factor = sigto_time_factor
@@ -56,24 +66,23 @@ class Trumpet(BasePreset):
         self.chorus_bal = chorus_bal
 
     def _build(self):
+        from pyo import Sine, Fader, Chorus, ButLP, SigTo
         # amplitude envelope
         fader = Fader(
             fadein=self.fade_in,
             fadeout=self.fade_out,
             dur=self.duration,
-            mul=self.intensity * self.fader_mul_factor
+            mul=self._fader_mul
         )
         # smooth base frequency holder
         freq_mod = SigTo(
             value=self.base_freq,
             time=self.duration * self.sigto_time_factor
         )
-        # vibrato oscillator
-        vibrato = Sine(freq=self.vibrato_rate, mul=self.vibrato_depth)
-        # combine base freq and vibrato
-        modulated_freq = freq_mod + vibrato
+        # vibrato oscillator riding on the base freq (add= replaces a separate add node)
+        vibrato = Sine(freq=self.vibrato_rate, mul=self.vibrato_depth, add=freq_mod)
         # carrier tone
-        tone = Sine(freq=modulated_freq, mul=fader)
+        tone = Sine(freq=vibrato, mul=fader)
         # warm low-pass filter
         filtered = ButLP(tone, freq=self.lp_freq)
         # richness via chorus
@@ -84,19 +93,19 @@ class Trumpet(BasePreset):
             bal=self.chorus_bal
         )
 
-        self.chain = {
-            "fader": fader,
-            "freq_mod": freq_mod,
-            "vibrato": vibrato,
-            "tone": tone,
-            "filtered": filtered,
-            "chorus": chorus
-        }
+        self.chain = TrumpetChain(
+            fader=fader,
+            freq_mod=freq_mod,
+            vibrato=vibrato,
+            tone=tone,
+            filtered=filtered,
+            chorus=chorus
+        )
         return chorus
 
     def play(self):
         out = self._build()
-        self.chain["fader"].play()
+        self.chain.fader.play()
         out.out()
         return self.chain
 
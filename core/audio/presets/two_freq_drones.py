@@ -10,9 +10,15 @@ TwoFreqDrones – subtle, continuously-evolving dual-sine drone.
   when the engine really has to restart the preset.
 """
 
-from random import random
-from pyo import Sine, Fader, Sine as LFO
-from core.audio.presets.base_preset import BasePreset   # unchanged
+from dataclasses import dataclass
+from core.audio.presets.base_preset import BasePreset, Chain
+
+@dataclass(slots=True)
+class TwoFreqDronesChain(Chain):
+    gate: object
+    drift: object
+    oscs: object
+    mix: object
 
 class TwoFreqDrones(BasePreset):
     def __init__(
@@ -49,17 +55,8 @@ class TwoFreqDrones(BasePreset):
         # mixing
         self.mix_voices = mix_voices
 
-    def _drifting_osc(self, freq, amp):
-        """Band-limited LFO to drift the oscillator frequency ±drift_mul_ratio."""
-        drift = LFO(
-            freq=self.drift_speed,
-            phase=random(),
-            mul=freq * self.drift_mul_ratio,
-            add=freq
-        )
-        return Sine(freq=drift, mul=amp)
-
     def _build(self):
+        from pyo import Fader, Randi, Sine
         # gate fader for crossfade
         gate = Fader(
             fadein=self.fade,
@@ -68,15 +65,24 @@ class TwoFreqDrones(BasePreset):
             mul=self.intensity
         ).play()
 
-        # two drifting oscillators
-        osc_a = self._drifting_osc(self.base_freq, gate * self.osc_amp_factor)
-        osc_b = self._drifting_osc(self.base_freq * self.ratio, gate * self.osc_amp_factor)
+        # one band-limited random drift object, one stream per oscillator,
+        # each wandering ±drift_mul_ratio around its own centre frequency
+        freqs = [self.base_freq, self.base_freq * self.ratio]
+        drift = Randi(
+            min=-1,
+            max=1,
+            freq=self.drift_speed,
+            mul=[f * self.drift_mul_ratio for f in freqs],
+            add=freqs
+        )
+        # both drifting oscillators as a single two-stream Sine
+        oscs = Sine(freq=drift, mul=gate * self.osc_amp_factor)
 
-        # mix to stereo voices
-        mix = (osc_a + osc_b).mix(self.mix_voices)
+        # sum both oscillators, then spread to stereo voices
+        mix = oscs.mix(1).mix(self.mix_voices)
 
         # store chain
-        self.chain = {"gate": gate, "osc_a": osc_a, "osc_b": osc_b, "mix": mix}
+        self.chain = TwoFreqDronesChain(gate=gate, drift=drift, oscs=oscs, mix=mix)
         return mix
 
     def play(self):
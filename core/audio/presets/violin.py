@@ -9,8 +9,14 @@ Simulates a bowed string instrument using a sine oscillator with vibrato.
 Adoptez une vision tournée vers l’avenir!
 """
 
-from pyo import Sine, Fader
-from core.audio.presets.base_preset import BasePreset
+from dataclasses import dataclass
+from core.audio.presets.base_preset import BasePreset, Chain
+
+@dataclass(slots=True)
+class ViolinChain(Chain):
+    fader: object
+    vibrato: object
+    tone: object
 
 class Violin(BasePreset):
     def __init__(
@@ -33,29 +39,30 @@ class Violin(BasePreset):
         self.fade_in = 0.1
         self.fade_out = 0.5
         self.fader_mul_factor = 0.46
+        self._fader_mul = self.intensity * self.fader_mul_factor
         # storage for chain
-        self.chain = {}
+        self.chain = None
 
     def _build(self):
+        from pyo import Sine, Fader
         # amplitude envelope
         fader = Fader(
             fadein=self.fade_in,
             fadeout=self.fade_out,
             dur=self.duration,
-            mul=self.intensity * self.fader_mul_factor
+            mul=self._fader_mul
         )
-        # vibrato LFO
-        vibrato = Sine(freq=self.vibrato_rate, mul=self.vibrato_depth)
+        # vibrato LFO centred on the base pitch (offset applied in C via add=)
+        vibrato = Sine(freq=self.vibrato_rate, mul=self.vibrato_depth, add=self.base_freq)
         # modulated carrier
-        modulated_freq = self.base_freq + vibrato
-        tone = Sine(freq=modulated_freq, mul=fader)
-        self.chain = {"fader": fader, "vibrato": vibrato, "tone": tone}
+        tone = Sine(freq=vibrato, mul=fader)
+        self.chain = ViolinChain(fader=fader, vibrato=vibrato, tone=tone)
         return self.chain
 
     def play(self):
         chain = self._build()
-        chain["fader"].play()
-        chain["tone"].out()
+        chain.fader.play()
+        chain.tone.out()
         return chain
 
 if __name__ == "__main__":
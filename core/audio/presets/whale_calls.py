@@ -10,8 +10,13 @@ Provides a low–frequency whale call preset.
 Adoptez une vision tournée vers l’avenir!
 """
 
-from pyo import Sine, Fader
-from core.audio.presets.base_preset import BasePreset
+from dataclasses import dataclass
+from core.audio.presets.base_preset import BasePreset, Chain
+
+@dataclass(slots=True)
+class WhaleCallsChain(Chain):
+    fader: object
+    sine: object
 
 class WhaleCalls(BasePreset):
     def __init__(
@@ -33,25 +38,27 @@ class WhaleCalls(BasePreset):
         self.fade_in = fade_in
         self.fade_out = fade_out
         self.fader_mul_factor = fader_mul_factor
+        self._fader_mul = self.intensity * self.fader_mul_factor
         # storage for chain
-        self.chain = {}
+        self.chain = None
 
     def _build(self):
+        from pyo import Sine, Fader
         # amplitude envelope
         fader = Fader(
             fadein=self.fade_in,
             fadeout=self.fade_out,
             dur=self.duration,
-            mul=self.intensity * self.fader_mul_factor
+            mul=self._fader_mul
         )
         # carrier sine for whale call
         sine = Sine(freq=self.freq, mul=fader)
-        self.chain = {"fader": fader, "sine": sine}
+        self.chain = WhaleCallsChain(fader=fader, sine=sine)
         return sine
 
     def play(self):
         sine = self._build()
-        self.chain["fader"].play()
+        self.chain.fader.play()
         sine.out()
         return self.chain
 
@@ -11,8 +11,15 @@ Technique enhancements:
  • gentle tanh saturation with pre-filter antialiasing
 """
 
-from pyo import Sine, Noise, ButBP, ButHP, Biquad, Fader, SigTo, Tanh
-from core.audio.presets.base_preset import BasePreset
+from dataclasses import dataclass
+from core.audio.presets.base_preset import BasePreset, Chain
+
+@dataclass(slots=True)
+class WoodKickChain(Chain):
+    body_env: object
+    click_env: object
+    mix: object
+    out: object
 
 class WoodKick(BasePreset):
     def __init__(
@@ -67,13 +74,8 @@ class WoodKick(BasePreset):
         self.sat_hpf_q = sat_hpf_q
         self.sat_hpf_type = sat_hpf_type
 
-    def _body(self, env):
-        glide = self._sweep(
-            self.freq1,
-            self.freq2,
-            self.duration * self.body_sweep_ratio,
-            exp=False
-        )
+    def _body(self, env, glide):
+        from pyo import Sine, Biquad
         osc = Sine(freq=glide, mul=env * self.body_mul_factor)
         return Biquad(
             osc,
@@ -82,20 +84,28 @@ class WoodKick(BasePreset):
             type=self.body_hpf_type
         )
 
-    def _click(self):
-        env = Fader(
-            fadein=self.click_env_fadein,
-            fadeout=self.click_env_fadeout,
-            dur=self.click_env_dur,
-            mul=self.click_mul_factor * self.intensity
-        ).play()
+    def _click(self, env):
+        from pyo import Noise, ButBP, ButHP
         noise = Noise(mul=env)
         bp = ButBP(noise, freq=self.click_freq, q=self.click_bp_q)
         return ButHP(bp, freq=self.hp_cut)
 
     def _build(self):
+        from pyo import Biquad, Fader, Tanh
         env = self._env(.005)
-        mix = self._body(env) + self._click()
+        glide = self._sweep(
+            self.freq1,
+            self.freq2,
+            self.duration * self.body_sweep_ratio,
+            exp=False
+        )
+        click_env = Fader(
+            fadein=self.click_env_fadein,
+            fadeout=self.click_env_fadeout,
+            dur=self.click_env_dur,
+            mul=self.click_mul_factor * self.intensity
+        )
+        mix = self._body(env, glide) + self._click(click_env)
         sat = Tanh(mix * self.sat_mul)
         out = Biquad(
             sat,
@@ -103,15 +113,17 @@ class WoodKick(BasePreset):
             q=self.sat_hpf_q,
             type=self.sat_hpf_type
         )
-        self.chain = {"body_env": env, "mix": mix, "out": out}
+        self.chain = WoodKickChain(body_env=env, click_env=click_env,
+                                   mix=mix, out=out)
         return out
 
     def play(self):
-        out = self._build()
-        # start body envelope
-        self.chain["body_env"].play()
-        out.out()
-        return self.chain
+        chain = self._pooled_chain()
+        # retrigger both envelopes on the pooled graph
+        chain.body_env.play()
+        chain.click_env.play()
+        chain.out.out()
+        return chain
 
 if __name__ == "__main__":
     WoodKick().play()
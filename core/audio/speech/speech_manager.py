@@ -14,34 +14,93 @@ Adoptez une vision tournée vers l’avenir!
 import pyttsx3
 import queue
 import random
+import re
 import time
 import os
 import tempfile
-from threading import Thread
-from pyo import Server, SfPlayer, Harmonizer, Granulator, Freeverb, Disto, Degrade, Noise, ButLP
+import multiprocessing as mp
+from concurrent.futures import Future, ProcessPoolExecutor
+from collections import OrderedDict
+from threading import Lock, Thread
+from core.audio import shared_server, release_server
+from pyo import SfPlayer, SndTable, TableRead, Harmonizer, Granulator, Freeverb, Disto, Degrade, Noise, ButLP, Mixer, Selector
+
+# whitespace-delimited words longer than three characters
+_LONG_WORD = re.compile(r"(?<!\S)\S{4,}(?!\S)")
+
+def _stutter(m):
+    word = m.group(0)
+    return word[0] + "-" + word if random.random() < 0.2 else word
+
+_NOTHING = object()   # _drain_batch found the queue empty, nothing to carry
+
+_engine = None   # per-process pyttsx3 engine of a synthesis worker
+
+def _init_engine():
+    global _engine
+    _engine = pyttsx3.init()
+
+def _render_wav(text, voice_id, rate, volume, engine=None):
+    """Synthesize `text` into a temp wav with the given voice settings; returns its path."""
+    engine = engine or _engine
+    engine.setProperty('voice', voice_id)
+    engine.setProperty('rate', rate)
+    engine.setProperty('volume', volume)
+    with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp:
+        temp_filename = tmp.name
+    engine.save_to_file(text, temp_filename)
+    engine.runAndWait()
+    return temp_filename
 
 class SpeechManager:
+    CACHE_MAX_WORDS = 2                               # longer utterances are never cached
+    CACHE_MAX_ENTRIES = 64                            # least recently used tables are evicted past this
+    UNCACHED_STYLES = ("trembling", "long", "modem56k")  # randomised text, see _transform_text_for_effects
+
     def __init__(self, default_voice_id=None, default_rate=175, default_volume=1.0,
-                 sample_rate=44100, buffersize=512):
+                 sample_rate=44100, buffersize=512, cached_phrases=(), server=None,
+                 synth_processes=2):
         self.default_rate = default_rate
         self.default_volume = default_volume
         self.default_voice_id = default_voice_id
 
         self.speech_queue = queue.Queue()
+        self._play_queue = queue.Queue()   # (generation, job, context, cache key, label) in speech order
+        self._generation = 0               # bumped by stop_speaking() to drop in-flight items
+        self._gc_queue = queue.Queue()   # temp wavs waiting to be deleted
+        self._cache = OrderedDict()      # (text_lower, style) -> SndTable, least recently used first
+        self._cache_lock = Lock()        # the TTS thread reads it, the player thread fills it
 
         self.engine = pyttsx3.init()
         self.engine.setProperty('rate', self.default_rate)
         self.engine.setProperty('volume', self.default_volume)
         if self.default_voice_id:
             self.engine.setProperty('voice', self.default_voice_id)
+        self._style_table, self._default_style = self._build_style_table()
+
+        # synthesis workers with their own engines, so a burst renders in
+        # parallel; 0 keeps synthesis on the TTS thread's engine
+        self._synth_pool = None
+        if synth_processes:
+            self._synth_pool = ProcessPoolExecutor(synth_processes, mp_context=mp.get_context("spawn"),
+                                                   initializer=_init_engine)
 
         self.tts_thread = Thread(target=self._run_tts_engine, daemon=True)
         self.tts_thread.start()
+        self.player_thread = Thread(target=self._run_player, daemon=True)
+        self.player_thread.start()
+        self.janitor_thread = Thread(target=self._run_janitor, daemon=True)
+        self.janitor_thread.start()
 
-        self.server = Server(sr=sample_rate, buffersize=buffersize, nchnls=2).boot()
-        self.server.start()
+        # one pyo Server per process: reuse the given/shared one, boot only if none runs
+        if server is None:
+            self.server, self._owns_server = shared_server(sample_rate, buffersize), True
+        else:
+            self.server, self._owns_server = server, False
 
         self.current_player = None
+        self._fx = None   # shared reverb/modem stack, see _fx_stack()
+        self.precache(cached_phrases)
 
     def _determine_style(self, text, context):
         if context.get("modem", False):
@@ -63,46 +122,38 @@ class SpeechManager:
         return style
 
     def _transform_text_for_effects(self, text, style):
-        if style in ["trembling", "long", "modem56k"]:
-            return " ".join(word[0] + "-" + word if len(word) > 3 and random.random() < 0.2 else word
-                            for word in text.split())
+        if style in ("trembling", "long", "modem56k"):
+            return _LONG_WORD.sub(_stutter, text)
         return text
 
-    def _apply_tts_style(self, engine, style, text):
-        voices = engine.getProperty('voices')
-        if style == "robot":
-            robot_voice = next((v.id for v in voices if "robot" in v.name.lower()), (voices[0].id if voices else None))
-            engine.setProperty('voice', robot_voice)
-            engine.setProperty('rate', 150)
-        elif style == "short":
-            engine.setProperty('voice', voices[0].id if voices else self.default_voice_id)
-            engine.setProperty('rate', 200)
-        elif style == "long":
-            engine.setProperty('voice', voices[0].id if voices else self.default_voice_id)
-            engine.setProperty('rate', 170)
-        elif style == "calabiyau":
-            engine.setProperty('voice', voices[0].id if voices else self.default_voice_id)
-            engine.setProperty('rate', 160)
-        elif style == "trembling":
-            engine.setProperty('voice', voices[0].id if voices else self.default_voice_id)
-            engine.setProperty('rate', 180)
-        elif style == "repeat":
-            engine.setProperty('voice', voices[0].id if voices else self.default_voice_id)
-            engine.setProperty('rate', 180)
-        elif style == "humming":
-            engine.setProperty('voice', voices[0].id if voices else self.default_voice_id)
-            engine.setProperty('rate', 90)
-            engine.setProperty('volume', 0.8)
-            text = "♪ mmm mmm mmm ♪"
-        elif style == "modem56k":
-            engine.setProperty('voice', voices[0].id if voices else self.default_voice_id)
-            engine.setProperty('rate', 140)
-            engine.setProperty('volume', 0.9)
-        else:
-            engine.setProperty('voice', self.default_voice_id if self.default_voice_id else (voices[0].id if voices else ""))
-            engine.setProperty('rate', self.default_rate)
-            engine.setProperty('volume', self.default_volume)
-        return text
+    def _build_style_table(self):
+        """
+        Query the installed voices once and resolve every style to
+        (voice_id, rate, volume, text_override), so an utterance costs a
+        dict lookup instead of a voice scan through the TTS driver.
+        """
+        voices = self.engine.getProperty('voices')
+        first = voices[0].id if voices else self.default_voice_id
+        robot = next((v.id for v in voices if "robot" in v.name.lower()), (voices[0].id if voices else None))
+        vol = self.default_volume
+        table = {
+            "robot":     (robot, 150, vol, None),
+            "short":     (first, 200, vol, None),
+            "long":      (first, 170, vol, None),
+            "calabiyau": (first, 160, vol, None),
+            "trembling": (first, 180, vol, None),
+            "repeat":    (first, 180, vol, None),
+            "humming":   (first, 90, 0.8, "♪ mmm mmm mmm ♪"),
+            "modem56k":  (first, 140, 0.9, None),
+        }
+        default = (self.default_voice_id if self.default_voice_id else (voices[0].id if voices else ""),
+                   self.default_rate, self.default_volume, None)
+        return table, default
+
+    def _apply_tts_style(self, style, text):
+        """Returns (text, voice_id, rate, volume) for rendering `text` in `style`."""
+        voice_id, rate, volume, override = self._style_table.get(style, self._default_style)
+        return override or text, voice_id, rate, volume
 
     def _safe_remove(self, filename, attempts=10, delay=0.5):
         for _ in range(attempts):
@@ -113,76 +164,234 @@ class SpeechManager:
                 time.sleep(delay)
         print(f"Warning: Could not remove temporary file {filename} after {attempts} attempts.")
 
-    def _play_audio(self, filename, context):
+    def _run_janitor(self):
+        """
+        Delete finished temp files off the TTS thread. SfPlayer keeps its
+        own handle, so POSIX removes succeed at once; on Windows the file
+        stays locked while playing and _safe_remove retries here instead
+        of stalling the next utterance.
+        """
+        while True:
+            filename = self._gc_queue.get()
+            if filename is None:
+                break
+            self._safe_remove(filename)
+
+    def _cacheable(self, text, style):
+        return style not in self.UNCACHED_STYLES and len(text.split()) <= self.CACHE_MAX_WORDS
+
+    def _synthesize(self, text, style):
+        """
+        Start rendering `text` in `style`; returns (future of the wav path,
+        spoken text). Without a worker pool the future is already done.
+        """
+        text = self._transform_text_for_effects(text, style)
+        args = self._apply_tts_style(style, text)
+        if self._synth_pool is not None:
+            return self._synth_pool.submit(_render_wav, *args), args[0]
+        job = Future()
+        job.set_result(_render_wav(*args, engine=self.engine))
+        return job, args[0]
+
+    def _fx_stack(self):
+        """
+        Build the speech effects once: every utterance feeds one Mixer bus
+        into a single Freeverb, optionally through the modem chain, instead
+        of allocating its own reverb and filters.
+        """
+        if self._fx is None:
+            bus = Mixer(outs=1, chnls=1)
+            verb = Freeverb(bus[0], size=0.3, bal=0.4)
+            disto = Disto(verb, drive=0.8, slope=0.5, mul=0.8)
+            degrade = Degrade(disto, bitdepth=8, srscale=0.5)
+            hiss = Noise(mul=0.05)
+            modem = ButLP(degrade + hiss, freq=3000)
+            out = Selector([verb, modem], voice=0).out()
+            self._fx = (bus, verb, (disto, degrade, hiss, modem), out)
+        return self._fx
+
+    def _play_params(self, context):
+        """(playback style, pitch shift, idle, reverb size) that `context` selects in _play_audio."""
+        angle = context.get("global_angle", 0)
+        pitch_shift = 4 if angle > 1.0 else -4 if angle < -1.0 else 0
+        rev_amount = 0.3 if context.get("order_direction", 1) > 0 else 0.7
+        return self._determine_style("", context), pitch_shift, bool(context.get("idle", False)), rev_amount
+
+    def _play_audio(self, snd, context, source):
         if self.current_player is not None:
             self.current_player.stop()
-        snd = SfPlayer(filename, speed=1, loop=False)
-        style = self._determine_style("", context)
-        pitch_shift = 4 if context.get("global_angle", 0) > 1.0 else -4 if context.get("global_angle", 0) < -1.0 else 0
+        bus, verb, modem_nodes, out = self._fx_stack()
+        style, pitch_shift, idle, rev_amount = self._play_params(context)
         if pitch_shift:
             snd = Harmonizer(snd, transpo=pitch_shift)
-        if context.get("idle", False):
+        if idle:
             snd = Granulator(snd, grainSize=0.05, overlap=0.3, pitch=1.0, mul=0.8)
-        rev_amount = 0.3 if context.get("order_direction", 1) > 0 else 0.7
-        proc = Freeverb(snd, size=rev_amount, bal=0.4)
-        if style == "modem56k":
-            proc = Disto(proc, drive=0.8, slope=0.5, mul=0.8)
-            proc = Degrade(proc, bitdepth=8, srscale=0.5)
-            proc = proc + Noise(mul=0.05)
-            proc = ButLP(proc, freq=3000)
-        self.current_player = proc
-        proc.out()
-        print(f"Playing audio from {filename} with style '{style}'.")
+        verb.setSize(rev_amount)
+        # the modem chain only runs while a modem utterance needs it
+        modem = style == "modem56k"
+        for node in modem_nodes:
+            if modem:
+                node.play()
+            else:
+                node.stop()
+        out.setVoice(1 if modem else 0)
+        # re-using input key 0 replaces the previous utterance on the bus
+        bus.addInput(0, snd)
+        bus.setAmp(0, 0, 1)
+        self.current_player = snd
+        print(f"Playing audio from {source} with style '{style}'.")
+
+    def _drain_batch(self, text, style, context):
+        """
+        Pull queued utterances that share `style`, play back the same way
+        as `context` and are not cached, so a burst is synthesized with one
+        runAndWait() and played with one context. Returns the batch's texts
+        and the first queued item that did not fit, which may be the None
+        shutdown sentinel, or _NOTHING once the queue ran empty.
+        """
+        texts = [text]
+        params = self._play_params(context)
+        while True:
+            try:
+                nxt = self.speech_queue.get_nowait()
+            except queue.Empty:
+                return texts, _NOTHING
+            if (nxt is None or nxt[0] in ("__STOP__", "__CACHE__")
+                    or self._determine_style(*nxt) != style
+                    or self._play_params(nxt[1]) != params
+                    or (nxt[0].lower(), style) in self._cache):
+                return texts, nxt
+            texts.append(nxt[0])
 
     def _run_tts_engine(self):
+        carry = None   # (item, generation) pulled by _drain_batch that starts the next round
         while True:
             try:
-                item = self.speech_queue.get(block=True)
+                if carry is not None:
+                    (item, generation), carry = carry, None
+                    if (generation != self._generation and item is not None
+                            and item[0] != "__STOP__"):
+                        continue   # dropped by stop_speaking() after it was pulled
+                else:
+                    item = self.speech_queue.get(block=True)
                 if item is None:
                     break
                 text, context = item
                 if text == "__STOP__":
                     self.engine.stop()
-                    if self.current_player is not None:
-                        self.current_player.stop()
+                    self._play_queue.put((self._generation, None, None, None, "__STOP__"))
+                    continue
+                if text == "__CACHE__":
+                    phrase = context
+                    style = self._determine_style(phrase, {})
+                    key = (phrase.lower(), style)
+                    if self._cacheable(phrase, style) and key not in self._cache:
+                        job, _ = self._synthesize(phrase, style)
+                        self._play_queue.put((self._generation, job, None, key, "__CACHE__"))
                     continue
-                engine = self.engine
-                engine.setProperty('rate', self.default_rate)
-                engine.setProperty('volume', self.default_volume)
-                if self.default_voice_id:
-                    engine.setProperty('voice', self.default_voice_id)
                 style = self._determine_style(text, context)
-                text = self._transform_text_for_effects(text, style)
-                text = self._apply_tts_style(engine, style, text)
-                with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp:
-                    temp_filename = tmp.name
-                engine.save_to_file(text, temp_filename)
-                engine.runAndWait()
-                self._play_audio(temp_filename, context)
-                time.sleep(0.5)
-                self._safe_remove(temp_filename)
-                print(f"Utterance '{text}' processed.")
+                key = (text.lower(), style)
+                if self._cache_get(key) is not None:
+                    # cached short phrase: no synthesis, no file IO
+                    self._play_queue.put((self._generation, None, context, key, "cache"))
+                    print(f"Utterance '{text}' played from cache.")
+                    continue
+                generation = self._generation
+                texts, nxt = self._drain_batch(text, style, context)
+                if nxt is not _NOTHING:
+                    carry = (nxt, generation)
+                job, spoken = self._synthesize(", ".join(texts), style)
+                cache_key = key if len(texts) == 1 and self._cacheable(text, style) else None
+                self._play_queue.put((generation, job, context, cache_key, spoken))
+                print(f"Utterance '{spoken}' processed.")
             except queue.Empty:
                 continue
 
+    def _cache_get(self, key):
+        """Cached SndTable for `key`, marked most recently used, or None."""
+        with self._cache_lock:
+            table = self._cache.get(key)
+            if table is not None:
+                self._cache.move_to_end(key)
+            return table
+
+    def _cache_put(self, key, table):
+        """Cache `table` under `key`, evicting the least recently used past CACHE_MAX_ENTRIES."""
+        with self._cache_lock:
+            self._cache[key] = table
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.CACHE_MAX_ENTRIES:
+                self._cache.popitem(last=False)
+
+    def _run_player(self):
+        """
+        Play rendered utterances in the order they were queued, waiting on
+        each synthesis job in turn while later ones render in parallel.
+        """
+        while True:
+            item = self._play_queue.get()
+            if item is None:
+                break
+            generation, job, context, key, label = item
+            if label == "__STOP__":
+                if self.current_player is not None:
+                    self.current_player.stop()
+                continue
+            try:
+                temp_filename = job.result() if job is not None else None
+            except Exception as e:
+                print(f"Speech synthesis failed: {e}")
+                continue
+            if key is not None and temp_filename is not None:
+                self._cache_put(key, SndTable(temp_filename))
+            if label == "__CACHE__" or generation != self._generation:
+                # warm-up only, or dropped by stop_speaking()
+                if temp_filename is not None:
+                    self._gc_queue.put(temp_filename)
+                continue
+            if key is not None:
+                table = self._cache_get(key)
+                if table is None:
+                    print(f"Cached utterance {key[0]!r} was evicted before playback.")
+                    continue
+                snd = TableRead(table, freq=table.getRate(), loop=False)
+            else:
+                snd = SfPlayer(temp_filename, speed=1, loop=False)
+            # only once the table/player has opened it: POSIX removes at once
+            if temp_filename is not None:
+                self._gc_queue.put(temp_filename)
+            self._play_audio(snd, context, temp_filename or "cache")
+
     def speak(self, text, context=None):
         if context is None:
             context = {}
         self.speech_queue.put((text, context))
         print(f"Queued text: {text}")
 
+    def precache(self, phrases):
+        """Synthesize short recurring phrases in the background so later speak()s skip pyttsx3."""
+        for phrase in phrases:
+            self.speech_queue.put(("__CACHE__", phrase))
+
     def stop_speaking(self):
         try:
             while True:
                 self.speech_queue.get_nowait()
         except queue.Empty:
             pass
+        self._generation += 1
         self.speech_queue.put(("__STOP__", {}))
         print("Stop command issued.")
 
     def shutdown(self):
         self.speech_queue.put(None)
         self.tts_thread.join(timeout=2)
-        self.server.stop()
-        self.server.shutdown()
+        self._play_queue.put(None)
+        self.player_thread.join(timeout=2)
+        if self._synth_pool is not None:
+            self._synth_pool.shutdown(wait=False, cancel_futures=True)
+        self._gc_queue.put(None)
+        self.janitor_thread.join(timeout=2)
+        if self._owns_server:
+            release_server(self.server)
         print("Shutdown complete.")
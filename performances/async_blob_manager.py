@@ -1,59 +1,97 @@
 #File:  src/performances/async_blob_manager.py © 2025 projectemergence. All rights reserved.
 # File:  src/performances/async_blob_manager.py
+import gzip
 import json
 import asyncio
 import aiohttp
 from async_hyper_manager import AsyncHyperManager
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def _dumps(data) -> bytes:
+    # OPT_NON_STR_KEYS: accept the int/float keys json.dumps coerces to strings
+    return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS) if orjson else json.dumps(data).encode()
+
+_loads = orjson.loads if orjson else json.loads
+
 JSONBLOB_BASE = "https://jsonblob.com/api/jsonBlob"
+JSON_HEADERS = {"Accept": "application/json", "Content-Type": "application/json"}
+GZIP_HEADERS = {"Content-Encoding": "gzip"}
 
 class AsyncBlobManager:
     """Async version of BlobManager, using aiohttp & AsyncHyperManager for pooling."""
 
-    def __init__(self, blob_id: str | None = "1294281086207909888"):
+    def __init__(self, blob_id: str | None = "1294281086207909888", *,
+                 gzip_uploads: bool = False, gzip_min_bytes: int = 1024):
         self.blob_id = blob_id
         self.base = f"{JSONBLOB_BASE}/{blob_id}" if blob_id else JSONBLOB_BASE
         self._session: aiohttp.ClientSession | None = None
+        self._etag: str | None = None      # validator of the last GET
+        self._cached: bytes | None = None  # raw body of the last GET, parsed per call
+        # opt-in: only for endpoints that accept Content-Encoding: gzip bodies
+        self.gzip_uploads = gzip_uploads
+        self.gzip_min_bytes = gzip_min_bytes
         self._mgr = AsyncHyperManager(max_threads=10, max_processes=2)
 
-    async def _session(self) -> aiohttp.ClientSession:
+    async def _get_session(self) -> aiohttp.ClientSession:
         if not self._session or self._session.closed:
-            self._session = aiohttp.ClientSession()
+            # keep connections and DNS answers warm between blob ops
+            connector = aiohttp.TCPConnector(limit=20, ttl_dns_cache=300, keepalive_timeout=60)
+            self._session = aiohttp.ClientSession(connector=connector, headers=JSON_HEADERS)
         return self._session
 
     async def create_blob(self, data: dict) -> str | None:
-        session = await self._session()
-        async with session.post(JSONBLOB_BASE, json=data) as resp:
+        session = await self._get_session()
+        async with session.post(JSONBLOB_BASE, data=_dumps(data)) as resp:
             if resp.status == 201:
                 loc = resp.headers.get("Location", "")
                 self.blob_id = loc.rsplit("/", 1)[-1]
                 self.base = f"{JSONBLOB_BASE}/{self.blob_id}"
+                self._etag = self._cached = None
                 return self.blob_id
             return None
 
     async def get_blob(self) -> dict | None:
         if not self.blob_id:
             return None
-        session = await self._session()
-        async with session.get(self.base) as resp:
-            return await resp.json() if resp.status == 200 else None
+        session = await self._get_session()
+        headers = {"If-None-Match": self._etag} if self._etag else None
+        async with session.get(self.base, headers=headers) as resp:
+            if resp.status == 304 and self._cached is not None:
+                return _loads(self._cached)
+            if resp.status != 200:
+                return None
+            self._cached = await resp.read()
+            self._etag = resp.headers.get("ETag")
+            return _loads(self._cached)
 
     async def update_blob(self, data: dict) -> bool:
         if not self.blob_id:
             return False
-        session = await self._session()
-        async with session.put(self.base, json=data) as resp:
-            return resp.status == 200
+        body = _dumps(data)
+        payload, headers = body, None
+        if self.gzip_uploads and len(body) >= self.gzip_min_bytes:
+            payload, headers = gzip.compress(body, compresslevel=1), GZIP_HEADERS
+        session = await self._get_session()
+        async with session.put(self.base, data=payload, headers=headers) as resp:
+            ok = resp.status == 200
+            if ok:
+                self._etag = self._cached = None
+            return ok
 
     async def delete_blob(self) -> bool:
         if not self.blob_id:
             return False
-        session = await self._session()
+        session = await self._get_session()
         async with session.delete(self.base) as resp:
             ok = resp.status == 200
             if ok:
                 self.blob_id = None
                 self.base = JSONBLOB_BASE
+                self._etag = self._cached = None
             return ok
 
     async def close(self):
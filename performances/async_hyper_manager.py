@@ -4,13 +4,28 @@ import asyncio
 import functools
 import logging
 from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
-from typing import Optional
+from multiprocessing import get_context, shared_memory
+from typing import Literal, Optional
+
+def _call_with_shared(fn, shm_name, shape, dtype, *args, **kwargs):
+    """
+    Process-pool side of schedule_shared(): attach to the shared block and
+    call fn(array, ...). The array is a view on the block, so fn must not
+    return it (or a view of it).
+    """
+    import numpy as np
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        return fn(np.ndarray(shape, dtype=dtype, buffer=shm.buf), *args, **kwargs)
+    finally:
+        shm.close()
 
 class AsyncHyperManager:
     """
     Async “hyper” manager for tasks:
       - pure coroutines run on the loop
-      - sync callables auto-offloaded to thread/process pools
+      - sync callables auto-offloaded to thread/process pools,
+        or run inline on the loop when they are too cheap to hand off
       - max concurrency via semaphore
       - dynamic start/stop/list/cancel/await
     """
@@ -25,7 +40,8 @@ class AsyncHyperManager:
         self.logger = logger or logging.getLogger(__name__)
         cpu = os.cpu_count() or 1
         self.thread_executor  = ThreadPoolExecutor(max_threads or cpu)
-        self.process_executor = ProcessPoolExecutor(max_processes or cpu)
+        self.process_executor: ProcessPoolExecutor | None = None   # spawned on first use
+        self._max_processes = max_processes or max(1, cpu - 1)   # leave a core for the loop
         # bind our semaphore to this loop
         self.semaphore = asyncio.Semaphore(max_threads or cpu)
         self._tasks: dict[str, asyncio.Task] = {}
@@ -35,38 +51,76 @@ class AsyncHyperManager:
                        name: str,
                        fn: callable,
                        *args,
-                       kind: str = "thread",
+                       kind: Literal["inline", "thread", "process"] = "thread",
                        **kwargs) -> None:
-        async with self._lock:
-            if name in self._tasks:
-                self.logger.warning(f"Task '{name}' exists, skipping")
-                return
-            await self.semaphore.acquire()
-            if asyncio.iscoroutinefunction(fn):
-                task = self.loop.create_task(self._runner(name, fn, *args, **kwargs))
-            else:
-                pool = self.thread_executor if kind == "thread" else self.process_executor
-                task = self.loop.create_task(
-                    self._runner(name,
-                                 lambda *a, **k: self.loop.run_in_executor(pool, functools.partial(fn, *a, **k)),
+        # no await between the check and the insert, so no lock is needed;
+        # the concurrency slot is taken inside _runner, schedule never blocks
+        if name in self._tasks:
+            self.logger.warning(f"Task '{name}' exists, skipping")
+            return
+        if asyncio.iscoroutinefunction(fn):
+            task = self.loop.create_task(self._runner(name, fn, *args, **kwargs))
+        elif kind == "inline":
+            async def _inline(*a, **k):
+                return fn(*a, **k)
+            task = self.loop.create_task(self._runner(name, _inline, *args, **kwargs))
+        else:
+            pool = self.thread_executor if kind == "thread" else self._process_pool()
+            task = self.loop.create_task(
+                self._runner(name,
+                             lambda *a, **k: self.loop.run_in_executor(pool, functools.partial(fn, *a, **k)),
+                             *args, **kwargs)
+            )
+        self._tasks[name] = task
+
+    async def schedule_shared(self, name: str, fn: callable, arr, *args, **kwargs) -> None:
+        """
+        Process-pool variant of schedule() for numpy payloads: `arr` is
+        copied once into shared memory and the worker receives only its
+        name, shape and dtype, instead of the array being pickled through
+        the pool's pipe. The block is unlinked when the task ends.
+        """
+        if name in self._tasks:
+            self.logger.warning(f"Task '{name}' exists, skipping")
+            return
+        import numpy as np
+        arr = np.ascontiguousarray(arr)
+        shm = shared_memory.SharedMemory(create=True, size=max(arr.nbytes, 1))
+        np.ndarray(arr.shape, dtype=arr.dtype, buffer=shm.buf)[...] = arr
+        call = functools.partial(_call_with_shared, fn, shm.name, arr.shape, arr.dtype.str,
                                  *args, **kwargs)
-                )
-            self._tasks[name] = task
+
+        async def _shared():
+            return await self.loop.run_in_executor(self._process_pool(), call)
+
+        def _release(_task):
+            shm.close()
+            shm.unlink()
+
+        await self.schedule(name, _shared)
+        # a done-callback also fires for tasks cancelled before they start
+        self._tasks[name].add_done_callback(_release)
+
+    def _process_pool(self) -> ProcessPoolExecutor:
+        if self.process_executor is None:
+            # forkserver children start lean instead of copying this process's RSS
+            ctx = get_context("forkserver") if os.name == "posix" else None
+            self.process_executor = ProcessPoolExecutor(self._max_processes, mp_context=ctx)
+        return self.process_executor
 
     async def _runner(self, name: str, coro_fn: callable, *args, **kwargs):
-        self.logger.info(f"▶ Starting '{name}'")
         try:
-            return await coro_fn(*args, **kwargs)
+            async with self.semaphore:
+                self.logger.info(f"▶ Starting '{name}'")
+                return await coro_fn(*args, **kwargs)
         except asyncio.CancelledError:
             self.logger.info(f"✖ Cancelled '{name}'")
             raise
         except Exception as e:
             self.logger.exception(f"‼ Exception in '{name}': {e}")
         finally:
-            async with self._lock:
-                self._tasks.pop(name, None)
-                self.semaphore.release()
-                self.logger.info(f"✔ Finished '{name}'")
+            self._tasks.pop(name, None)
+            self.logger.info(f"✔ Finished '{name}'")
 
     def list_tasks(self) -> list[str]:
         return list(self._tasks.keys())
@@ -84,12 +138,15 @@ class AsyncHyperManager:
 
     async def shutdown(self) -> None:
         """Cancel & await all tasks, then tear down executors."""
-        async with self._lock:
-            for t in self._tasks.values():
-                t.cancel()
-        await asyncio.gather(*self._tasks.values(), return_exceptions=True)
-        self.thread_executor.shutdown(wait=False)
-        self.process_executor.shutdown(wait=False)
+        # snapshot first: each runner's finally pops itself from _tasks
+        tasks = list(self._tasks.values())
+        for t in tasks:
+            t.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        # drop queued pool work instead of draining it
+        self.thread_executor.shutdown(wait=False, cancel_futures=True)
+        if self.process_executor is not None:
+            self.process_executor.shutdown(wait=False, cancel_futures=True)
 
     def close(self):
         """
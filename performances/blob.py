@@ -3,13 +3,36 @@ import os
 import configparser
 import requests
 import json
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def _dumps(data) -> bytes:
+    # OPT_NON_STR_KEYS: accept the int/float keys json.dumps coerces to strings
+    return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS) if orjson else json.dumps(data).encode()
+
+_loads = orjson.loads if orjson else json.loads
 
 # Constants for JSON Blob
 JSONBLOB_API_URL = "https://jsonblob.com/api/jsonBlob"
 
+def _make_session():
+    """One keep-alive session for every BlobManager: pooled TLS connections plus retries on gateway errors."""
+    session = requests.Session()
+    retries = Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+    session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=4, max_retries=retries))
+    session.headers.update({"Content-Type": "application/json", "Accept": "application/json"})
+    return session
+
 class BlobManager:
     """Handles interactions with JSON Blob."""
 
+    _session = _make_session()
+
     def __init__(self, blob_id="1294281086207909888"):
         """
         Initialize the BlobManager with an optional blob ID.
@@ -17,6 +40,9 @@ class BlobManager:
         """
         self.blob_id = blob_id
         self.base_url = JSONBLOB_API_URL if not blob_id else f"{JSONBLOB_API_URL}/{self.blob_id}"
+        # last GET's validator and raw body, for conditional re-fetches
+        self._etag = None
+        self._cached = None
 
     def create_blob(self, data):
         """
@@ -29,15 +55,15 @@ class BlobManager:
             str: The blob ID if creation is successful, else None.
         """
         try:
-            response = requests.post(
+            response = self._session.post(
                 JSONBLOB_API_URL,
-                headers={"Content-Type": "application/json", "Accept": "application/json"},
-                data=json.dumps(data)
+                data=_dumps(data)
             )
             if response.status_code == 201:
                 location = response.headers.get('Location', '')
                 self.blob_id = location.split('/')[-1]
                 self.base_url = f"{JSONBLOB_API_URL}/{self.blob_id}"
+                self._invalidate()
                 print(f"Blob created successfully with ID: {self.blob_id}")
                 return self.blob_id
             else:
@@ -50,6 +76,9 @@ class BlobManager:
     def get_blob(self):
         """
         Retrieve the current JSON Blob data.
+        Sends If-None-Match with the last ETag, so an unchanged blob costs
+        a 304 and re-parses the previously fetched body, so callers never
+        share (and mutate) one cached object.
 
         Returns:
             dict: The JSON data if retrieval is successful, else None.
@@ -58,14 +87,16 @@ class BlobManager:
             print("Blob ID is not set.")
             return None
 
+        headers = {"If-None-Match": self._etag} if self._etag else None
         try:
-            response = requests.get(
-                self.base_url,
-                headers={"Accept": "application/json"}
-            )
+            response = self._session.get(self.base_url, headers=headers)
+            if response.status_code == 304 and self._cached is not None:
+                return _loads(self._cached)
             if response.status_code == 200:
                 #print("Blob retrieved successfully.")
-                return response.json()
+                self._cached = response.content
+                self._etag = response.headers.get("ETag")
+                return _loads(self._cached)
             elif response.status_code == 404:
                 print("Blob not found.")
                 return None
@@ -91,13 +122,13 @@ class BlobManager:
             return False
 
         try:
-            response = requests.put(
+            response = self._session.put(
                 self.base_url,
-                headers={"Content-Type": "application/json", "Accept": "application/json"},
-                data=json.dumps(data)
+                data=_dumps(data)
             )
             if response.status_code == 200:
                 #print("Blob updated successfully.")
+                self._invalidate()
                 return True
             elif response.status_code == 404:
                 print("Blob not found.")
@@ -121,14 +152,12 @@ class BlobManager:
             return False
 
         try:
-            response = requests.delete(
-                self.base_url,
-                headers={"Accept": "application/json"}
-            )
+            response = self._session.delete(self.base_url)
             if response.status_code == 200:
                 print("Blob deleted successfully.")
                 self.blob_id = None
                 self.base_url = JSONBLOB_API_URL
+                self._invalidate()
                 return True
             elif response.status_code == 404:
                 print("Blob not found.")
@@ -155,13 +184,10 @@ class BlobManager:
         """
         custom_url = f"https://jsonblob.com/api/{custom_path}"
         try:
-            response = requests.get(
-                custom_url,
-                headers={"Accept": "application/json"}
-            )
+            response = self._session.get(custom_url)
             if response.status_code == 200:
                 print("Blob retrieved successfully using custom URL.")
-                return response.json()
+                return _loads(response.content)
             elif response.status_code == 404:
                 print("Blob not found at the custom URL.")
                 return None
@@ -181,4 +207,10 @@ class BlobManager:
         """
         self.blob_id = blob_id
         self.base_url = f"{JSONBLOB_API_URL}/{self.blob_id}"
+        self._invalidate()
         print(f"Blob ID set to: {self.blob_id}")
+
+    def _invalidate(self):
+        """Forget the cached GET after any write or blob switch."""
+        self._etag = None
+        self._cached = None
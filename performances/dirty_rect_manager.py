@@ -11,6 +11,15 @@ class DirtyRectManager:
       • flush()   – pygame.display.update() on all due rects
     Everything else (buckets, history, frame-skip) is internal.
     """
+    COALESCE_MIN = 32     # merge neighbouring rects once a frame has this many
+    COALESCE_SLACK = 1.2  # allowed union area / summed area for a merge
+
+    def __new__(cls, frame_skip: int = 1, hold_frames: int = 1):
+        # no frame-skip: one bucket, so add() needs no modulo routing
+        if cls is DirtyRectManager and frame_skip <= 1:
+            cls = _SingleBucketDirtyRectManager
+        return super().__new__(cls)
+
     def __init__(self, frame_skip: int = 1, hold_frames: int = 1):
         self._fs = max(1, frame_skip)
         self._hg = max(0, hold_frames)
@@ -18,11 +27,16 @@ class DirtyRectManager:
         self._hist = deque(maxlen=self._hg + 1)
         for _ in range(self._hg + 1): self._hist.append([])
         self._fi = 0
+        self._scratch: list[pygame.Rect] = []   # reused by flush()
 
     def update(self):
         """Rotate: move current bucket → history, clear it, advance frame index."""
+        # the list falling out of the full history becomes the new bucket,
+        # so rotating allocates nothing
+        old = self._hist[0]
         self._hist.append(self._buckets[self._fi])
-        self._buckets[self._fi] = []
+        old.clear()
+        self._buckets[self._fi] = old
         self._fi = (self._fi + 1) % self._fs
 
     def add(self, rect: pygame.Rect, p: int = 0):
@@ -41,9 +55,50 @@ class DirtyRectManager:
 
     def flush(self):
         """Gather history + current bucket, issue a single pygame.display.update()."""
-        rects = []
+        rects = self._scratch
+        rects.clear()
         for past in self._hist:
             rects.extend(past)
         rects.extend(self._buckets[self._fi])
+        if len(rects) > self.COALESCE_MIN:
+            rects = self._coalesce(rects)
         if rects:
             pygame.display.update(rects)
+
+    def _coalesce(self, rects):
+        """
+        Greedy x-sorted merge: a rect joins the previous one when their
+        union wastes little area, so clustered small rects become one
+        SDL update. Returns new Rects; the queued ones are left untouched.
+        """
+        rects.sort(key=lambda r: r.x)
+        slack = self.COALESCE_SLACK
+        merged = [rects[0]]
+        for r in rects[1:]:
+            last = merged[-1]
+            u = last.union(r)
+            if u.w * u.h <= slack * (last.w * last.h + r.w * r.h):
+                merged[-1] = u
+            else:
+                merged.append(r)
+        return merged
+
+
+class _SingleBucketDirtyRectManager(DirtyRectManager):
+    """frame_skip == 1 specialisation: every rect lands in the one current bucket."""
+    def __init__(self, frame_skip: int = 1, hold_frames: int = 1):
+        super().__init__(frame_skip, hold_frames)
+        self._cur = self._buckets[0]
+
+    def update(self):
+        old = self._hist[0]
+        self._hist.append(self._cur)
+        old.clear()
+        self._cur = self._buckets[0] = old
+
+    def add(self, rect: pygame.Rect, p: int = 0):
+        self._cur.append(rect)
+
+    def draw(self, target: pygame.Surface, surf: pygame.Surface,
+             pos: tuple[int,int]=(0,0), p: int = 0):
+        self._cur.append(target.blit(surf, pos))
@@ -12,43 +12,285 @@ Features:
 - Does not display real-time graphs; instead, it generates a full report (printed to console and saved as CSV)
   after the game run ends or if a crash occurs.
 - Scans all .py files in src for cyclomatic complexity using radon.
-- Exports CSV reports for both runtime metrics and source code complexity.
+- Exports the runtime metrics report as Feather (default), Parquet or CSV, and the
+  source code complexity report as CSV.
 
 Dependencies:
 - psutil
 - pandas
 - radon
-- GPUtil (install via 'pip install GPUtil' for GPU monitoring)
+- pynvml (preferred for GPU monitoring) or GPUtil (install via 'pip install GPUtil')
+- watchdog (optional: cache folders are tracked from filesystem events instead of re-scanned)
+- pyarrow (for Feather/Parquet metrics reports and streamed session samples; CSV is written without it)
 """
 
 import os
+import ast
 import sys
 import time
 import threading
 import subprocess
 import argparse
+import atexit
 import psutil
-import tracemalloc
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
 import pandas as pd
-from radon.complexity import cc_visit
+from radon.complexity import cc_visit_ast
+from source_dirs import EXCLUDED_DIRS
+
+try:
+    import pynvml
+    pynvml.nvmlInit()
+    # NVML handles are resolved once; a sample is then one C call per GPU
+    _GPUS = [pynvml.nvmlDeviceGetHandleByIndex(i)
+             for i in range(pynvml.nvmlDeviceGetCount())]
+    atexit.register(pynvml.nvmlShutdown)
+except Exception:
+    _GPUS = None
 
 try:
     import GPUtil
 except ImportError:
     GPUtil = None
 
-# Global dictionary to collect metrics over time.
-metrics_data = {
-    "timestamp": [],
-    "cpu": [],
-    "memory": [],
-    "gpu": [],
-    "cache_count": [],
-    "cache_size": []
-}
+try:
+    from watchdog.observers import Observer
+except ImportError:
+    Observer = None
+
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None
+
+class MetricsBuffer:
+    """
+    Column store for the per-second samples: one preallocated typed array
+    per metric, doubled when full, so a long session keeps no per-sample
+    Python floats and to_dataframe() hands pandas the arrays directly.
+    """
+    COLUMNS = {
+        "timestamp": np.float64,
+        "cpu": np.float64,
+        "memory": np.float64,
+        "gpu": np.float64,
+        "cache_count": np.int32,
+        "cache_size": np.float64,
+    }
+
+    def __init__(self, capacity=4096):
+        self.n = 0
+        self._cols = {k: np.empty(capacity, dtype=t) for k, t in self.COLUMNS.items()}
+
+    def append(self, timestamp, cpu, memory, gpu, cache_count, cache_size):
+        n = self.n
+        cols = self._cols
+        if n == len(cols["timestamp"]):
+            for k, arr in cols.items():
+                grown = np.empty(2 * n, dtype=arr.dtype)
+                grown[:n] = arr
+                cols[k] = grown
+        cols["timestamp"][n] = timestamp
+        cols["cpu"][n] = cpu
+        cols["memory"][n] = memory
+        cols["gpu"][n] = gpu
+        cols["cache_count"][n] = cache_count
+        cols["cache_size"][n] = cache_size
+        self.n = n + 1
+
+    def to_dataframe(self):
+        return pd.DataFrame({k: arr[:self.n] for k, arr in self._cols.items()})
+
+class ArrowMetricsWriter(MetricsBuffer):
+    """
+    MetricsBuffer for long sessions: every `batch_rows` samples are written
+    as one record batch to an Arrow IPC stream and the arrays are reused, so
+    memory stays bounded and a crash keeps every batch already written.
+    Requires pyarrow.
+    """
+    def __init__(self, path, batch_rows=1024):
+        super().__init__(batch_rows)
+        self.path = path
+        self._schema = pa.schema([(k, pa.from_numpy_dtype(np.dtype(t))) for k, t in self.COLUMNS.items()])
+        self._sink = pa.OSFile(path, "wb")
+        self._writer = pa.ipc.new_stream(self._sink, self._schema)
+
+    def append(self, *sample):
+        super().append(*sample)
+        if self.n == len(self._cols["timestamp"]):
+            self.flush()
+
+    def flush(self):
+        if self.n and self._writer:
+            # write_batch serialises immediately, so the arrays can be refilled
+            self._writer.write_batch(pa.record_batch(
+                [arr[:self.n] for arr in self._cols.values()], schema=self._schema))
+            self.n = 0
+
+    def close(self):
+        if self._writer:
+            self.flush()
+            self._writer.close()
+            self._sink.close()
+            self._writer = None
+
+    def to_dataframe(self):
+        self.close()
+        with pa.OSFile(self.path, "rb") as src:
+            return pa.ipc.open_stream(src).read_pandas()
+
+class CacheScanner:
+    """
+    Aggregates file count and size of every folder with 'cache' in its name
+    (case-insensitive) under src_dir. The folders are discovered once (and
+    re-discovered every `rediscover_every` samples); each sample then walks
+    only those folders with os.scandir, taking sizes from the DirEntry
+    instead of separate isfile/getsize calls.
+    """
+    def __init__(self, src_dir, rediscover_every=30):
+        self.src_dir = src_dir
+        self.rediscover_every = rediscover_every
+        self._cache_roots = []
+        self._samples = 0
+
+    def _discover(self):
+        roots = []
+        stack = [self.src_dir]
+        while stack:
+            try:
+                with os.scandir(stack.pop()) as it:
+                    for entry in it:
+                        if not entry.is_dir(follow_symlinks=False):
+                            continue
+                        if "cache" in entry.name.lower():
+                            roots.append(entry.path)   # its subfolders are counted with it
+                        else:
+                            stack.append(entry.path)
+            except OSError:
+                continue
+        self._cache_roots = roots
+
+    @staticmethod
+    def _tree_totals(path):
+        count = size = 0
+        stack = [path]
+        while stack:
+            try:
+                with os.scandir(stack.pop()) as it:
+                    for entry in it:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.is_file():
+                            count += 1
+                            size += entry.stat().st_size
+            except OSError:
+                continue   # folder vanished between listing and scanning
+        return count, size
+
+    def sample(self):
+        """Returns (file_count, total_size_mb) across all cache folders."""
+        if self._samples % self.rediscover_every == 0:
+            self._discover()
+        self._samples += 1
+        file_count = total_size = 0
+        for root in self._cache_roots:
+            count, size = self._tree_totals(root)
+            file_count += count
+            total_size += size
+        return file_count, total_size / (1024 * 1024)
+
+    def stop(self):
+        pass
+
+class CacheWatcher:
+    """
+    Event-driven CacheScanner: one scandir pass seeds a path -> size map,
+    then a recursive watchdog observer on src_dir keeps it current, so a
+    sample only reads two counters. Requires watchdog.
+    """
+    def __init__(self, src_dir):
+        self.src_dir = os.path.abspath(src_dir)
+        self._sizes = {}
+        self._total = 0
+        self._lock = threading.Lock()
+        scanner = CacheScanner(self.src_dir)
+        scanner._discover()
+        for root in scanner._cache_roots:
+            self._seed(root)
+        self._observer = Observer()
+        self._observer.schedule(self, self.src_dir, recursive=True)
+        self._observer.start()
+
+    def _in_cache(self, path):
+        parts = os.path.relpath(path, self.src_dir).split(os.sep)[:-1]
+        return any("cache" in part.lower() for part in parts)
+
+    def _set(self, path, size):
+        with self._lock:
+            self._total += size - self._sizes.get(path, 0)
+            self._sizes[path] = size
+
+    def _drop(self, path):
+        with self._lock:
+            self._total -= self._sizes.pop(path, 0)
+
+    def _drop_tree(self, path):
+        prefix = path + os.sep
+        with self._lock:
+            for p in [p for p in self._sizes if p.startswith(prefix)]:
+                self._total -= self._sizes.pop(p)
+
+    def _seed(self, path):
+        stack = [path]
+        while stack:
+            try:
+                with os.scandir(stack.pop()) as it:
+                    for entry in it:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.is_file():
+                            self._set(entry.path, entry.stat().st_size)
+            except OSError:
+                continue
+
+    def _refresh(self, path):
+        if not self._in_cache(path):
+            return
+        try:
+            self._set(path, os.stat(path).st_size)
+        except OSError:
+            self._drop(path)
+
+    def dispatch(self, event):
+        """watchdog callback (observer thread): apply one filesystem event."""
+        kind = event.event_type
+        if event.is_directory:
+            if kind in ("deleted", "moved"):
+                self._drop_tree(event.src_path)
+            if kind in ("created", "moved"):
+                target = event.dest_path if kind == "moved" else event.src_path
+                # files may land before the watch on a new folder is active
+                if "cache" in os.path.relpath(target, self.src_dir).lower():
+                    self._seed(target)
+            return
+        if kind == "deleted":
+            self._drop(event.src_path)
+        elif kind == "moved":
+            self._drop(event.src_path)
+            self._refresh(event.dest_path)
+        elif kind in ("created", "modified", "closed"):
+            self._refresh(event.src_path)
 
-# Flag to control monitoring loop.
-monitoring_active = True
+    def sample(self):
+        """Returns (file_count, total_size_mb) across all cache folders."""
+        with self._lock:
+            return len(self._sizes), self._total / (1024 * 1024)
+
+    def stop(self):
+        self._observer.stop()
+        self._observer.join()
 
 def get_all_cache_metrics(src_dir):
     """
@@ -57,118 +299,222 @@ def get_all_cache_metrics(src_dir):
       - total file count
       - total size in MB of all files within those folders.
     """
-    total_size = 0
-    file_count = 0
-    for root, dirs, _ in os.walk(src_dir):
-        for d in dirs:
-            if "cache" in d.lower():
-                cache_path = os.path.join(root, d)
-                for r, _, files in os.walk(cache_path):
-                    file_count += len(files)
-                    for f in files:
-                        f_path = os.path.join(r, f)
-                        if os.path.isfile(f_path):
-                            total_size += os.path.getsize(f_path)
-    total_size_mb = total_size / (1024 * 1024)
-    return file_count, total_size_mb
-
-def monitor_process(pid, src_dir):
-    """
-    Monitors the process with the given PID:
-      - CPU usage (with a 1-second sampling interval)
+    return CacheScanner(src_dir).sample()
+
+def sample_gpu_usage():
+    """
+    Average GPU utilisation in percent: NVML handles when pynvml is available,
+    else GPUtil (which shells out to nvidia-smi on every call), else 0.
+    """
+    try:
+        if _GPUS:
+            return sum(pynvml.nvmlDeviceGetUtilizationRates(h).gpu for h in _GPUS) / len(_GPUS)
+        if GPUtil:
+            gpus = GPUtil.getGPUs()
+            if gpus:
+                return sum(gpu.load for gpu in gpus) / len(gpus) * 100
+    except Exception as e:
+        print("GPU monitoring error:", e)
+    return 0
+
+class Monitor:
+    """
+    Samples one process, once per second on a monotonic schedule:
+      - CPU usage (since the previous sample)
       - Memory usage (in MB)
-      - GPU usage (in percent, if GPUtil is available)
+      - GPU usage (in percent, via pynvml or GPUtil if available)
       - Cache folder metrics aggregated from any directory with 'cache' in its name in src_dir
-    Appends the results to the global metrics_data dictionary.
+    into its own MetricsBuffer. run() is the thread target; stop() may be
+    called from any thread and ends the loop without waiting out the tick.
+    Cache folders change slowly, so a scandir-based scan only runs every
+    `cache_every` ticks and the other samples repeat its last values; with
+    watchdog the counters are free to read and are sampled every tick.
     """
-    global monitoring_active
-    try:
-        process = psutil.Process(pid)
-    except psutil.NoSuchProcess:
-        print("Error: Process not found!")
-        return
+    CACHE_EVERY = 10
+
+    def __init__(self, buf=None, cache_every=CACHE_EVERY):
+        self.buf = buf if buf is not None else MetricsBuffer()
+        self.cache_every = max(1, cache_every)
+        self._stop = threading.Event()
+
+    def stop(self):
+        self._stop.set()
 
-    start_time = time.time()
-    while monitoring_active and process.is_running():
+    def run(self, pid, src_dir):
         try:
-            timestamp = time.time() - start_time
-            cpu_usage = process.cpu_percent(interval=1)
-            memory_usage = process.memory_info().rss / (1024 * 1024)  # MB
-
-            # GPU monitoring using GPUtil (if available)
-            if GPUtil:
-                try:
-                    gpus = GPUtil.getGPUs()
-                    if gpus:
-                        gpu_usage = sum(gpu.load for gpu in gpus) / len(gpus) * 100
-                    else:
-                        gpu_usage = 0
-                except Exception as e:
-                    print("GPU monitoring error:", e)
-                    gpu_usage = 0
-            else:
-                gpu_usage = 0
-
-            # Aggregate metrics from all cache folders found within src_dir.
-            cache_count, cache_size = get_all_cache_metrics(src_dir)
-
-            # Append current metrics.
-            metrics_data["timestamp"].append(timestamp)
-            metrics_data["cpu"].append(cpu_usage)
-            metrics_data["memory"].append(memory_usage)
-            metrics_data["gpu"].append(gpu_usage)
-            metrics_data["cache_count"].append(cache_count)
-            metrics_data["cache_size"].append(cache_size)
-        except (psutil.NoSuchProcess, psutil.AccessDenied) as e:
-            print("Monitoring error:", e)
-            break
-
-def scan_complexity(src_dir):
+            process = psutil.Process(pid)
+        except psutil.NoSuchProcess:
+            print("Error: Process not found!")
+            return
+
+        # filesystem events when watchdog is available, periodic scandir otherwise
+        scanner = CacheWatcher(src_dir) if Observer else CacheScanner(src_dir)
+        cache_every = 1 if Observer else self.cache_every
+        tick_idx = 0
+        process.cpu_percent(interval=None)   # prime: the first non-blocking call returns 0.0
+        start_time = time.time()
+        next_tick = time.monotonic() + 1.0
+        while not self._stop.is_set() and process.is_running():
+            try:
+                if self._stop.wait(max(0.0, next_tick - time.monotonic())):
+                    break
+                next_tick += 1.0
+                timestamp = time.time() - start_time
+                # one /proc (or OS API) read shared by both calls
+                with process.oneshot():
+                    cpu_usage = process.cpu_percent(interval=None)
+                    memory_usage = process.memory_info().rss / (1024 * 1024)  # MB
+
+                gpu_usage = sample_gpu_usage()
+
+                # Aggregate metrics from all cache folders found within src_dir.
+                if tick_idx % cache_every == 0:
+                    cache_count, cache_size = scanner.sample()
+                tick_idx += 1
+
+                # Append current metrics.
+                self.buf.append(timestamp, cpu_usage, memory_usage, gpu_usage,
+                                cache_count, cache_size)
+            except (psutil.NoSuchProcess, psutil.AccessDenied) as e:
+                print("Monitoring error:", e)
+                break
+        scanner.stop()
+
+def iter_py_files(root, exclude=EXCLUDED_DIRS):
+    """Yields the path of every .py file under root, using DirEntry type info instead of stat calls."""
+    stack = [root]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in exclude and not entry.name.startswith("."):
+                        stack.append(entry.path)
+                elif entry.name.endswith(".py"):
+                    yield entry.path
+
+def _cc_one_file(file_path):
+    """Process-pool worker: (file_path, total cyclomatic complexity) of one file."""
+    try:
+        with open(file_path, 'r', encoding="utf-8") as f:
+            code = f.read()
+        # parse with the real filename so syntax errors name the file
+        tree = ast.parse(code, filename=file_path)
+        return file_path, sum(c.complexity for c in cc_visit_ast(tree))
+    except Exception as e:
+        return file_path, f"Error: {e}"
+
+# path -> (size, mtime_ns, complexity), kept between runs
+COMPLEXITY_CACHE = os.path.join(os.path.expanduser("~"), ".cache", "audioui", "complexity.pkl")
+
+def _load_complexity_cache(path=COMPLEXITY_CACHE):
+    try:
+        with open(path, "rb") as f:
+            return pickle.load(f)
+    except Exception:
+        return {}   # missing or unreadable: start cold
+
+def _save_complexity_cache(cache, path=COMPLEXITY_CACHE):
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as f:
+            pickle.dump(cache, f, protocol=pickle.HIGHEST_PROTOCOL)
+    except OSError as e:
+        print("Could not save complexity cache:", e)
+
+def scan_complexity(src_dir, exclude=EXCLUDED_DIRS, cache_path=COMPLEXITY_CACHE):
     """
     Scans all Python (.py) files in src_dir recursively,
     computing the cyclomatic complexity using radon.
+    Files whose size and mtime match the previous run reuse the cached result
+    (cache_path=None disables the cache); the rest are parsed in parallel
+    across a process pool. Folders in `exclude` (virtualenvs, caches, ...)
+    and hidden folders are skipped.
     Returns a list of tuples: (file_path, complexity).
     """
-    complexities = []
-    for root, _, files in os.walk(src_dir):
-        for file in files:
-            if file.endswith(".py"):
-                file_path = os.path.join(root, file)
-                try:
-                    with open(file_path, 'r', encoding="utf-8") as f:
-                        code = f.read()
-                    file_complexity = sum(c.complexity for c in cc_visit(code))
-                    complexities.append((file_path, file_complexity))
-                except Exception as e:
-                    complexities.append((file_path, f"Error: {e}"))
-    return complexities
-
-def run_game_and_monitor(src_dir):
+    cache = _load_complexity_cache(cache_path) if cache_path else {}
+    results = {}
+    fingerprints = {}
+    stale = []
+    for file_path in iter_py_files(src_dir, exclude):
+        try:
+            st = os.stat(file_path)
+        except OSError:
+            results[file_path] = None
+            stale.append(file_path)   # let the worker report the error
+            continue
+        key = os.path.abspath(file_path)
+        fingerprints[file_path] = (key, st.st_size, st.st_mtime_ns)
+        hit = cache.get(key)
+        if hit and hit[0] == st.st_size and hit[1] == st.st_mtime_ns:
+            results[file_path] = hit[2]
+        else:
+            results[file_path] = None   # placeholder keeps walk order
+            stale.append(file_path)
+
+    if stale:
+        with ProcessPoolExecutor(max_workers=min(os.cpu_count() or 1, len(stale))) as ex:
+            for file_path, complexity in ex.map(_cc_one_file, stale, chunksize=16):
+                results[file_path] = complexity
+                if isinstance(complexity, int) and file_path in fingerprints:
+                    key, size, mtime_ns = fingerprints[file_path]
+                    cache[key] = (size, mtime_ns, complexity)
+        if cache_path:
+            _save_complexity_cache(cache, cache_path)
+    return list(results.items())
+
+# Runs the game under tracemalloc (argv: report_csv, main.py) and writes the
+# top-50 allocation sites when it exits.
+TRACEMALLOC_BOOTSTRAP = """
+import atexit, csv, os, runpy, sys, tracemalloc
+tracemalloc.start(25)
+report, entry = sys.argv[1], sys.argv[2]
+def _dump():
+    stats = tracemalloc.take_snapshot().statistics("lineno")[:50]
+    with open(report, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["Location", "Size (KiB)", "Count"])
+        for stat in stats:
+            writer.writerow([str(stat.traceback), round(stat.size / 1024, 1), stat.count])
+atexit.register(_dump)
+sys.argv = sys.argv[2:]
+sys.path[0] = os.path.dirname(entry)
+runpy.run_path(entry, run_name="__main__")
+"""
+
+def run_game_and_monitor(src_dir, buf=None, cache_every=Monitor.CACHE_EVERY, trace_malloc=False):
     """
     Launches the game (src/main.py) and monitors its performance:
-      - Starts a background thread to sample process, GPU, and cache folder metrics.
+      - Starts a background thread to sample process, GPU, and cache folder metrics
+        (into `buf`, a MetricsBuffer by default; cache folders every `cache_every` s).
       - Waits for the game process to finish (or crash).
-      - Returns the collected metrics.
+      - With trace_malloc, runs the game under tracemalloc and leaves its top
+        allocation sites in tracemalloc_report.csv.
+      - Returns the Monitor holding the collected metrics (monitor.buf).
     """
-    global monitoring_active
-
     game_entry = os.path.join(src_dir, "main.py")
     if not os.path.isfile(game_entry):
         print("Error: main.py not found in the provided src directory!")
         sys.exit(1)
 
-    # Start tracemalloc if needed (psutil already provides real-time memory usage)
-    tracemalloc.start()
+    cmd = [sys.executable, game_entry]
+    if trace_malloc:
+        cmd = [sys.executable, "-c", TRACEMALLOC_BOOTSTRAP,
+               os.path.abspath("tracemalloc_report.csv"), os.path.abspath(game_entry)]
 
     # Launch the game process. Redirect output to DEVNULL to prevent blocking.
     game_process = subprocess.Popen(
-        [sys.executable, game_entry],
+        cmd,
         stdout=subprocess.DEVNULL,
         stderr=subprocess.DEVNULL
     )
 
     # Start a monitoring thread.
-    monitor_thread = threading.Thread(target=monitor_process, args=(game_process.pid, src_dir), daemon=True)
+    monitor = Monitor(buf, cache_every)
+    monitor_thread = threading.Thread(target=monitor.run, args=(game_process.pid, src_dir), daemon=True)
     monitor_thread.start()
 
     # Wait for the game process to finish (or crash).
@@ -177,31 +523,56 @@ def run_game_and_monitor(src_dir):
     except KeyboardInterrupt:
         print("Game run interrupted by user.")
     finally:
-        monitoring_active = False
+        monitor.stop()
         monitor_thread.join()
-        tracemalloc.stop()
 
-    return metrics_data
+    return monitor
 
-def run_single_test(src_dir):
+def write_metrics_report(df, fmt="feather", stem="session_metrics_report"):
+    """
+    Writes the metrics DataFrame as Feather (lz4), Parquet (zstd) or CSV and
+    returns the file name. The numeric columns go to pyarrow as a typed
+    Table without copies; falls back to CSV when pyarrow is missing.
+    """
+    if fmt in ("feather", "parquet"):
+        if pa is None:
+            print(f"{fmt} output unavailable (pyarrow is not installed); writing CSV instead.")
+        else:
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            if fmt == "feather":
+                from pyarrow import feather
+                feather.write_feather(table, f"{stem}.feather", compression="lz4")
+                return f"{stem}.feather"
+            from pyarrow import parquet
+            # all-numeric columns: dictionary pages would only add overhead
+            parquet.write_table(table, f"{stem}.parquet", compression="zstd",
+                                use_dictionary=False, data_page_size=1 << 20)
+            return f"{stem}.parquet"
+    df.to_csv(f"{stem}.csv", index=False)
+    return f"{stem}.csv"
+
+def write_reports(df_metrics, df_complexity, fmt="feather"):
+    metrics_file = write_metrics_report(df_metrics, fmt)
+    df_complexity.to_csv("src_complexity_report.csv", index=False)
+    print(f"Reports generated: {metrics_file} and src_complexity_report.csv")
+
+def run_single_test(src_dir, fmt="feather", exclude=EXCLUDED_DIRS,
+                    cache_every=Monitor.CACHE_EVERY, trace_malloc=False):
     """
     Runs the game in single test mode:
       - Executes the game and monitors performance in the background.
       - After the run (or crash), scans the src directory for code complexity.
-      - Exports CSV reports for runtime metrics and source code complexity.
+      - Exports the runtime metrics (in `fmt`) and source code complexity reports.
       - Prints summary reports to the console.
     """
     print("Running single test mode...")
-    metrics = run_game_and_monitor(src_dir)
-    complexities = scan_complexity(src_dir)
+    monitor = run_game_and_monitor(src_dir, cache_every=cache_every, trace_malloc=trace_malloc)
+    complexities = scan_complexity(src_dir, exclude)
 
-    df_metrics = pd.DataFrame(metrics)
+    df_metrics = monitor.buf.to_dataframe()
     df_complexity = pd.DataFrame(complexities, columns=["File", "Complexity"])
 
-    df_metrics.to_csv("session_metrics_report.csv", index=False)
-    df_complexity.to_csv("src_complexity_report.csv", index=False)
-
-    print("Reports generated: session_metrics_report.csv and src_complexity_report.csv")
+    write_reports(df_metrics, df_complexity, fmt)
     print("\n--- Session Metrics Report (First 10 Rows) ---")
     print(df_metrics.head(10))
     print("\n--- Source Code Complexity Report (First 10 Rows) ---")
@@ -215,24 +586,34 @@ if __name__ == "__main__":
                         help="Mode: 'test' for a single run, 'session' for long-run monitoring.")
     parser.add_argument("src_dir",
                         help="Path to the game source directory (should contain main.py and any cache folders).")
+    parser.add_argument("--format", choices=["csv", "feather", "parquet"], default="feather",
+                        help="File format of the session metrics report (default: feather).")
+    parser.add_argument("--exclude", nargs="*", default=[], metavar="DIR",
+                        help="Extra folder names to skip in the complexity scan.")
+    parser.add_argument("--cache-interval", type=int, default=Monitor.CACHE_EVERY, metavar="SECONDS",
+                        help="Seconds between cache folder scans when watchdog is unavailable "
+                             f"(default: {Monitor.CACHE_EVERY}).")
+    parser.add_argument("--tracemalloc", action="store_true",
+                        help="Trace the game's Python allocations and write tracemalloc_report.csv on exit.")
 
     args = parser.parse_args()
+    exclude = EXCLUDED_DIRS | set(args.exclude)
 
     if args.mode == "test":
-        run_single_test(args.src_dir)
+        run_single_test(args.src_dir, args.format, exclude, args.cache_interval, args.tracemalloc)
     elif args.mode == "session":
         print("Running long session mode. Press Ctrl+C to interrupt and finalize the report.")
+        # stream samples to disk as they arrive: bounded memory, survives a crash
+        buf = ArrowMetricsWriter("session_metrics_stream.arrows") if pa else MetricsBuffer()
         try:
-            run_game_and_monitor(args.src_dir)
+            run_game_and_monitor(args.src_dir, buf, args.cache_interval, args.tracemalloc)
         except KeyboardInterrupt:
             print("Session interrupted. Finalizing report...")
         finally:
-            complexities = scan_complexity(args.src_dir)
-            df_metrics = pd.DataFrame(metrics_data)
+            complexities = scan_complexity(args.src_dir, exclude)
+            df_metrics = buf.to_dataframe()
             df_complexity = pd.DataFrame(complexities, columns=["File", "Complexity"])
-            df_metrics.to_csv("session_metrics_report.csv", index=False)
-            df_complexity.to_csv("src_complexity_report.csv", index=False)
-            print("Reports generated: session_metrics_report.csv and src_complexity_report.csv")
+            write_reports(df_metrics, df_complexity, args.format)
             print("\n--- Session Metrics Report (First 10 Rows) ---")
             print(df_metrics.head(10))
             print("\n--- Source Code Complexity Report (First 10 Rows) ---")
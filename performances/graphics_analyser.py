@@ -11,15 +11,20 @@ Features:
 - Exports a CSV report ("graphics_analysis_report.csv") and prints a summary to the console.
 
 Dependencies:
-- pandas
+- pandas (and numpy)
 - re (built-in)
 """
 
 import os
 import re
+import mmap
 import sys
 import argparse
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
 import pandas as pd
+from source_dirs import EXCLUDED_DIRS
 
 # Define regex patterns for common pygame drawing functions.
 # You can refine these patterns to reduce false positives.
@@ -32,57 +37,117 @@ patterns = {
     "update": re.compile(r"\.update\("),
 }
 
+# One alternation of every pattern: a single search over the whole file
+# finds the next hit line; only that line is re-checked against each pattern,
+# so a line matching several patterns is still reported once per pattern.
+COMBINED = re.compile("|".join(f"(?P<{name}>{p.pattern})" for name, p in patterns.items()))
+
+# Byte-level twins: files are scanned straight from an mmap, undecoded.
+_COMBINED_BYTES = re.compile(COMBINED.pattern.encode())
+# (name, bound search) pairs, so the per-line check does no lookups.
+_BYTE_SEARCHES = tuple((name, re.compile(p.pattern.encode()).search) for name, p in patterns.items())
+
+def _new_columns():
+    """Empty findings table as columns: (files, lines, keywords, snippets)."""
+    return [], array("i"), [], []
+
 def analyse_file(file_path):
     """
     Scans a single file for drawing-related function calls.
-    Returns a list of dictionaries with the file name, line number, matched pattern, and code snippet.
+    Returns the findings as columns (files, lines, keywords, snippets):
+    file name, line number, matched pattern, and code snippet.
     """
-    results = []
+    results = files, lines, keywords, snippets = _new_columns()
     try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            lines = f.readlines()
+        with open(file_path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return results   # mmap cannot map an empty file
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
     except Exception as e:
         print(f"Error reading {file_path}: {e}")
         return results
 
-    for idx, line in enumerate(lines, start=1):
-        # Check each pattern on the line.
-        for pattern_name, pattern in patterns.items():
-            if pattern.search(line):
-                results.append({
-                    "File": file_path,
-                    "Line": idx,
-                    "Keyword": pattern_name,
-                    "Code Snippet": line.strip()
-                })
-                # If a line matches multiple patterns, you may get duplicates.
-                # To avoid duplicates per line, uncomment the next line:
-                # break
+    # No per-line strings and no decoded copy of the file: jump from hit to
+    # hit in the mapped bytes, count newlines to recover the line number,
+    # and decode only the lines that match.
+    with data:
+        combined_search = _COMBINED_BYTES.search
+        idx, counted = 1, 0   # line number at offset `counted`
+        m = combined_search(data)
+        while m:
+            start = data.rfind(b"\n", 0, m.start()) + 1
+            end = data.find(b"\n", m.end())
+            if end == -1:
+                end = len(data)
+            idx += data[counted:start].count(b"\n")
+            counted = start
+            line = data[start:end]
+            m = combined_search(data, end + 1)
+            # Check each pattern on the line.
+            for pattern_name, pattern_search in _BYTE_SEARCHES:
+                if pattern_search(line):
+                    files.append(file_path)
+                    lines.append(idx)
+                    keywords.append(pattern_name)
+                    snippets.append(line.decode("utf-8", "replace").strip())
+                    # If a line matches multiple patterns, you may get duplicates.
+                    # To avoid duplicates per line, uncomment the next line:
+                    # break
+    return results
+
+def _analyse_batch(paths):
+    """Process-pool worker: analyse_file over a batch of paths, columns concatenated."""
+    results = _new_columns()
+    for path in paths:
+        _extend(results, analyse_file(path))
     return results
 
-def analyse_directory(directory):
+def _extend(columns, more):
+    for column, values in zip(columns, more):
+        column.extend(values)
+
+def _chunks(items, size):
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
+def analyse_directory(directory, batch_size=32, exclude=EXCLUDED_DIRS):
     """
     Recursively scans the directory for .py files and analyses each one.
-    Returns a list of all findings.
+    Files are handed to a process pool in batches of `batch_size` to keep
+    pickling traffic low. Folders in `exclude` and hidden folders are pruned.
+    Returns all findings as columns (files, lines, keywords, snippets).
     """
-    all_results = []
-    for root, _, files in os.walk(directory):
-        for file in files:
-            if file.endswith(".py"):
-                full_path = os.path.join(root, file)
-                file_results = analyse_file(full_path)
-                all_results.extend(file_results)
+    paths = []
+    for root, dirs, files in os.walk(directory, topdown=True):
+        dirs[:] = [d for d in dirs if d not in exclude and not d.startswith(".")]
+        paths.extend(os.path.join(root, file) for file in files if file.endswith(".py"))
+    all_results = _new_columns()
+    if not paths:
+        return all_results
+    with ProcessPoolExecutor() as ex:
+        for columns in ex.map(_analyse_batch, _chunks(paths, batch_size)):
+            _extend(all_results, columns)
     return all_results
 
-def main(directory):
+def to_dataframe(results):
+    """Findings columns -> DataFrame; Keyword is categorical over the pattern names."""
+    files, lines, keywords, snippets = results
+    return pd.DataFrame({
+        "File": files,
+        "Line": np.asarray(lines),
+        "Keyword": pd.Categorical(keywords, categories=list(patterns)),
+        "Code Snippet": snippets,
+    })
+
+def main(directory, exclude=EXCLUDED_DIRS):
     print(f"Analysing Python files in directory: {directory}")
-    results = analyse_directory(directory)
+    results = analyse_directory(directory, exclude=exclude)
     
-    if not results:
+    if not results[0]:
         print("No drawing-related function calls found.")
         return
     
-    df = pd.DataFrame(results)
+    df = to_dataframe(results)
     report_file = "graphics_analysis_report.csv"
     df.to_csv(report_file, index=False)
     
@@ -95,5 +160,7 @@ if __name__ == "__main__":
         description="Graphics Analyser for Pygame Projects: Scans for drawing-related functions (draw, blit, flip, update, etc.)."
     )
     parser.add_argument("directory", help="Path to the project directory to analyse.")
+    parser.add_argument("--exclude", nargs="*", default=[], metavar="DIR",
+                        help="Extra folder names to skip.")
     args = parser.parse_args()
-    main(args.directory)
+    main(args.directory, EXCLUDED_DIRS | set(args.exclude))
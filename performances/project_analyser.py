@@ -18,16 +18,21 @@ The UI also provides a Reports Viewer to load CSV files and display them as sort
 
 import os
 import sys
+import asyncio
 import time
 import threading
 import subprocess
 import psutil
 import tracemalloc
 import re
+import csv
 import json
+import shelve
+from collections import deque
 import ast
+import functools
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
-import pandas as pd
 import tkinter as tk
 from tkinter import filedialog, scrolledtext, messagebox, ttk
 from radon.complexity import cc_visit
@@ -37,6 +42,11 @@ try:
 except ImportError:
     GPUtil = None
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # ---------- Helper Functions & Global Variables ----------
 
 def get_reports_dir(base_dir):
@@ -47,6 +57,13 @@ def get_reports_dir(base_dir):
 # Allowed code file extensions for summarisation.
 ALLOWED_EXTENSIONS = {".py", ".php", ".html", ".js", ".css", ".ts"}
 
+def write_csv(path, header, rows):
+    """Writes a CSV report with the stdlib writer: one header row, then all rows in bulk."""
+    with open(path, "w", newline="", encoding="utf-8", buffering=1 << 20) as f:
+        writer = csv.writer(f)
+        writer.writerow(header)
+        writer.writerows(rows)
+
 def get_comment_marker(ext):
     mapping = {
         ".py": "#",
@@ -58,91 +75,229 @@ def get_comment_marker(ext):
     }
     return mapping.get(ext, "#")
 
+_VERSION_RE = re.compile(r"(?:^|[/\\])(ALLV\d+)(?=[/\\]|$)")
+
+@functools.lru_cache(maxsize=128)
 def get_version_from_path(file_path):
-    parts = file_path.split(os.sep)
-    for part in parts:
-        if part.startswith("ALLV") and part[4:].isdigit():
-            return part
-    return "ALLV_unknown"
-
-def extract_function_details(file_content):
-    """Extract function names, arguments, and return statements from Python file content."""
+    """The first ALLV<n> folder in file_path, or "ALLV_unknown"."""
+    m = _VERSION_RE.search(file_path)
+    return m.group(1) if m else "ALLV_unknown"
+
+# Bumped whenever the extracted details change shape, to retire cached entries.
+_FUNCTION_DETAILS_VERSION = 2
+
+class _FunctionVisitor(ast.NodeVisitor):
+    """
+    Collects (name, args, returns) for every function. A function's returns
+    are its own: nested defs, lambdas and classes are not searched for them
+    (the nested defs are reported as functions of their own).
+    """
+    _SCOPES = (ast.FunctionDef, ast.AsyncFunctionDef, ast.Lambda, ast.ClassDef)
+
+    def __init__(self):
+        self.functions = []
+
+    def visit_FunctionDef(self, node):
+        args = [arg.arg for arg in node.args.args]
+        returns = []
+        pending = deque(ast.iter_child_nodes(node))
+        while pending:
+            n = pending.popleft()
+            if isinstance(n, ast.Return):
+                if n.value is not None:
+                    returns.append(ast.unparse(n.value))
+            elif not isinstance(n, self._SCOPES):
+                pending.extend(ast.iter_child_nodes(n))
+        self.functions.append((node.name, args, returns))
+        self.generic_visit(node)
+
+def _details_fingerprint(file_path):
+    """Cache key for a file's function details, or None if it cannot be stat'ed."""
     try:
-        tree = ast.parse(file_content)
-        functions = []
-        for node in ast.walk(tree):
-            if isinstance(node, ast.FunctionDef):
-                args = [arg.arg for arg in node.args.args]
-                returns = [ast.dump(n.value) for n in ast.walk(node) if isinstance(n, ast.Return) and n.value is not None]
-                functions.append((node.name, args, returns))
-        return functions
+        st = os.stat(file_path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size, _FUNCTION_DETAILS_VERSION)
+
+def extract_function_details(file_content, file_path=None, cache=None):
+    """
+    Extract function names, arguments, and return statements from Python file content.
+    With a file_path and a dict-like cache (e.g. a shelf), results are memoized
+    per path and reused while the file's mtime and size are unchanged.
+    """
+    fingerprint = None
+    if cache is not None and file_path:
+        fingerprint = _details_fingerprint(file_path)
+        hit = cache.get(file_path)
+        if fingerprint is not None and hit is not None and hit[0] == fingerprint:
+            return hit[1]
+    try:
+        visitor = _FunctionVisitor()
+        visitor.visit(ast.parse(file_content))
+        functions = visitor.functions
     except SyntaxError:
-        return []
+        functions = []
+    if fingerprint is not None:
+        cache[file_path] = (fingerprint, functions)
+    return functions
+
+# One .py listing is shared by the analysers: repeated runs on the same
+# folder within PY_LIST_TTL seconds (and with an unchanged top-level mtime)
+# reuse the walk instead of re-reading every directory.
+PY_LIST_TTL = 60
+
+@functools.lru_cache(maxsize=8)
+def _list_py_files(src_dir, stamp):
+    return tuple(os.path.join(root, file)
+                 for root, _, files in os.walk(src_dir)
+                 for file in files if file.endswith(".py"))
+
+def list_py_files(src):
+    """All .py paths under src, in os.walk order; a tuple of paths is passed through."""
+    if isinstance(src, tuple):
+        return src
+    stamp = (os.stat(src).st_mtime_ns, int(time.monotonic() // PY_LIST_TTL))
+    return _list_py_files(src, stamp)
 
 # ---------- Efficiency Meter Functions ----------
 
 def get_all_cache_metrics(src_dir):
-    total_size = 0
-    file_count = 0
-    for root, dirs, _ in os.walk(src_dir):
-        for d in dirs:
-            if "cache" in d.lower():
-                cache_path = os.path.join(root, d)
-                for r, _, files in os.walk(cache_path):
-                    file_count += len(files)
-                    for f in files:
-                        f_path = os.path.join(r, f)
-                        if os.path.isfile(f_path):
-                            total_size += os.path.getsize(f_path)
-    total_size_mb = total_size / (1024 * 1024)
-    return file_count, total_size_mb
-
-def monitor_process(pid, src_dir, log_func, metrics_data):
+    # efficiencymeter pulls in pandas/numpy and initialises NVML: only on use
+    from efficiencymeter import CacheScanner
+    return CacheScanner(src_dir).sample()
+
+class TrackChildren(threading.Thread):
+    """
+    Background sampler for a process and all of its descendants. The process
+    table is rescanned for new children every `rescan` ticks rather than on
+    every read; values() returns (cpu %, rss MiB) sums, the cpu averaged over
+    every tick since the previous read so it covers the whole reporting
+    window rather than the last tick.
+    """
+    def __init__(self, process, interval=0.1, rescan=10):
+        super().__init__(daemon=True)
+        self._root = process
+        self._interval = interval
+        self._rescan = rescan
+        self._event = threading.Event()
+        self._procs = {}
+        self._lock = threading.Lock()
+        self._cpu_total = 0.0   # cpu % summed over the ticks since the last read
+        self._ticks = 0
+        self._last_cpu = 0.0
+        self._rss = 0.0
+        self._add(process)
+
+    def _add(self, proc):
+        # seed the non-blocking counter: the first cpu_percent(None) returns 0.0
+        proc.cpu_percent(interval=None)
+        self._procs[proc.pid] = proc
+
+    def _refresh(self):
+        try:
+            children = self._root.children(recursive=True)
+        except psutil.Error:
+            return
+        for child in children:
+            if child.pid not in self._procs:
+                try:
+                    self._add(child)
+                except psutil.Error:
+                    pass
+
+    def run(self):
+        tick = 0
+        while not self._event.is_set():
+            if tick % self._rescan == 0:
+                self._refresh()
+            tick += 1
+            cpu = rss = 0.0
+            for pid, proc in list(self._procs.items()):
+                try:
+                    with proc.oneshot():   # one /proc read for both stats
+                        cpu += proc.cpu_percent(interval=None)
+                        rss += proc.memory_info().rss
+                except psutil.Error:
+                    del self._procs[pid]
+            with self._lock:
+                self._cpu_total += cpu
+                self._ticks += 1
+                self._rss = rss / (1024 * 1024)
+            self._event.wait(self._interval)
+
+    def values(self):
+        with self._lock:
+            if self._ticks:
+                self._last_cpu = self._cpu_total / self._ticks
+                self._cpu_total, self._ticks = 0.0, 0
+            return self._last_cpu, self._rss
+
+    def stop(self):
+        self._event.set()
+        self.join()
+
+def monitor_process(pid, src_dir, log_func, metrics_data, interval=1.0):
+    from efficiencymeter import CacheScanner, CacheWatcher, Observer
     try:
         process = psutil.Process(pid)
+        # cpu and memory of the game and every process it spawns
+        tracker = TrackChildren(process)
     except psutil.NoSuchProcess:
         log_func("Error: Process not found!")
         return
+    # live counters fed by filesystem events when watchdog is available,
+    # otherwise a scandir pass over the known cache folders per tick
+    scanner = CacheWatcher(src_dir) if Observer else CacheScanner(src_dir)
+    tracker.start()
     start_time = time.time()
-    while metrics_data.get("monitoring_active", True) and process.is_running():
-        try:
-            timestamp = time.time() - start_time
-            cpu_usage = process.cpu_percent(interval=1)
-            memory_usage = process.memory_info().rss / (1024 * 1024)
-            if GPUtil:
-                try:
-                    gpus = GPUtil.getGPUs()
-                    gpu_usage = sum(gpu.load for gpu in gpus) / len(gpus) * 100 if gpus else 0
-                except Exception as e:
-                    log_func(f"GPU monitoring error: {e}")
+    try:
+        while metrics_data.get("monitoring_active", True) and process.is_running():
+            try:
+                time.sleep(interval)
+                timestamp = time.time() - start_time
+                cpu_usage, memory_usage = tracker.values()
+                if GPUtil:
+                    try:
+                        gpus = GPUtil.getGPUs()
+                        gpu_usage = sum(gpu.load for gpu in gpus) / len(gpus) * 100 if gpus else 0
+                    except Exception as e:
+                        log_func(f"GPU monitoring error: {e}")
+                        gpu_usage = 0
+                else:
                     gpu_usage = 0
-            else:
-                gpu_usage = 0
-            cache_count, cache_size = get_all_cache_metrics(src_dir)
-            metrics_data["timestamp"].append(timestamp)
-            metrics_data["cpu"].append(cpu_usage)
-            metrics_data["memory"].append(memory_usage)
-            metrics_data["gpu"].append(gpu_usage)
-            metrics_data["cache_count"].append(cache_count)
-            metrics_data["cache_size"].append(cache_size)
-        except (psutil.NoSuchProcess, psutil.AccessDenied) as e:
-            log_func(f"Monitoring error: {e}")
-            break
+                cache_count, cache_size = scanner.sample()
+                metrics_data["timestamp"].append(timestamp)
+                metrics_data["cpu"].append(cpu_usage)
+                metrics_data["memory"].append(memory_usage)
+                metrics_data["gpu"].append(gpu_usage)
+                metrics_data["cache_count"].append(cache_count)
+                metrics_data["cache_size"].append(cache_size)
+            except (psutil.NoSuchProcess, psutil.AccessDenied) as e:
+                log_func(f"Monitoring error: {e}")
+                break
+    finally:
+        tracker.stop()
+        scanner.stop()
+
+def _complexity_of(file_path):
+    """Process-pool worker: (file_path, total complexity or error string)."""
+    try:
+        with open(file_path, 'r', encoding="utf-8") as f:
+            code = f.read()
+        return file_path, sum(c.complexity for c in cc_visit(code))
+    except Exception as e:
+        return file_path, f"Error: {e}"
 
 def scan_complexity(src_dir):
-    complexities = []
-    for root, _, files in os.walk(src_dir):
-        for file in files:
-            if file.endswith(".py"):
-                file_path = os.path.join(root, file)
-                try:
-                    with open(file_path, 'r', encoding="utf-8") as f:
-                        code = f.read()
-                    file_complexity = sum(c.complexity for c in cc_visit(code))
-                    complexities.append((file_path, file_complexity))
-                except Exception as e:
-                    complexities.append((file_path, f"Error: {e}"))
-    return complexities
+    """src_dir may also be a precomputed list_py_files() tuple."""
+    paths = list_py_files(src_dir)
+    if not paths:
+        return []
+    workers = os.cpu_count() or 1
+    # ~4 chunks per worker: few IPC round trips, still balanced
+    chunksize = max(1, len(paths) // (4 * workers))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_complexity_of, paths, chunksize=chunksize))
 
 def run_efficiency_meter(src_dir, log_func, reports_dir):
     log_func("Starting Efficiency Meter (launching game)...")
@@ -169,46 +324,52 @@ def run_efficiency_meter(src_dir, log_func, reports_dir):
         monitor_thread.join()
         tracemalloc.stop()
     complexities = scan_complexity(src_dir)
-    df_metrics = pd.DataFrame(metrics_data)
-    df_complexity = pd.DataFrame(complexities, columns=["File", "Complexity"])
     metrics_file = os.path.join(reports_dir, "session_metrics_report.csv")
     complexity_file = os.path.join(reports_dir, "src_complexity_report.csv")
-    df_metrics.to_csv(metrics_file, index=False)
-    df_complexity.to_csv(complexity_file, index=False)
+    columns = ["timestamp", "cpu", "memory", "gpu", "cache_count", "cache_size"]
+    write_csv(metrics_file, columns, zip(*(metrics_data[c] for c in columns)))
+    write_csv(complexity_file, ["File", "Complexity"], complexities)
     log_func(f"Efficiency Meter reports generated:\n - {metrics_file}\n - {complexity_file}")
 
 # ---------- Runtime Tester Functions ----------
 
-def test_runtime(file_path, timeout=10):
-    start = time.perf_counter()
-    try:
-        subprocess.run(
-            [sys.executable, file_path],
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.DEVNULL,
-            timeout=timeout
-        )
+async def test_runtime(file_path, timeout, limit):
+    """Runtime of file_path in a fresh interpreter, "Timeout" or "Error: ..."."""
+    async with limit:
+        start = time.perf_counter()
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                sys.executable, file_path,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL
+            )
+        except Exception as e:
+            return f"Error: {e}"
+        try:
+            await asyncio.wait_for(proc.wait(), timeout)
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            return "Timeout"
         end = time.perf_counter()
         return end - start
-    except subprocess.TimeoutExpired:
-        return "Timeout"
-    except Exception as e:
-        return f"Error: {e}"
+
+async def _run_runtime_tests(paths, timeout):
+    # One event loop reaps every child; the semaphore keeps os.cpu_count()
+    # of them running side by side.
+    limit = asyncio.Semaphore(os.cpu_count() or 1)
+    return await asyncio.gather(*(test_runtime(path, timeout, limit) for path in paths))
 
 def run_runtime_tester(src_dir, timeout, log_func, reports_dir):
-    results = []
-    for root, _, files in os.walk(src_dir):
-        for file in files:
-            if file.endswith(".py"):
-                full_path = os.path.join(root, file)
-                if os.path.abspath(full_path) == os.path.abspath(__file__):
-                    continue
-                log_func(f"Testing: {full_path}")
-                runtime = test_runtime(full_path, timeout=timeout)
-                results.append({"File": full_path, "Runtime (s)": runtime})
-    df = pd.DataFrame(results)
+    paths = []
+    for full_path in list_py_files(src_dir):
+        if os.path.abspath(full_path) == os.path.abspath(__file__):
+            continue
+        log_func(f"Testing: {full_path}")
+        paths.append(full_path)
+    runtimes = asyncio.run(_run_runtime_tests(paths, timeout))
     report_file = os.path.join(reports_dir, "runtime_test_report.csv")
-    df.to_csv(report_file, index=False)
+    write_csv(report_file, ["File", "Runtime (s)"], zip(paths, runtimes))
     log_func(f"Runtime Tester completed. Report generated:\n - {report_file}")
 
 # ---------- Graphics Analyser Functions ----------
@@ -223,99 +384,208 @@ graphics_patterns = {
     "update": re.compile(r"\.update\("),
 }
 
+# All patterns fused into one alternation: one search over the whole text
+# finds the next hit line, which is then checked per pattern (a line
+# matching several patterns is still reported once per pattern).
+graphics_fused = re.compile("|".join(f"(?P<{name}>{p.pattern})" for name, p in graphics_patterns.items()))
+# (name, bound search) pairs for the per-line check: no dict iteration or
+# attribute lookup inside the loop.
+_GRAPHICS_SEARCHES = tuple((name, p.search) for name, p in graphics_patterns.items())
+
 def analyse_file(file_path):
     results = []
     try:
         with open(file_path, "r", encoding="utf-8") as f:
-            lines = f.readlines()
+            text = f.read()
     except Exception:
         return results
-    for idx, line in enumerate(lines, start=1):
-        for pattern_name, pattern in graphics_patterns.items():
-            if pattern.search(line):
-                results.append({
-                    "File": file_path,
-                    "Line": idx,
-                    "Keyword": pattern_name,
-                    "Code Snippet": line.strip()
-                })
+    search = graphics_fused.search
+    idx, counted = 1, 0   # line number at offset `counted`
+    m = search(text)
+    while m:
+        start = text.rfind("\n", 0, m.start()) + 1
+        end = text.find("\n", m.end())
+        if end == -1:
+            end = len(text)
+        idx += text.count("\n", counted, start)
+        counted = start
+        line = text[start:end]
+        m = search(text, end + 1)
+        for pattern_name, pattern_search in _GRAPHICS_SEARCHES:
+            if pattern_search(line):
+                results.append((file_path, idx, pattern_name, line.strip()))
     return results
 
 def run_graphics_analyser(src_dir, log_func, reports_dir):
     all_results = []
-    for root, _, files in os.walk(src_dir):
-        for file in files:
-            if file.endswith(".py"):
-                full_path = os.path.join(root, file)
-                file_results = analyse_file(full_path)
-                all_results.extend(file_results)
+    for full_path in list_py_files(src_dir):
+        all_results.extend(analyse_file(full_path))
     if not all_results:
         log_func("No drawing-related function calls found.")
         return
-    df = pd.DataFrame(all_results)
     report_file = os.path.join(reports_dir, "graphics_analysis_report.csv")
-    df.to_csv(report_file, index=False)
+    write_csv(report_file, ["File", "Line", "Keyword", "Code Snippet"], all_results)
     log_func(f"Graphics Analyser completed. Report generated:\n - {report_file}")
 
 # ---------- Project Summariser Functions ----------
 
+SUMMARY_SKIP_DIRS = frozenset({"__pycache__", "reports", "saves"})
+_CODE_SUFFIXES = tuple(ALLOWED_EXTENSIONS)
+
+# Line boundaries str.splitlines() honours besides "\n".
+_EXTRA_LINE_BREAKS = re.compile("[\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029]")
+
+def _prefix_lines(content, prefix):
+    """
+    prefix + line + "\n" for every line of content (as split by splitlines()).
+    Plain "\n"-separated text takes one str.replace pass without building
+    a list of lines.
+    """
+    if not content:
+        return ""
+    if _EXTRA_LINE_BREAKS.search(content):
+        return prefix + f"\n{prefix}".join(content.splitlines()) + "\n"
+    if content.endswith("\n"):
+        content = content[:-1]
+    return prefix + content.replace("\n", f"\n{prefix}") + "\n"
+
+def iter_code_dirs(root_folder):
+    """
+    os.scandir walk in os.walk's top-down order: yields (dirpath, [(name,
+    path)] of its code files) for every directory, never entering
+    SUMMARY_SKIP_DIRS, and takes names, paths and file/dir types from the
+    DirEntry instead of joins and stat calls.
+    """
+    stack = [root_folder]
+    while stack:
+        dirpath = stack.pop()
+        subdirs, files = [], []
+        try:
+            with os.scandir(dirpath) as it:
+                for entry in it:
+                    if entry.is_dir():
+                        if entry.name not in SUMMARY_SKIP_DIRS and not entry.is_symlink():
+                            subdirs.append(entry.path)
+                    elif entry.name.lower().endswith(_CODE_SUFFIXES):
+                        files.append((entry.name, entry.path))
+        except OSError:
+            continue
+        yield dirpath, files
+        stack.extend(reversed(subdirs))
+
+# Files over SUMMARY_SIZE_LIMIT bytes, with a NUL in their first
+# SUMMARY_SNIFF_BYTES, or whose opening line runs past SUMMARY_MAX_LINE bytes
+# (minified/generated code) get a stub instead of their content.
+SUMMARY_SIZE_LIMIT = 1 << 20
+SUMMARY_SNIFF_BYTES = 512
+SUMMARY_MAX_LINE = 4096
+
+def _skip_reason(size, data):
+    if size > SUMMARY_SIZE_LIMIT:
+        return f"size={size}"
+    if b"\0" in data[:SUMMARY_SNIFF_BYTES]:
+        return "binary"
+    if len(data) > SUMMARY_MAX_LINE and b"\n" not in data[:SUMMARY_MAX_LINE + 1]:
+        return "long lines"
+    return None
+
+def _summarise_file(task):
+    """
+    Process-pool worker for save_folder_structure: task is (file_path, ext,
+    parse). Returns (content, concatenated block as UTF-8 bytes, function
+    details or None when parse is false, skip reason or None).
+    """
+    file_path, ext, parse = task
+    marker = get_comment_marker(ext)
+    file_content, skipped = "", None
+    try:
+        with open(file_path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            data = f.read(SUMMARY_MAX_LINE + 1) if size > SUMMARY_SIZE_LIMIT else f.read()
+        skipped = _skip_reason(size, data)
+        if skipped is None:
+            file_content = data.decode("utf-8")
+            if "\r" in file_content:   # universal newlines, as text mode reads them
+                file_content = file_content.replace("\r\n", "\n").replace("\r", "\n")
+    except Exception:
+        file_content = ""
+    if skipped:
+        block = f"{marker} File: {file_path} (skipped: {skipped})\n\n"
+        return "", block.encode("utf-8"), [] if parse else None, skipped
+    # File content with a comment header, every line prefixed with the marker.
+    # For code files, we assume the content is code.
+    block = f"{marker} File: {file_path}\n{_prefix_lines(file_content, f'{marker} ')}\n\n"
+    functions = extract_function_details(file_content) if parse else None
+    return file_content, block.encode("utf-8"), functions, None
+
 def save_folder_structure(root_folder, output_file, concatenated_output):
     file_structure = {}
     function_definitions = {}
     all_imports = set()
     timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S.%f')
+    # Function details of unchanged files are reused from the previous run.
+    ast_cache_path = os.path.join(os.path.dirname(os.path.abspath(output_file)), ".ast_cache")
+    # One walk lays out the report; reading, prefixing and parsing each file
+    # runs in a process pool, and results come back in walk order.
+    # The listing is kept for the ProjectTree pass instead of walking twice.
+    tree = []
+    tasks, entries = [], []
+    for dirpath, files in iter_code_dirs(root_folder):
+        rel_path = os.path.relpath(dirpath, root_folder)
+        if rel_path == ".": rel_path = ""
+        tree.append((rel_path, files))
+        file_structure[rel_path] = []
+        for file, file_path in files:
+            ext = os.path.splitext(file)[1].lower()
+            entry = {"name": file, "content": "", "timestamp": timestamp}
+            file_structure[rel_path].append(entry)
+            entries.append(entry)
+            tasks.append((file_path, ext, ext == ".py"))
     # Open the concatenated file for writing.
-    with open(concatenated_output, "w", encoding="utf-8") as concat_file:
+    with open(concatenated_output, "wb", buffering=1 << 20) as concat_file, \
+            shelve.open(ast_cache_path) as ast_cache:
+        # Function details of unchanged files come from the cache, not the pool.
+        fingerprints = {}
+        for i, (file_path, ext, parse) in enumerate(tasks):
+            if parse:
+                fingerprint = fingerprints[file_path] = _details_fingerprint(file_path)
+                hit = ast_cache.get(file_path)
+                if fingerprint is not None and hit is not None and hit[0] == fingerprint:
+                    function_definitions[file_path] = hit[1]
+                    tasks[i] = (file_path, ext, False)
         # Write header with current year.
-        concat_file.write(f"© {datetime.now().year} projectemergence. All rights reserved.\n\n")
-        for dirpath, dirnames, filenames in os.walk(root_folder):
-            # Skip __pycache__ and report/saves directories.
-            dirnames[:] = [d for d in dirnames if d not in {"__pycache__", "reports", "saves"}]
-            rel_path = os.path.relpath(dirpath, root_folder)
-            if rel_path == ".": rel_path = ""
-            file_structure[rel_path] = []
-            for file in filenames:
-                ext = os.path.splitext(file)[1].lower()
-                if ext in ALLOWED_EXTENSIONS:
-                    file_path = os.path.join(dirpath, file)
-                    try:
-                        with open(file_path, "r", encoding="utf-8") as f:
-                            file_content = f.read()
-                    except Exception:
-                        file_content = ""
-                    file_structure[rel_path].append({"name": file, "content": file_content, "timestamp": timestamp})
-                    if ext == ".py":
-                        functions = extract_function_details(file_content)
-                        function_definitions[file_path] = functions
-                    # Write file content to concatenated file with appropriate comment header.
-                    marker = get_comment_marker(ext)
-                    concat_file.write(f"{marker} File: {file_path}\n")
-                    for line in file_content.splitlines():
-                        # For code files, we assume the content is code.
-                        concat_file.write(f"{marker} {line}\n")
-                    concat_file.write("\n\n")
-    # Save the main report as JSON.
-    with open(output_file, "w", encoding="utf-8") as outfile:
-        json.dump(file_structure, outfile, indent=4)
+        concat_file.write(f"© {datetime.now().year} projectemergence. All rights reserved.\n\n".encode())
+        with ProcessPoolExecutor() as pool:
+            results = pool.map(_summarise_file, tasks, chunksize=32)
+            for (file_path, _, parse), entry, (content, block, functions, skipped) in zip(tasks, entries, results):
+                entry["content"] = content
+                if skipped:
+                    entry["skipped"] = skipped
+                concat_file.write(block)
+                if parse:
+                    function_definitions[file_path] = functions
+                    if fingerprints[file_path] is not None:
+                        ast_cache[file_path] = (fingerprints[file_path], functions)
+    # Save the main report as JSON (orjson encodes it in C, in one write).
+    if orjson:
+        with open(output_file, "wb") as outfile:
+            outfile.write(orjson.dumps(file_structure, option=orjson.OPT_INDENT_2))
+    else:
+        with open(output_file, "w", encoding="utf-8") as outfile:
+            json.dump(file_structure, outfile, indent=4)
     # Save a supplementary file with directory tree and function details.
     supplementary_output_file = output_file.replace(".txt", "_ProjectTree.txt")
     with open(supplementary_output_file, "w", encoding="utf-8") as sfile:
-        for dirpath, dirnames, files in os.walk(root_folder):
-            dirnames[:] = [d for d in dirnames if d not in {"__pycache__", "reports", "saves"}]
-            rel_path = os.path.relpath(dirpath, root_folder)
-            if rel_path == ".": rel_path = ""
+        for rel_path, files in tree:
             sfile.write(f"Directory: {rel_path}\n")
-            for file in files:
-                ext = os.path.splitext(file)[1].lower()
-                if ext in ALLOWED_EXTENSIONS:
-                    file_path = os.path.join(dirpath, file)
-                    sfile.write(f"  File: {file}\n")
-                    if file_path in function_definitions:
-                        sfile.write("    Functions:\n")
-                        for func_name, args, return_values in function_definitions[file_path]:
-                            args_str = ", ".join(args)
-                            returns_str = ", ".join(return_values)
-                            sfile.write(f"      {func_name}({args_str}) -> {returns_str}\n")
+            for file, file_path in files:
+                sfile.write(f"  File: {file}\n")
+                if file_path in function_definitions:
+                    sfile.write("    Functions:\n")
+                    for func_name, args, return_values in function_definitions[file_path]:
+                        args_str = ", ".join(args)
+                        returns_str = ", ".join(return_values)
+                        sfile.write(f"      {func_name}({args_str}) -> {returns_str}\n")
             sfile.write("\n")
     log_msg = (f"Folder structure saved to {output_file}\n"
                f"Supplementary file saved to {supplementary_output_file}\n"
@@ -446,31 +716,51 @@ class ReportViewer(tk.Toplevel):
             messagebox.showerror("Error", "No report selected.")
             return
         filepath = os.path.join(self.reports_dir, filename)
+        import pandas as pd   # only the viewer needs DataFrames
         try:
             df = pd.read_csv(filepath)
         except Exception as e:
             messagebox.showerror("Error", f"Could not load CSV: {e}")
             return
-        # Clear existing tree.
-        for col in self.tree.get_children():
-            self.tree.delete(col)
+        self._df = df
         self.tree["columns"] = list(df.columns)
         for col in df.columns:
             self.tree.heading(col, text=col, command=lambda _col=col: self.sortby(_col, False))
             self.tree.column(col, width=100)
-        # Insert rows.
-        for index, row in df.iterrows():
-            self.tree.insert("", "end", values=list(row))
-    
-    def sortby(self, col, descending):
-        # Grab all values to sort.
-        data = [(self.tree.set(child, col), child) for child in self.tree.get_children('')]
+        self._render()
+
+    def _render(self):
+        """Replaces the tree rows with self._df, in its current order."""
+        self.tree.delete(*self.tree.get_children())
+        # Plain tuples instead of a Series per row, and no column
+        # layout while the rows go in.
+        insert = self.tree.insert
+        self.tree.configure(displaycolumns=())
         try:
-            data.sort(key=lambda t: float(t[0]) if t[0] not in {"Timeout", "Error"} else float('inf'), reverse=descending)
-        except ValueError:
-            data.sort(reverse=descending)
-        for index, item in enumerate(data):
-            self.tree.move(item[1], '', index)
+            for values in self._df.itertuples(index=False, name=None):
+                insert("", "end", values=values)
+        finally:
+            self.tree.configure(displaycolumns="#all")
+
+    @staticmethod
+    def _sort_key(values):
+        # Numeric columns sort as numbers with "Timeout"/"Error: ..." last;
+        # anything else sorts as text.
+        import pandas as pd
+        numbers = pd.to_numeric(values, errors="coerce")
+        text = values.astype(str)
+        markers = text.eq("Timeout") | text.str.startswith("Error")
+        failed = numbers.isna() & values.notna() & ~markers
+        if failed.any():
+            return values.astype(str)
+        return numbers.fillna(float("inf"))
+
+    def sortby(self, col, descending):
+        # Sort the loaded DataFrame and re-render, rather than reading and
+        # moving each row through Tcl.
+        self._df.sort_values(col, ascending=not descending, inplace=True,
+                             kind="mergesort", key=self._sort_key)
+        self._render()
         # Reverse sort next time.
         self.tree.heading(col, command=lambda: self.sortby(col, not descending))
 
@@ -7,31 +7,46 @@ import multiprocessing
 import signal
 import pygame
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 # --- Cache clearing functionality ---
-def clear_python_cache():
+def _remove_cache_dir(cache_dir):
+    try:
+        shutil.rmtree(cache_dir)
+        logging.debug(f"Deleted cache directory: {cache_dir}")
+    except Exception as e:
+        logging.warning(f"Error deleting cache directory {cache_dir}: {e}")
+
+def _remove_cache_file(file_path):
+    try:
+        os.remove(file_path)
+        logging.debug(f"Deleted cache file: {file_path}")
+    except Exception as e:
+        logging.warning(f"Error deleting cache file {file_path}: {e}")
+
+def clear_python_cache(max_workers=32):
     """
     Recursively remove __pycache__ directories and .pyc files
     from the current working directory.
+    One walk collects the targets; the deletions then run on a thread
+    pool so the unlink syscalls overlap instead of queueing one by one.
     """
     cwd = os.getcwd()
+    cache_dirs, cache_files = [], []
     for root, dirs, files in os.walk(cwd):
+        kept = []
         for d in dirs:
             if d == '__pycache__':
-                cache_dir = os.path.join(root, d)
-                try:
-                    shutil.rmtree(cache_dir)
-                    logging.debug(f"Deleted cache directory: {cache_dir}")
-                except Exception as e:
-                    logging.warning(f"Error deleting cache directory {cache_dir}: {e}")
-        for f in files:
-            if f.endswith('.pyc'):
-                file_path = os.path.join(root, f)
-                try:
-                    os.remove(file_path)
-                    logging.debug(f"Deleted cache file: {file_path}")
-                except Exception as e:
-                    logging.warning(f"Error deleting cache file {file_path}: {e}")
+                cache_dirs.append(os.path.join(root, d))   # removed whole, not descended
+            else:
+                kept.append(d)
+        dirs[:] = kept
+        cache_files.extend(os.path.join(root, f) for f in files if f.endswith('.pyc'))
+    if not cache_dirs and not cache_files:
+        return
+    with ThreadPoolExecutor(max_workers=max_workers) as ex:
+        list(ex.map(_remove_cache_file, cache_files))
+        list(ex.map(_remove_cache_dir, cache_dirs))
 
 def clear_all_caches(is_executable: bool):
     """
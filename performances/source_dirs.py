@@ -0,0 +1,7 @@
+#File:  src/performances/source_dirs.py © 2025 projectemergence. All rights reserved.
+# Folder names shared by the source scanners; kept import-free so any tool can use it.
+
+# Folders never descended into when looking for project sources (hidden
+# folders are skipped as well); extended with --exclude.
+EXCLUDED_DIRS = frozenset({"__pycache__", "node_modules", "venv", "site-packages",
+                           "build", "dist"})
@@ -1,116 +1,264 @@
 #File:  src/performances/summary.py © 2025 projectemergence. All rights reserved.
 #File:  src/performances/summary.py © 2024 projectemergence. All rights reserved.
 import os
+import re
+import sys
 import json
+import pickle
+import hashlib
+import functools
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 import ast
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
+_VERSION_RE = re.compile(r"(?:^|[/\\])(ALLV\d+)(?=[/\\]|$)")
+
+@functools.lru_cache(maxsize=128)
 def get_version_from_path(file_path):
-    parts = file_path.split(os.sep)
-    for part in parts:
-        if part.startswith("ALLV") and part[4:].isdigit():
-            return part
-    return "ALLV_unknown"
+    """The first ALLV<n> folder in file_path, or "ALLV_unknown"."""
+    m = _VERSION_RE.search(file_path)
+    return m.group(1) if m else "ALLV_unknown"
+
+# Source form of return values; ast.unparse is Python 3.9+.
+_format_return = getattr(ast, "unparse", ast.dump)
+
+class _Extractor(ast.NodeVisitor):
+    """
+    Collects (name, args, returns) for every function in one pass over the
+    tree, in source order. A return belongs to its innermost enclosing def.
+    """
+    def __init__(self):
+        self.stack = []
+        self.out = []
+
+    def visit_FunctionDef(self, node):
+        returns = []
+        self.out.append((node.name, [arg.arg for arg in node.args.args], returns))
+        self.stack.append(returns)
+        self.generic_visit(node)
+        self.stack.pop()
+
+    def visit_Return(self, node):
+        if node.value is not None and self.stack:
+            self.stack[-1].append(_format_return(node.value))
 
 def extract_function_details(file_content):
     """Extract function names, arguments, and return statements from a given file content."""
     try:
         tree = ast.parse(file_content)
-        functions = []
-        for node in ast.walk(tree):
-            if isinstance(node, ast.FunctionDef):
-                args = [arg.arg for arg in node.args.args]
-                returns = [n.value for n in ast.walk(node) if isinstance(n, ast.Return) and n.value is not None]
-                return_values = [ast.dump(r) for r in returns]
-                functions.append((node.name, args, return_values))
-        return functions
     except SyntaxError as e:
         #print(f"Syntax error while parsing file content: {e}")
         return []
+    extractor = _Extractor()
+    extractor.visit(tree)
+    return extractor.out
+
+# Function details are cached on disk by a SHA-256 of the source (salted with
+# the interpreter version and DETAILS_VERSION, bumped whenever the extracted
+# details change shape), so unchanged files are not parsed again.
+DETAILS_VERSION = 3
+_CACHE_SALT = f"{sys.version_info[0]}.{sys.version_info[1]}:{DETAILS_VERSION}:".encode()
+_details_memo = {}   # key -> details, for identical files met within one run
+
+def cached_function_details(source, file_content, cache_dir):
+    """extract_function_details(file_content), memoized by a hash of the source bytes."""
+    key = hashlib.sha256(_CACHE_SALT + source).hexdigest()
+    functions = _details_memo.get(key)
+    if functions is not None:
+        return functions
+    cache_file = os.path.join(cache_dir, f"{key}.pkl")
+    try:
+        with open(cache_file, "rb") as f:
+            functions = pickle.load(f)
+    except Exception:
+        functions = extract_function_details(file_content)
+        try:
+            with open(cache_file, "wb") as f:
+                pickle.dump(functions, f, protocol=pickle.HIGHEST_PROTOCOL)
+        except OSError:
+            pass
+    _details_memo[key] = functions
+    return functions
+
+CODE_SUFFIXES = (".py", ".ini", ".json")
+
+# Folders left out of the summary, along with everything below them: any
+# __pycache__, reports or saves folder, matched as a whole path component in
+# any case (which also covers the ALLV<n>/Reports output folders).
+_SKIP_RE = re.compile(r"(?:^|[/\\])(?:__pycache__|reports|saves)(?:[/\\]|$)", re.IGNORECASE)
+
+def iter_tree(root_folder):
+    """
+    Iterative os.scandir walk in os.walk's top-down order. Yields
+    (rel_path, [(name, path)]) with the .py/.ini/.json files of every folder
+    kept; folders matching _SKIP_RE are pruned before being entered.
+    """
+    stack = [(root_folder, "")]
+    while stack:
+        dirpath, rel_path = stack.pop()
+        subdirs, files = [], []
+        try:
+            with os.scandir(dirpath) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        # Every ancestor was already kept, so the folder's own
+                        # name decides.
+                        if not _SKIP_RE.search(entry.name):
+                            sub_rel = os.path.join(rel_path, entry.name) if rel_path else entry.name
+                            subdirs.append((entry.path, sub_rel))
+                    elif entry.name.endswith(CODE_SUFFIXES):
+                        files.append((entry.name, entry.path))
+        except OSError:
+            continue
+        yield rel_path, files
+        stack.extend(reversed(subdirs))
+
+def _dumps(obj):
+    """obj as indented JSON bytes, by orjson when available."""
+    if orjson:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=4).encode("utf-8")
+
+class _ReportWriter:
+    """
+    Streams the main report, {rel_path: [file entry, ...], ...}, one file
+    entry at a time, in the layout _dumps gives the whole mapping; entries
+    are released as soon as they are written.
+    """
+    def __init__(self, f):
+        self.f = f
+        self.indent = b"  " if orjson else b"    "
+        self.dirs = 0
+        self.entries = 0
+
+    def directory(self, rel_path):
+        self._close_directory()
+        self.f.write(b"{\n" if not self.dirs else b",\n")
+        self.f.write(self.indent + _dumps(rel_path) + b": [")
+        self.dirs += 1
+        self.entries = 0
+
+    def entry(self, entry):
+        pad = b"\n" + self.indent * 2
+        self.f.write((b"," if self.entries else b"") + pad + _dumps(entry).replace(b"\n", pad))
+        self.entries += 1
+
+    def _close_directory(self):
+        if self.entries:
+            self.f.write(b"\n" + self.indent + b"]")
+        elif self.dirs:
+            self.f.write(b"]")
+
+    def close(self):
+        self._close_directory()
+        self.f.write(b"\n}" if self.dirs else b"{}")
+
+# Lines kept in the concatenated file, found by one regex scan per file:
+# import lines (group 1; gathered, deduplicated and sorted into one block at
+# the top), and any other line that is neither blank nor a comment.
+KEEP_LINE_RE = re.compile(r"^(?:(import|from).*|[^\S\n]*[^\s#].*)$", re.MULTILINE)
+# Line boundaries str.splitlines() honours besides "\n".
+_EXTRA_LINE_BREAKS = re.compile("[\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029]")
+
+def _read_source(file_path):
+    """
+    (raw bytes, text) of a file, read in one binary call and decoded once;
+    the text has newlines translated as text mode would. (b"", "") if the
+    file cannot be read as UTF-8.
+    """
+    try:
+        with open(file_path, "rb") as f:
+            raw = f.read()
+        text = raw.decode("utf-8")
+    except Exception as e:
+        #print(f"Error reading file {file_path}: {e}")
+        return b"", ""
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return raw, text
+
+def split_code(file_content):
+    """(import lines, other code lines) of file_content; comments and blank lines dropped."""
+    if _EXTRA_LINE_BREAKS.search(file_content):
+        file_content = "\n".join(file_content.splitlines())
+    imports, code = [], []
+    for m in KEEP_LINE_RE.finditer(file_content):
+        (imports if m.group(1) else code).append(m.group())
+    return imports, code
+
+def _parse_one(file_path, cache_dir):
+    """
+    Process-pool worker: (file_path, content, function details, import
+    lines, other code lines) of a .py file.
+    """
+    raw, file_content = _read_source(file_path)
+    functions = cached_function_details(raw, file_content, cache_dir)
+    return (file_path, file_content, functions) + split_code(file_content)
 
 def save_folder_structure(root_folder, output_file, concatenated_output):
-    file_structure = {}
     function_definitions = {}
     all_imports = set()
+    code_blocks = []
+    cache_dir = os.path.join(os.path.dirname(os.path.abspath(output_file)), ".ast_cache")
+    os.makedirs(cache_dir, exist_ok=True)
     timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S.%f')
 
-    with open(concatenated_output, "w", encoding="utf-8") as concat_file:
-        for dirpath, dirnames, filenames in os.walk(root_folder):
-            # Skip __pycache__ directories
-            dirnames[:] = [d for d in dirnames if d != "__pycache__"]
-
-            rel_path = os.path.relpath(dirpath, root_folder)
-
-            # Skip the ALLVx/Reports directory
-            if 'ALLV' in rel_path and 'Reports' in rel_path:
-                continue
-            if 'reports' in rel_path:
-                continue
-            if 'saves' in rel_path:
-                continue
-
-            if rel_path == ".":
-                rel_path = ""
-            file_structure[rel_path] = []
-
-            for file in filenames:
-                if file.endswith(".py") or file.endswith(".ini") or file.endswith(".json"):
-                    file_path = os.path.join(dirpath, file)
-                    try:
-                        with open(file_path, "r", encoding="utf-8") as f:
-                            file_content = f.read()
-                    except Exception as e:
-                        #print(f"Error reading file {file_path}: {e}")
-                        file_content = ""
-                    
-                    # Save file content to the main report
-                    file_structure[rel_path].append({"name": file, "content": file_content, "timestamp": timestamp})
-
-                    # Extract function details for Python files
-                    if file.endswith(".py"):
-                        functions = extract_function_details(file_content)
-                        function_definitions[file_path] = functions
-
-                        # Append Python file content to concatenated file
-                        concat_file.write(f"# File: {file_path}\n")
-                        for line in file_content.splitlines():
-                            if line.startswith("import") or line.startswith("from"):
-                                if line not in all_imports:
-                                    concat_file.write(f"{line}\n")
-                                    all_imports.add(line)
-                            elif line.strip() and not line.strip().startswith("#"):  # Avoid comments and empty lines
-                                concat_file.write(f"{line}\n")
-                        concat_file.write("\n\n")
-
-    # Save the main report file
-    with open(output_file, "w", encoding="utf-8") as outfile:
-        json.dump(file_structure, outfile, indent=4)
-    
+    # Kept for the ProjectTree file, which needs no second walk.
+    tree_entries = list(iter_tree(root_folder))
+    py_paths = [file_path for _, files in tree_entries
+                for file, file_path in files if file.endswith(".py")]
+
+    # .py files are read and parsed in a process pool; results come back in
+    # walk order and are written to the reports as they arrive.
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as pool, \
+            open(output_file, "wb", buffering=1 << 20) as outfile:
+        parsed = pool.map(functools.partial(_parse_one, cache_dir=cache_dir), py_paths, chunksize=32)
+        report = _ReportWriter(outfile)
+        for rel_path, files in tree_entries:
+            report.directory(rel_path)
+
+            for file, file_path in files:
+                if file.endswith(".py"):
+                    _, file_content, functions, imports, code = next(parsed)
+                else:
+                    _, file_content = _read_source(file_path)
+
+                # Save file content to the main report
+                report.entry({"name": file, "content": file_content, "timestamp": timestamp})
+
+                # Function details of Python files
+                if file.endswith(".py"):
+                    function_definitions[file_path] = functions
+
+                    # Python code without comments and empty lines, one
+                    # block per file; imports go in the block at the top.
+                    all_imports.update(imports)
+                    code_blocks.append("\n".join([f"# File: {file_path}"] + code) + "\n\n\n")
+        report.close()
+
+    # Concatenated file: every distinct import once, sorted, then the code.
+    with open(concatenated_output, "w", encoding="utf-8", buffering=1 << 20) as concat_file:
+        if all_imports:
+            concat_file.write("\n".join(sorted(all_imports)) + "\n\n\n")
+        concat_file.writelines(code_blocks)
+
     # Save the supplementary file with directory tree and function details
     supplementary_output_file = output_file.replace(".txt", "_ProjectTree.txt")
     with open(supplementary_output_file, "w", encoding="utf-8") as sfile:
-        for dirpath, dirnames, files in os.walk(root_folder):
-            # Skip __pycache__ directories
-            dirnames[:] = [d for d in dirnames if d != "__pycache__"]
-            
-            rel_path = os.path.relpath(dirpath, root_folder)
-            if 'reports' in rel_path:
-                continue
-            if 'saves' in rel_path:
-                continue
-            if rel_path == ".":
-                rel_path = ""
+        for rel_path, files in tree_entries:
             sfile.write(f"Directory: {rel_path}\n")
-            for file in files:
-                if file.endswith(".py") or file.endswith(".ini") or file.endswith(".json"):
-                    file_path = os.path.join(dirpath, file)
-                    sfile.write(f"  File: {file}\n")
-                    if file_path in function_definitions:
-                        sfile.write("    Functions:\n")
-                        for func_name, args, return_values in function_definitions[file_path]:
-                            args_str = ", ".join(args)
-                            returns_str = ", ".join(return_values)
-                            sfile.write(f"      {func_name}({args_str}) -> {returns_str}\n")
+            for file, file_path in files:
+                sfile.write(f"  File: {file}\n")
+                if file_path in function_definitions:
+                    sfile.write("    Functions:\n")
+                    for func_name, args, return_values in function_definitions[file_path]:
+                        args_str = ", ".join(args)
+                        returns_str = ", ".join(return_values)
+                        sfile.write(f"      {func_name}({args_str}) -> {returns_str}\n")
             sfile.write("\n")
     
     print(f"Folder structure and files saved to {output_file}")
@@ -1,6 +1,7 @@
 #File:  src/thread_manager.py © 2025 projectemergence. All rights reserved.
 #File:  src/thread_manager.py © 2024 projectemergence. All rights reserved.
 import sys
+import atexit
 import threading
 import queue
 import logging
@@ -10,20 +11,45 @@ import linecache
 
 # Removed trace_lines and sys.settrace usage for cleaner execution.
 
+class _Task:
+    """
+    A task handed to the worker pool. Quacks like the Thread objects the manager
+    used to hold: is_alive() until the target has returned, join() waits for that.
+    """
+    __slots__ = ("name", "target", "args", "kwargs", "daemon", "done")
+
+    def __init__(self, name, target, args, kwargs, daemon=False):
+        self.name = name
+        self.target = target
+        self.args = args
+        self.kwargs = kwargs
+        self.daemon = daemon
+        self.done = threading.Event()
+
+    def is_alive(self):
+        return not self.done.is_set()
+
+    def join(self, timeout=None):
+        self.done.wait(timeout)
+
 class ThreadManager:
     """
     A generalized Thread Manager to supervise threaded tasks in your application.
     It can cap the maximum number of concurrent threads based on CPU core/thread count
-    or run in single-thread mode. Tasks can be started immediately or queued if the limit
-    is reached. Provides methods to start, stop, list, check, wait, clear, and log threads.
+    or run in single-thread mode. Tasks run on a pool of long-lived worker threads
+    (or worker processes in mp_mode) and wait in a queue while every worker is busy.
+    Provides methods to start, stop, list, check, wait, clear, and log threads.
     """
 
-    def __init__(self, single_thread=False, max_threads=None, logger=None):
+    def __init__(self, single_thread=False, max_threads=None, logger=None, mp_mode=False):
         """
         :param single_thread: If True, forces only one thread to run at a time.
         :param max_threads: Maximum number of threads allowed at once. 
                             If None, this will default to the CPU count.
         :param logger: Provide a custom logger, else uses default logging.
+        :param mp_mode: If True, tasks run in a multiprocessing.Pool of max_threads
+                        processes, so CPU-bound targets are not serialized by the GIL.
+                        Targets and their arguments must then be picklable.
         """
         self.logger = logger or logging.getLogger(__name__)
         self.logger.setLevel(logging.DEBUG)
@@ -35,118 +61,113 @@ class ThreadManager:
             # If max_threads is not given, fall back to the system CPU count
             self.max_threads = max_threads if max_threads else multiprocessing.cpu_count()
 
-        self.threads = {}         # thread_name -> threading.Thread object
-        self.thread_queue = queue.Queue()  # queue of tasks (thread_name, target, args, kwargs, daemon)
-        self.thread_lock = threading.Lock()  # lock to protect shared resources
-
-        # A simple sentinel to notify we have an available slot if the manager is not saturated
-        self.available_slot = threading.Event()
-        self.available_slot.set()  # initially, we assume we have a free slot to start at least one thread
+        # thread_name -> _Task, from start_thread until the task finishes. Only
+        # written under thread_lock; readers take a snapshot (a single dict
+        # operation, atomic under the GIL) instead of the lock.
+        self.threads = {}
+        self.thread_queue = queue.Queue()  # _Task objects waiting for a worker
+        self.thread_lock = threading.Lock()  # serializes writers to threads
+
+        # max_threads workers, started once and reused for every task. In
+        # mp_mode the process pool keeps its own task queue.
+        self.pool = multiprocessing.Pool(self.max_threads) if mp_mode else None
+        self.workers = [] if mp_mode else [
+            threading.Thread(target=self._worker_loop, name=f"ThreadManager-worker-{i}", daemon=True)
+            for i in range(self.max_threads)
+        ]
+        for worker in self.workers:
+            worker.start()
+        # the workers are daemons: hold interpreter exit for non-daemon tasks
+        atexit.register(self._wait_for_non_daemon)
+
+    def _wait_for_non_daemon(self):
+        """
+        atexit hook: block until every task started with daemon=False has
+        finished, as a non-daemon Thread would have kept the process alive.
+        """
+        for task in list(self.threads.values()):
+            if not task.daemon:
+                task.join()
+
+    def _worker_loop(self):
+        while True:
+            task = self.thread_queue.get()
+            if task is None:   # shutdown()
+                return
+            self._thread_worker(task)
 
-    def _thread_worker(self, thread_name, target, args, kwargs):
+    def _thread_worker(self, task):
         # Removed sys.settrace(None) call since tracing is disabled.
         try:
-            self.logger.info(f"Thread '{thread_name}' started.")
-            target(*args, **kwargs)
+            self.logger.info(f"Thread '{task.name}' started.")
+            task.target(*task.args, **task.kwargs)
         except Exception as e:
-            self.logger.exception(f"Exception in thread '{thread_name}': {e}")
+            self.logger.exception(f"Exception in thread '{task.name}': {e}")
         finally:
-            self._cleanup_thread(thread_name)
-
-    def _cleanup_thread(self, thread_name):
-        """
-        Internal method to remove the thread from the dictionary upon completion
-        and then attempt to process any waiting tasks from the queue.
-        """
-        with self.thread_lock:
-            if thread_name in self.threads:
-                self.logger.info(f"Thread '{thread_name}' is completing cleanup.")
-                del self.threads[thread_name]
-
-            # Process the next task from the queue if any are waiting
-            if not self.thread_queue.empty():
-                next_thread = self.thread_queue.get_nowait()
-                self._start_thread_internal(*next_thread)
-            else:
-                # If the queue is empty, set the available_slot to True
-                self.available_slot.set()
+            self._cleanup_thread(task)
 
-    def _can_start_thread(self):
+    def _cleanup_thread(self, task):
         """
-        Check if we are below the max_threads limit.
+        Internal method to remove the task from the dictionary upon completion
+        and wake anyone waiting for it.
         """
         with self.thread_lock:
-            return len(self.threads) < self.max_threads
-
-    def _start_thread_internal(self, thread_name, target, args, kwargs, daemon):
-        """
-        Internal method that actually starts the thread object.
-        Assumes we have capacity or it will be queued again.
-        """
-        with self.thread_lock:
-            if thread_name in self.threads:
-                self.logger.warning(f"Thread '{thread_name}' already exists and is alive.")
-                return
-
-            # Create the actual thread
-            thread = threading.Thread(
-                target=self._thread_worker,
-                args=(thread_name, target, args, kwargs),
-                daemon=daemon
-            )
-            self.threads[thread_name] = thread
-            thread.start()
-            self.logger.debug(f"Started thread '{thread_name}' internally.")
-
-            # If we've reached capacity, clear available_slot
-            if len(self.threads) >= self.max_threads:
-                self.available_slot.clear()
+            if self.threads.get(task.name) is task:
+                self.logger.info(f"Thread '{task.name}' is completing cleanup.")
+                del self.threads[task.name]
+        task.done.set()
 
     def start_thread(self, thread_name, target, *args, daemon=False, **kwargs):
         """
         Public method to start a new thread.
-        If maximum threads are running, it will queue the thread until a slot is available.
+        The task runs on the next free worker; if all max_threads workers are busy,
+        it waits in the queue until one is available. Workers are daemon threads;
+        tasks started with daemon=False still hold interpreter exit until they
+        finish, daemon=True tasks are abandoned at exit.
         """
         with self.thread_lock:
-            # If already running, skip
+            # If already running (or queued), skip
             if thread_name in self.threads:
                 self.logger.warning(f"Thread '{thread_name}' is already running.")
                 return
-
-            # If there's room to start a new thread
-            if self._can_start_thread():
-                self._start_thread_internal(thread_name, target, args, kwargs, daemon)
-            else:
-                # Otherwise, queue it
-                self.thread_queue.put((thread_name, target, args, kwargs, daemon))
-                self.logger.info(f"Queued thread '{thread_name}' (max capacity reached).")
+            task = self.threads[thread_name] = _Task(thread_name, target, args, kwargs, daemon)
+        if self.pool is not None:
+            # The callbacks run on the pool's result thread in this process.
+            def _failed(e):
+                self.logger.error(f"Exception in process task '{thread_name}': {e!r}")
+                self._cleanup_thread(task)
+            self.pool.apply_async(target, args, kwargs,
+                                  callback=lambda _: self._cleanup_thread(task),
+                                  error_callback=_failed)
+        else:
+            self.thread_queue.put(task)
+        self.logger.debug(f"Queued thread '{thread_name}' for the worker pool.")
 
     def stop_thread(self, thread_name, timeout=2):
         """
         Attempt to stop a thread by joining it (voluntary finish).
         This method depends on whether the target function can exit gracefully.
         """
-        with self.thread_lock:
-            if thread_name in self.threads:
-                thread = self.threads[thread_name]
-                if thread.is_alive():
-                    self.logger.info(f"Joining thread '{thread_name}' with timeout={timeout}.")
-                    thread.join(timeout=timeout)
-                # After join, if it's still alive, there's no forced kill in pure Python threads
-                if thread.is_alive():
-                    self.logger.warning(f"Thread '{thread_name}' is still running after join.")
-                else:
-                    self.logger.info(f"Thread '{thread_name}' has stopped.")
-                if thread_name in self.threads:
+        # Joined without the lock, so the thread's own cleanup can run meanwhile.
+        thread = self.threads.get(thread_name)
+        if thread is not None:
+            if thread.is_alive():
+                self.logger.info(f"Joining thread '{thread_name}' with timeout={timeout}.")
+                thread.join(timeout=timeout)
+            # After join, if it's still alive, there's no forced kill in pure Python threads
+            if thread.is_alive():
+                self.logger.warning(f"Thread '{thread_name}' is still running after join.")
+            else:
+                self.logger.info(f"Thread '{thread_name}' has stopped.")
+            with self.thread_lock:
+                if self.threads.get(thread_name) is thread:
                     del self.threads[thread_name]
 
     def wait_for_thread(self, thread_name):
         """
         Block until the specified thread is finished.
         """
-        thread = None
-        with self.thread_lock:
-            thread = self.threads.get(thread_name, None)
+        thread = self.threads.get(thread_name)
         if thread is not None:
             thread.join()
             self.logger.info(f"Thread '{thread_name}' has finished waiting.")
@@ -155,48 +176,29 @@ class ThreadManager:
         """
         Check if a thread is alive.
         """
-        with self.thread_lock:
-            thread = self.threads.get(thread_name)
-            return thread.is_alive() if thread else False
+        thread = self.threads.get(thread_name)
+        return thread.is_alive() if thread else False
 
     def list_threads(self):
         """
         List all thread names currently in the manager.
         """
-        with self.thread_lock:
-            return list(self.threads.keys())
+        return list(self.threads)
 
     def list_thread_status(self):
         """
         Return a dictionary of thread_name -> bool (is_alive).
         """
-        status = {}
-        with self.thread_lock:
-            for name, th in self.threads.items():
-                status[name] = th.is_alive()
-        return status
+        return {name: th.is_alive() for name, th in self.threads.copy().items()}
 
     def clear_all_threads(self):
         """
         Join and remove all threads from the manager.
         """
-        with self.thread_lock:
-            thread_names = list(self.threads.keys())
-        for name in thread_names:
+        for name in list(self.threads):
             self.stop_thread(name)
         self.logger.info("Cleared all threads from the manager.")
 
-    def process_queue(self):
-        """
-        Attempt to process queued threads (if there's capacity).
-        You can call this periodically or let the manager do it automatically upon thread completion.
-        """
-        # Keep pulling from the queue while we have capacity
-        while not self.thread_queue.empty() and self._can_start_thread():
-            with self.thread_lock:
-                thread_info = self.thread_queue.get_nowait()
-            self._start_thread_internal(*thread_info)
-
     def log_threads(self):
         """
         Helper to log the current threads and their statuses.
@@ -214,6 +216,18 @@ class ThreadManager:
         for name in names:
             self.wait_for_thread(name)
 
+    def shutdown(self):
+        """
+        Let queued tasks finish, then stop the workers (or close the process pool).
+        """
+        if self.pool is not None:
+            self.pool.close()
+            self.pool.join()
+        for _ in self.workers:
+            self.thread_queue.put(None)
+        for worker in self.workers:
+            worker.join()
+
     @staticmethod
     def get_cpu_count():
         """
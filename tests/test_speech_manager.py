@@ -0,0 +1,62 @@
+"""SpeechManager threading checks, run against stubbed pyo and pyttsx3."""
+import os
+import sys
+import threading
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+class _Engine:
+    """pyttsx3 engine stand-in whose runAndWait can be held open."""
+
+    def __init__(self):
+        self.entered = threading.Event()
+        self.release = threading.Event()
+        self.release.set()
+
+    def getProperty(self, name):
+        return []
+
+    def setProperty(self, name, value):
+        pass
+
+    def save_to_file(self, text, filename):
+        pass
+
+    def runAndWait(self):
+        self.entered.set()
+        self.release.wait(5)
+
+
+class SpeechManagerShutdownTest(unittest.TestCase):
+    def setUp(self):
+        self.engine = _Engine()
+        pyttsx3 = mock.MagicMock()
+        pyttsx3.init.return_value = self.engine
+        patcher = mock.patch.dict(sys.modules, {"pyo": mock.MagicMock(), "pyttsx3": pyttsx3})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        sys.modules.pop("core.audio.speech.speech_manager", None)
+        from core.audio.speech.speech_manager import SpeechManager
+        self.manager = SpeechManager(server=mock.MagicMock(), synth_processes=0)
+
+    def test_sentinel_behind_a_burst_stops_the_tts_thread(self):
+        manager = self.manager
+        # hold the first utterance in synthesis so the rest queue up as one burst
+        self.engine.release.clear()
+        manager.speak("first words here")
+        self.assertTrue(self.engine.entered.wait(5))
+        for text in ("second words here", "third words here", "fourth words here"):
+            manager.speak(text)
+        manager.speech_queue.put(None)
+        self.engine.release.set()
+
+        manager.tts_thread.join(timeout=5)
+        self.assertFalse(manager.tts_thread.is_alive())
+        manager.shutdown()
+
+
+if __name__ == "__main__":
+    unittest.main()